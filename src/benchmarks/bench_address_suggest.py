@@ -0,0 +1,62 @@
+import argparse
+import random
+import time
+import numpy as np
+from fuzzywuzzy import process
+from benchmarks.synthetic_data import make_addresses
+from carpark.address_index import AddressIndex
+
+def make_queries(addresses, n_queries: int, seed: int = 1):
+    """Partial, lowercased and misspelt fragments of real addresses, like a user would type."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n_queries):
+        words = rng.choice(addresses).lower().split()
+        start = rng.randint(0, max(0, len(words) - 3))
+        query = " ".join(words[start:start + rng.randint(2, 4)])
+        if len(query) > 4 and rng.random() < 0.5:
+            i = rng.randrange(len(query) - 1)
+            query = query[:i] + query[i + 1] + query[i] + query[i + 2:]
+        queries.append(query)
+    return queries
+
+def percentiles(latencies):
+    return np.percentile(np.array(latencies) * 1000, [50, 99])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark top-5 address suggestions: fuzzywuzzy full scan vs AddressIndex.")
+    parser.add_argument("--addresses", type=int, default=100_000, help="number of synthetic addresses")
+    parser.add_argument("--queries", type=int, default=200, help="number of single queries to time")
+    parser.add_argument("--legacy-queries", type=int, default=3, help="queries timed through the fuzzywuzzy full scan")
+    parser.add_argument("--workers", type=int, default=-1, help="cpdist workers for the batch run, -1 for all cores")
+    args = parser.parse_args()
+
+    addresses = make_addresses(args.addresses)
+    queries = make_queries(addresses, args.queries)
+
+    start = time.perf_counter()
+    address_index = AddressIndex(addresses, workers=args.workers)
+    build_elapsed = time.perf_counter() - start
+
+    legacy = []
+    for query in queries[:args.legacy_queries]:
+        start = time.perf_counter()
+        process.extract(query, addresses, limit=5)
+        legacy.append(time.perf_counter() - start)
+
+    indexed = []
+    for query in queries:
+        start = time.perf_counter()
+        address_index.suggest(query, limit=5)
+        indexed.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    address_index.suggest_many(queries, limit=5)
+    batch_elapsed = time.perf_counter() - start
+
+    print(f"{len(address_index):,} addresses, index build {build_elapsed:.2f} s")
+    p50, p99 = percentiles(legacy)
+    print(f"before (fuzzywuzzy scan)   : p50 {p50:9.1f} ms  p99 {p99:9.1f} ms  ({len(legacy)} queries)")
+    p50, p99 = percentiles(indexed)
+    print(f"after (AddressIndex)       : p50 {p50:9.1f} ms  p99 {p99:9.1f} ms  ({len(indexed)} queries)")
+    print(f"after (batch, workers={args.workers:>2}) : {batch_elapsed / len(queries) * 1000:9.2f} ms/query")
@@ -0,0 +1,67 @@
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic_data import make_carparks_merged_df
+from carpark.availability_history import AvailabilityHistoryStore
+
+def simulate_month(history_store, carparks_data_merged_df, days: int, change_rate: float, seed: int = 0):
+    """Records one snapshot per minute, in which each (carpark, lot type) changes with probability change_rate."""
+    rng = np.random.default_rng(seed)
+    snapshot_df = carparks_data_merged_df[['carpark_number', 'lot_type', 'update_datetime', 'lots_available', 'total_lots']].copy()
+    total_lots = pd.to_numeric(snapshot_df['total_lots']).to_numpy()
+    lots_available = pd.to_numeric(snapshot_df['lots_available']).to_numpy()
+    start = pd.Timestamp("2024-02-01")
+    for minute in range(days * 24 * 60):
+        changed = rng.random(len(snapshot_df)) < change_rate
+        lots_available = np.where(changed, np.clip(lots_available + rng.integers(-5, 6, len(snapshot_df)), 0, total_lots), lots_available)
+        snapshot_df['lots_available'] = lots_available
+        snapshot_df['update_datetime'] = start + pd.Timedelta(minutes=minute)
+        history_store.record_snapshot(snapshot_df)
+    return days * 24 * 60 * len(snapshot_df)
+
+def p50_ms(func, carpark_numbers):
+    timings = []
+    for carpark_number in carpark_numbers:
+        start = time.perf_counter()
+        func(carpark_number)
+        timings.append(time.perf_counter() - start)
+    return np.median(timings) * 1000
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Storage growth and query latency of the availability history over a simulated month of per-minute snapshots.")
+    parser.add_argument("--carparks", type=int, default=200, help="number of synthetic carparks")
+    parser.add_argument("--days", type=int, default=30, help="days of per-minute snapshots")
+    parser.add_argument("--change-rate", type=float, default=0.2, help="share of lot-type rows that change per minute")
+    parser.add_argument("--queries", type=int, default=20, help="carparks queried per query type")
+    args = parser.parse_args()
+
+    carparks_data_merged_df = make_carparks_merged_df(args.carparks)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "history.sqlite")
+        history_store = AvailabilityHistoryStore(db_path)
+        start = time.perf_counter()
+        snapshot_rows = simulate_month(history_store, carparks_data_merged_df, args.days, args.change_rate)
+        ingest_elapsed = time.perf_counter() - start
+        stored_rows = history_store.row_count()
+        db_mb = os.path.getsize(db_path) / 1e6
+
+        carpark_numbers = carparks_data_merged_df['carpark_number'].drop_duplicates().sample(args.queries, random_state=1).tolist()
+        month_start, month_end = pd.Timestamp("2024-02-01"), pd.Timestamp("2024-02-01") + pd.Timedelta(days=args.days)
+        day_start = month_start + pd.Timedelta(days=args.days // 2)
+        latencies = {
+            "occupancy, 1 day window": p50_ms(lambda n: history_store.occupancy(n, day_start, day_start + pd.Timedelta(days=1)), carpark_numbers),
+            "hourly aggregate, full month": p50_ms(lambda n: history_store.aggregate(n, month_start, month_end, 'h'), carpark_numbers),
+            "daily aggregate, full month": p50_ms(lambda n: history_store.aggregate(n, month_start, month_end, 'D'), carpark_numbers),
+            "occupancy by hour of day, month": p50_ms(lambda n: history_store.occupancy_by_hour_of_day(n, month_start, month_end), carpark_numbers),
+        }
+        history_store.close()
+
+    print(f"{len(carparks_data_merged_df):,} lot-type rows x {args.days * 24 * 60:,} per-minute snapshots, change rate {args.change_rate:.0%}")
+    print(f"ingest: {ingest_elapsed:.1f} s ({ingest_elapsed / (args.days * 24 * 60) * 1000:.2f} ms/snapshot)")
+    print(f"rows: {snapshot_rows:,} in snapshots -> {stored_rows:,} stored ({stored_rows / snapshot_rows:.1%})")
+    print(f"storage: {db_mb:.1f} MB ({db_mb / args.days:.2f} MB/day, {db_mb * 1e6 / stored_rows:.0f} bytes/row)")
+    for name, latency in latencies.items():
+        print(f"p50 {name:34s}: {latency:8.2f} ms")
@@ -0,0 +1,36 @@
+import argparse
+import time
+import pandas as pd
+from benchmarks.synthetic_data import make_carpark_static_df, make_carpark_availability_payload
+from carpark.get_carparks_data import extract_carpark_info, flatten_carpark_data
+from utils.load_data_to_df import load_json_to_df
+
+def run_legacy(carpark_data) -> pd.DataFrame:
+    #explode + per-row pd.Series path previously used in load_carpark_availability_df
+    carpark_data_df = load_json_to_df(carpark_data).explode('carpark_info')
+    carpark_data_df[['total_lots', 'lot_type', 'lots_available']] = carpark_data_df['carpark_info'].apply(lambda carpark_info: pd.Series(extract_carpark_info(carpark_info)))
+    return carpark_data_df
+
+def best_of(func, carpark_data, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(carpark_data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark flattening of the carpark availability payload: per-row apply(pd.Series) vs columnar.")
+    parser.add_argument("--carparks", type=int, default=2_200, help="number of synthetic carparks in the payload")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per path, the best is reported")
+    args = parser.parse_args()
+
+    carpark_data = make_carpark_availability_payload(make_carpark_static_df(args.carparks))["items"][0]["carpark_data"]
+    n_rows = len(flatten_carpark_data(carpark_data))
+    legacy_elapsed = best_of(run_legacy, carpark_data, args.repeats)
+    columnar_elapsed = best_of(flatten_carpark_data, carpark_data, args.repeats)
+
+    print(f"{args.carparks:,} carparks, {n_rows:,} lot-type rows, best of {args.repeats}")
+    print(f"before (apply pd.Series): {legacy_elapsed * 1000:9.1f} ms")
+    print(f"after (columnar)        : {columnar_elapsed * 1000:9.1f} ms")
+    print(f"speedup: {legacy_elapsed / columnar_elapsed:.1f}x")
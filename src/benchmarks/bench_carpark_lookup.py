@@ -0,0 +1,40 @@
+import argparse
+import random
+import time
+from benchmarks.synthetic_data import make_carparks_merged_df
+from carpark.carpark_index import build_carpark_index
+from carpark.result_cache import CarparkResultCache
+from carpark.search_carparks_data import search_carparks_data_from_cp_num
+
+def time_lookups(carparks_data_merged_df, carpark_numbers, carpark_index=None, result_cache=None) -> float:
+    start = time.perf_counter()
+    for carpark_number in carpark_numbers:
+        search_carparks_data_from_cp_num(carparks_data_merged_df, carpark_number, carpark_index, result_cache, 1)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark carpark number lookups: DataFrame scan vs prebuilt index.")
+    parser.add_argument("--carparks", type=int, default=2_200, help="number of synthetic carparks")
+    parser.add_argument("--lookups", type=int, default=100_000, help="number of random lookups")
+    args = parser.parse_args()
+
+    carparks_data_merged_df = make_carparks_merged_df(args.carparks)
+    rng = random.Random(1)
+    all_numbers = carparks_data_merged_df["carpark_number"].unique().tolist()
+    carpark_numbers = [rng.choice(all_numbers) for _ in range(args.lookups)]
+
+    start = time.perf_counter()
+    carpark_index = build_carpark_index(carparks_data_merged_df)
+    build_elapsed = time.perf_counter() - start
+
+    scan_elapsed = time_lookups(carparks_data_merged_df, carpark_numbers)
+    index_elapsed = time_lookups(carparks_data_merged_df, carpark_numbers, carpark_index)
+    result_cache = CarparkResultCache()
+    cached_elapsed = time_lookups(carparks_data_merged_df, carpark_numbers, carpark_index, result_cache)
+
+    print(f"{len(carparks_data_merged_df):,} rows, {args.lookups:,} random lookups")
+    print(f"index build        : {build_elapsed * 1000:10.1f} ms")
+    print(f"before (scan)      : {scan_elapsed:10.2f} s  ({scan_elapsed / args.lookups * 1e6:8.1f} us/lookup)")
+    print(f"after (index)      : {index_elapsed:10.2f} s  ({index_elapsed / args.lookups * 1e6:8.1f} us/lookup)")
+    print(f"after (index+cache): {cached_elapsed:10.2f} s  ({cached_elapsed / args.lookups * 1e6:8.1f} us/lookup, hit rate {result_cache.hit_rate():.1%})")
+    print(f"speedup: {scan_elapsed / index_elapsed:.1f}x (index), {index_elapsed / cached_elapsed:.1f}x more with the result cache")
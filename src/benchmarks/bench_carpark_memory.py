@@ -0,0 +1,27 @@
+import argparse
+import time
+import pandas as pd
+from benchmarks.synthetic_data import make_carparks_merged_df
+from carpark.get_carparks_data import CARPARK_SCHEMA
+from utils.apply_schema import apply_schema
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-column memory of the merged carpark table before and after CARPARK_SCHEMA typing.")
+    parser.add_argument("--carparks", type=int, default=2_200, help="number of synthetic carparks")
+    args = parser.parse_args()
+
+    untyped_df = make_carparks_merged_df(args.carparks).drop(columns=["carpark_info"], errors="ignore")
+    start = time.perf_counter()
+    typed_df = apply_schema(untyped_df, CARPARK_SCHEMA)
+    elapsed = time.perf_counter() - start
+
+    report = pd.DataFrame({
+        "dtype_before": untyped_df.dtypes.astype(str),
+        "dtype_after": typed_df.dtypes.astype(str),
+        "kb_before": untyped_df.memory_usage(deep=True, index=False) / 1e3,
+        "kb_after": typed_df.memory_usage(deep=True, index=False) / 1e3,
+    })
+    print(f"{len(untyped_df):,} rows, typing took {elapsed * 1000:.1f} ms")
+    print(report.round(1).to_string())
+    before, after = report["kb_before"].sum(), report["kb_after"].sum()
+    print(f"total: {before:,.1f} KB -> {after:,.1f} KB ({before / after:.1f}x smaller)")
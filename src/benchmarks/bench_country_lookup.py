@@ -0,0 +1,44 @@
+import argparse
+import tempfile
+import time
+from benchmarks.synthetic_data import make_zomato_feed
+from restaurant.restaurant_details import zomato_api_response_to_df
+from utils.dataset_cache import load_file_to_df_cached
+from utils.load_data_to_df import load_file_to_df
+from utils.merge_data import merge_data, lookup_join
+from config import DATA_FOLDER_DIR, COUNTRY_CODE_FILENAME
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the country code table: xlsx vs cached parquet load, merge vs lookup join.")
+    parser.add_argument("--restaurants", type=int, default=100_000, help="number of synthetic restaurants to join")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement, the best is reported")
+    args = parser.parse_args()
+
+    country_code_path = f"{DATA_FOLDER_DIR}/{COUNTRY_CODE_FILENAME}"
+    restaurants_df = zomato_api_response_to_df(make_zomato_feed(args.restaurants))
+
+    xlsx_elapsed = best_of(args.repeat, lambda: load_file_to_df(country_code_path))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        countries_df = load_file_to_df_cached(country_code_path, cache_dir, "country_codes")
+        cold_elapsed = time.perf_counter() - start
+        warm_elapsed = best_of(args.repeat, lambda: load_file_to_df_cached(country_code_path, cache_dir, "country_codes"))
+
+    merge_elapsed = best_of(args.repeat, lambda: merge_data(restaurants_df, countries_df, "location.country_id", "Country Code", "inner"))
+    lookup_elapsed = best_of(args.repeat, lambda: lookup_join(restaurants_df, countries_df, "location.country_id", "Country Code"))
+
+    print(f"country table ({len(countries_df)} rows)")
+    print(f"  read_excel           : {xlsx_elapsed * 1000:8.1f} ms")
+    print(f"  cached, first load   : {cold_elapsed * 1000:8.1f} ms (parse + write parquet)")
+    print(f"  cached, warm load    : {warm_elapsed * 1000:8.1f} ms")
+    print(f"join onto {len(restaurants_df):,} restaurants")
+    print(f"  merge_data + set logs: {merge_elapsed * 1000:8.1f} ms")
+    print(f"  lookup_join          : {lookup_elapsed * 1000:8.1f} ms")
@@ -0,0 +1,30 @@
+import argparse
+import tempfile
+import time
+from benchmarks.synthetic_data import make_zomato_feed
+from restaurant.restaurant_details import zomato_api_response_to_df
+from restaurant.restaurant_analysis import compute_rating_text_thresholds, render_rating_report
+from config import RATING_TEXT_LIST, MIN_MAX_RATING
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rating threshold computation alone vs with the plotted report.")
+    parser.add_argument("--restaurants", type=int, default=20_000, help="number of synthetic restaurants")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs of the computation")
+    args = parser.parse_args()
+
+    restaurants_df = zomato_api_response_to_df(make_zomato_feed(args.restaurants)).explode('zomato_events')
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        rating_bins, rating_text_stats = compute_rating_text_thresholds(restaurants_df, RATING_TEXT_LIST, MIN_MAX_RATING)
+    compute_elapsed = (time.perf_counter() - start) / args.repeat
+
+    with tempfile.TemporaryDirectory() as report_dir:
+        start = time.perf_counter()
+        render_rating_report(restaurants_df, RATING_TEXT_LIST, report_dir, rating_text_stats)
+        report_elapsed = time.perf_counter() - start
+
+    print(f"{len(restaurants_df):,} rows")
+    print(f"thresholds only    : {compute_elapsed * 1000:10.1f} ms")
+    print(f"report (3 png)     : {report_elapsed * 1000:10.1f} ms (includes importing matplotlib/seaborn)")
+    print(rating_bins)
@@ -0,0 +1,50 @@
+import argparse
+import tempfile
+import time
+from benchmarks.synthetic_data import make_zomato_feed
+from config import RESTAURANTS_EVENT_MAP
+from restaurant.restaurant_details import zomato_api_response_to_df
+from restaurant.restaurant_events import (extract_events_columns, extract_photos, extract_photos_url,
+                                          extract_restaurant_events_by_months, month_bounds, month_range)
+from utils.extract_rename_save_csv import extract_rename_save_csv
+
+def legacy_extract_restaurant_events_by_mm_yyyy(mm_yyyy, expanded_zomato_restaurants_main_df, DATA_FOLDER_DIR, RESTAURANTS_EVENT_MAP, RESTAURANT_EVENTS_FILENAME):
+    #one full pass per month: copy the frame, re-extract every event and rescan every row
+    expanded_zomato_restaurants_df = expanded_zomato_restaurants_main_df.copy()
+    events_df = extract_events_columns(expanded_zomato_restaurants_df['zomato_events'])
+    for col in events_df.columns:
+        expanded_zomato_restaurants_df[col] = events_df[col].to_numpy()
+    start_of_month, start_of_next_month = month_bounds(mm_yyyy)
+    filtered_df = expanded_zomato_restaurants_df[
+        ((expanded_zomato_restaurants_df['start_date'] >= start_of_month) & (expanded_zomato_restaurants_df['start_date'] < start_of_next_month)) |
+        ((expanded_zomato_restaurants_df['end_date'] >= start_of_month) & (expanded_zomato_restaurants_df['end_date'] < start_of_next_month))
+    ].copy()
+    filtered_df['photos'] = filtered_df['zomato_events'].apply(extract_photos)
+    filtered_photos_expanded_df = filtered_df.explode('photos')
+    filtered_photos_expanded_df['photos'] = filtered_photos_expanded_df['photos'].apply(extract_photos_url)
+    extract_rename_save_csv(filtered_photos_expanded_df, DATA_FOLDER_DIR, RESTAURANT_EVENTS_FILENAME, RESTAURANTS_EVENT_MAP)
+    return filtered_df
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark monthly event extraction: one pass per month vs single pass.")
+    parser.add_argument("--restaurants", type=int, default=20_000, help="number of synthetic restaurants")
+    parser.add_argument("--max-events", type=int, default=5, help="maximum events per restaurant")
+    args = parser.parse_args()
+
+    expanded_df = zomato_api_response_to_df(make_zomato_feed(args.restaurants, max_events=args.max_events)).explode('zomato_events')
+    print(f"{len(expanded_df):,} exploded event rows")
+
+    for n_months in [12, 120]:
+        months = month_range("01_2018", "12_2018") if n_months == 12 else month_range("01_2012", "12_2021")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            per_month_elapsed = timed(lambda: [legacy_extract_restaurant_events_by_mm_yyyy(
+                month, expanded_df, tmp_dir, RESTAURANTS_EVENT_MAP, f"legacy_{month}.csv") for month in months])
+            single_pass_elapsed = timed(lambda: extract_restaurant_events_by_months(
+                months, expanded_df, tmp_dir, RESTAURANTS_EVENT_MAP, "events_{mm_yyyy}.csv"))
+        print(f"{n_months:>4} months: per-month passes {per_month_elapsed:7.2f}s, single pass {single_pass_elapsed:7.2f}s "
+              f"({per_month_elapsed / single_pass_elapsed:.1f}x)")
@@ -0,0 +1,32 @@
+import argparse
+import time
+import pandas as pd
+from benchmarks.synthetic_data import make_synthetic_events
+from restaurant.restaurant_events import extract_dates_title_eventId, extract_events_columns
+
+def run_legacy(zomato_events: pd.Series) -> pd.DataFrame:
+    #per-row pd.Series path previously used in extract_restaurant_events_by_mm_yyyy
+    return zomato_events.apply(lambda event: pd.Series(extract_dates_title_eventId(event)))
+
+def time_rows_per_sec(func, zomato_events: pd.Series) -> float:
+    start = time.perf_counter()
+    func(zomato_events)
+    elapsed = time.perf_counter() - start
+    return len(zomato_events) / elapsed, elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark event extraction: per-row apply vs columnar path.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="number of synthetic events")
+    parser.add_argument("--legacy-rows", type=int, default=20_000,
+                        help="rows timed with the per-row path (it is slow, rows/sec is comparable)")
+    args = parser.parse_args()
+
+    zomato_events = make_synthetic_events(args.rows)
+    legacy_events = zomato_events.iloc[:args.legacy_rows]
+
+    legacy_rate, legacy_elapsed = time_rows_per_sec(run_legacy, legacy_events)
+    columnar_rate, columnar_elapsed = time_rows_per_sec(extract_events_columns, zomato_events)
+
+    print(f"legacy apply(pd.Series): {len(legacy_events):>9,} rows in {legacy_elapsed:8.2f}s -> {legacy_rate:>12,.0f} rows/sec")
+    print(f"extract_events_columns : {len(zomato_events):>9,} rows in {columnar_elapsed:8.2f}s -> {columnar_rate:>12,.0f} rows/sec")
+    print(f"speedup: {columnar_rate / legacy_rate:.1f}x")
@@ -0,0 +1,54 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+def run_child(mode: str, feed_path: str, chunk_size: int) -> None:
+    #runs in a fresh process so ru_maxrss only reflects this ingest mode
+    from restaurant.restaurant_details import zomato_api_response_to_df, zomato_api_stream_to_df
+    start = time.perf_counter()
+    rows = 0
+    if mode == "eager":
+        with open(feed_path, "rb") as f:
+            rows = len(zomato_api_response_to_df(json.loads(f.read())))
+    elif mode == "stream":
+        with open(feed_path, "rb") as f:
+            rows = len(zomato_api_stream_to_df(f, chunk_size))
+    elapsed = time.perf_counter() - start
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"mode": mode, "rows": rows, "seconds": elapsed, "peak_rss_mb": peak_rss_mb}))
+
+def measure(mode: str, feed_path: str, chunk_size: int) -> dict:
+    output = subprocess.run([sys.executable, "-m", "benchmarks.bench_restaurant_ingest", "--child", mode,
+                             "--feed", feed_path, "--chunk-size", str(chunk_size)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Peak RSS of eager vs streaming restaurant feed ingestion.")
+    parser.add_argument("--restaurants", type=int, default=50_000, help="number of synthetic restaurants")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="restaurants normalized per chunk when streaming")
+    parser.add_argument("--child", choices=["baseline", "eager", "stream"], help=argparse.SUPPRESS)
+    parser.add_argument("--feed", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.feed, args.chunk_size)
+        sys.exit(0)
+
+    from benchmarks.synthetic_data import make_zomato_feed
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        feed_path = os.path.join(tmp_dir, "restaurant_data.json")
+        with open(feed_path, "w") as f:
+            json.dump(make_zomato_feed(args.restaurants), f)
+        print(f"feed: {args.restaurants:,} restaurants, {os.path.getsize(feed_path) / 1e6:.1f} MB")
+
+        baseline = measure("baseline", feed_path, args.chunk_size)
+        for mode in ["eager", "stream"]:
+            result = measure(mode, feed_path, args.chunk_size)
+            print(f"{mode:<7}: {result['rows']:>8,} rows in {result['seconds']:6.2f}s, "
+                  f"peak RSS {result['peak_rss_mb']:8.1f} MB ({result['peak_rss_mb'] - baseline['peak_rss_mb']:8.1f} MB above imports)")
@@ -0,0 +1,33 @@
+import argparse
+import os
+import time
+import pandas as pd
+from benchmarks.synthetic_data import make_zomato_feed
+from restaurant.restaurant_details import zomato_api_response_to_df
+
+def best_of(repeat: int, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+if __name__ == "__main__":
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Benchmark restaurant feed normalization on 1..N worker processes.")
+    parser.add_argument("--restaurants", type=int, default=50_000, help="number of synthetic restaurants")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, cpus}), help="worker counts to try")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the best is reported")
+    args = parser.parse_args()
+
+    feed = make_zomato_feed(args.restaurants)
+    print(f"{args.restaurants:,} restaurants, {cpus} cpu(s) available")
+    serial_elapsed, serial_df = best_of(args.repeat, lambda: zomato_api_response_to_df(feed))
+    print(f"workers  1 (in process): {serial_elapsed:6.2f} s  ({args.restaurants / serial_elapsed:9,.0f} restaurants/s)")
+    for workers in args.workers:
+        if workers <= 1:
+            continue
+        elapsed, restaurants_df = best_of(args.repeat, lambda: zomato_api_response_to_df(feed, workers=workers))
+        pd.testing.assert_frame_equal(restaurants_df, serial_df)
+        print(f"workers {workers:2d}              : {elapsed:6.2f} s  ({args.restaurants / elapsed:9,.0f} restaurants/s, {serial_elapsed / elapsed:4.2f}x)")
@@ -0,0 +1,58 @@
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from benchmarks.synthetic_data import make_zomato_feed
+from restaurant.restaurant_details import load_zomato_restaurant_pages, restaurant_page_urls, zomato_api_response_to_df
+from utils.http_client import fetch_json
+
+def serve_pages(pages, latency: float) -> ThreadingHTTPServer:
+    """Serves each page of a feed at /page/N after `latency` seconds, like a remote API."""
+    bodies = [json.dumps(page).encode() for page in pages]
+
+    class PageHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = bodies[int(self.path.rsplit("/", 1)[1])]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark paginated restaurant feed download: serial vs concurrent fetch.")
+    parser.add_argument("--pages", type=int, default=100, help="number of pages")
+    parser.add_argument("--page-size", type=int, default=20, help="restaurants per page")
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds the stub waits before answering each page")
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 8, 16], help="max_workers values to try")
+    args = parser.parse_args()
+
+    feed = make_zomato_feed(args.pages * args.page_size, restaurants_per_page=args.page_size)
+    server = serve_pages(feed, args.latency)
+    urls = restaurant_page_urls(f"http://127.0.0.1:{server.server_port}/page/{{page}}", len(feed))
+
+    start = time.perf_counter()
+    serial_df = zomato_api_response_to_df([fetch_json(url) for url in urls])
+    serial_elapsed = time.perf_counter() - start
+    print(f"{len(urls)} pages, {args.latency * 1000:.0f} ms latency each, {len(serial_df):,} restaurants")
+    print(f"serial               : {serial_elapsed:6.2f} s  ({len(urls) / serial_elapsed:6.1f} pages/s)")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        concurrent_df = load_zomato_restaurant_pages(urls, max_workers=workers, per_host_limit=workers)
+        elapsed = time.perf_counter() - start
+        assert concurrent_df.equals(serial_df)
+        print(f"concurrent, {workers:2d} workers: {elapsed:6.2f} s  ({len(urls) / elapsed:6.1f} pages/s, {serial_elapsed / elapsed:4.1f}x)")
+    server.shutdown()
@@ -0,0 +1,32 @@
+import argparse
+import time
+import tracemalloc
+from benchmarks.synthetic_data import make_zomato_feed
+from restaurant.restaurant_details import zomato_api_response_to_df
+from config import RESTAURANT_FIELDS
+
+def measure(feed, fields):
+    #time without tracing, then the traced peak of a second run
+    start = time.perf_counter()
+    restaurants_df = zomato_api_response_to_df(feed, fields=fields)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    zomato_api_response_to_df(feed, fields=fields)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return restaurants_df, elapsed, peak
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark restaurant feed loading: full json_normalize vs projection of RESTAURANT_FIELDS.")
+    parser.add_argument("--restaurants", type=int, default=20_000, help="number of synthetic restaurants")
+    args = parser.parse_args()
+
+    feed = make_zomato_feed(args.restaurants)
+    print(f"{args.restaurants:,} restaurants, {len(RESTAURANT_FIELDS)} projected paths")
+    for label, fields in [("json_normalize", None), ("projection", RESTAURANT_FIELDS)]:
+        restaurants_df, elapsed, peak = measure(feed, fields)
+        #the zomato_events dicts are shared with the parsed feed, only the references are counted;
+        #Arrow-backed str columns are allocated outside tracemalloc, so the peak is the Python heap only
+        frame_mb = restaurants_df.memory_usage(deep=True).sum() / 1e6
+        print(f"{label:<15}: {elapsed:6.2f} s, {restaurants_df.shape[1]:3d} columns, frame {frame_mb:7.1f} MB, "
+              f"python heap peak {peak / 1e6:7.1f} MB")
@@ -0,0 +1,67 @@
+import argparse
+import random
+import time
+import numpy as np
+from benchmarks.synthetic_data import make_zomato_feed, CITIES, CUISINES
+from restaurant.restaurant_details import zomato_api_response_to_df
+from restaurant.restaurant_query import RestaurantQueryIndex
+from config import RESTAURANT_FIELDS, RESTAURANT_DETAILS_MAP
+
+COUNTRIES = {1: "India", 14: "Australia", 30: "Brazil", 37: "Canada", 94: "Indonesia", 148: "New Zealand", 162: "Phillipines",
+             184: "Singapore", 189: "South Africa", 191: "Sri Lanka", 208: "Turkey", 214: "UAE", 215: "United Kingdom", 216: "United States"}
+
+def random_queries(n_queries: int, seed: int = 0):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n_queries):
+        query = {"country": rng.choice(list(COUNTRIES.values())), "min_rating": rng.choice([3.0, 3.5, 4.0]),
+                 "min_votes": rng.choice([50, 100, 500])}
+        if rng.random() < 0.7:
+            query["cuisine"] = rng.choice(CUISINES).lower()
+        if rng.random() < 0.3:
+            query["city"] = rng.choice(CITIES)[1]
+        queries.append(query)
+    return queries
+
+def scan(restaurants_df, limit, country, min_rating, min_votes, cuisine=None, city=None):
+    #what a one-off script does: boolean masks over the whole frame, then sort
+    mask = (restaurants_df['Country'].str.lower() == country.lower()) & (restaurants_df['user_rating.aggregate_rating'] >= min_rating) \
+           & (restaurants_df['user_rating.votes'] >= min_votes)
+    if cuisine is not None:
+        mask &= restaurants_df['cuisines'].str.lower().str.contains(cuisine, regex=False)
+    if city is not None:
+        mask &= restaurants_df['location.city'].str.lower() == city.lower()
+    return restaurants_df[mask].sort_values('user_rating.aggregate_rating', ascending=False).head(limit)
+
+def latencies_ms(func, queries):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.percentile(timings, 50), np.percentile(timings, 99)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark restaurant queries: full DataFrame scan vs RestaurantQueryIndex, cold and memoized.")
+    parser.add_argument("--restaurants", type=int, default=100_000, help="number of synthetic restaurants")
+    parser.add_argument("--queries", type=int, default=200, help="number of distinct queries")
+    parser.add_argument("--limit", type=int, default=20, help="restaurants returned per query")
+    args = parser.parse_args()
+
+    restaurants_df = zomato_api_response_to_df(make_zomato_feed(args.restaurants, max_events=0), fields=RESTAURANT_FIELDS)
+    restaurants_df['Country'] = restaurants_df['location.country_id'].map(COUNTRIES)
+    queries = random_queries(args.queries)
+
+    start = time.perf_counter()
+    query_index = RestaurantQueryIndex(restaurants_df, RESTAURANT_DETAILS_MAP)
+    build_elapsed = time.perf_counter() - start
+    print(f"{args.restaurants:,} restaurants, {args.queries} distinct queries, index built in {build_elapsed * 1000:.0f} ms")
+
+    results = [
+        ("DataFrame scan", latencies_ms(lambda query: scan(restaurants_df, args.limit, **query), queries)),
+        ("index, first run", latencies_ms(lambda query: query_index.records(limit=args.limit, **query), queries)),
+        ("index, repeated", latencies_ms(lambda query: query_index.records(limit=args.limit, **query), queries)),
+        ("index, repeated, DataFrame", latencies_ms(lambda query: query_index.search(limit=args.limit, **query), queries)),
+    ]
+    for label, (p50, p99) in results:
+        print(f"{label:<27}: p50 {p50:8.3f} ms, p99 {p99:8.3f} ms")
@@ -0,0 +1,51 @@
+import argparse
+import tempfile
+import time
+from benchmarks.synthetic_data import make_zomato_feed
+from restaurant.restaurant_details import zomato_api_response_to_df, zomato_restaurant_details_to_csv
+from restaurant.restaurant_events import build_events_table, extract_restaurant_events_by_months, month_range
+from config import RESTAURANT_FIELDS, RESTAURANT_DETAILS_MAP, RESTAURANTS_EVENT_MAP
+
+def frame_mb(df) -> float:
+    #object cells are counted shallowly, nested event dicts are shared and not included
+    return df.memory_usage(deep=True).sum() / 1e6
+
+def time_exports(restaurants_df, events_df, months) -> float:
+    #details export plus one events file per month
+    with tempfile.TemporaryDirectory() as out_dir:
+        start = time.perf_counter()
+        zomato_restaurant_details_to_csv(restaurants_df, RESTAURANT_DETAILS_MAP, "details.csv", out_dir, raise_errors=True, events_df=events_df)
+        extract_restaurant_events_by_months(months, restaurants_df, out_dir, RESTAURANTS_EVENT_MAP, "events_{mm_yyyy}.csv",
+                                            raise_errors=True, events_df=events_df)
+        return time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rows and memory of the exploded restaurant frame vs separate restaurants and events tables.")
+    parser.add_argument("--restaurants", type=int, default=5_000, help="number of synthetic restaurants")
+    parser.add_argument("--max-events", type=int, default=40, help="maximum events per restaurant")
+    args = parser.parse_args()
+
+    feed = make_zomato_feed(args.restaurants, max_events=args.max_events)
+    months = month_range("01_2018", "12_2019")
+    full_df = zomato_api_response_to_df(feed)
+    projected_df = zomato_api_response_to_df(feed, fields=RESTAURANT_FIELDS)
+    for df in [full_df, projected_df]:
+        df['Country'] = 'Somewhere'
+
+    print(f"{args.restaurants:,} restaurants, up to {args.max_events} events each")
+    for label, df in [("all fields", full_df), ("RESTAURANT_FIELDS", projected_df)]:
+        start = time.perf_counter()
+        expanded_df = df.explode('zomato_events')
+        explode_elapsed = time.perf_counter() - start
+        exports_elapsed = time_exports(expanded_df, None, months)
+        print(f"exploded, {label:<17}: {len(expanded_df):>9,} rows x {expanded_df.shape[1]:2d} cols, {frame_mb(expanded_df):8.1f} MB, "
+              f"explode {explode_elapsed:5.2f} s, details + {len(months)} months {exports_elapsed:5.2f} s")
+
+    start = time.perf_counter()
+    events_df = build_events_table(projected_df['zomato_events'], projected_df['id'])
+    restaurants_df = projected_df.drop(columns='zomato_events')
+    split_elapsed = time.perf_counter() - start
+    exports_elapsed = time_exports(restaurants_df, events_df, months)
+    print(f"tables, restaurants        : {len(restaurants_df):>9,} rows x {restaurants_df.shape[1]:2d} cols, {frame_mb(restaurants_df):8.1f} MB")
+    print(f"tables, events             : {len(events_df):>9,} rows x {events_df.shape[1]:2d} cols, {frame_mb(events_df):8.1f} MB, "
+          f"parse {split_elapsed:5.2f} s, details + {len(months)} months {exports_elapsed:5.2f} s")
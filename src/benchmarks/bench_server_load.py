@@ -0,0 +1,92 @@
+import argparse
+import http.client
+import random
+import threading
+import time
+from typing import Dict, List
+from urllib.parse import quote, urlsplit
+import numpy as np
+
+def make_synthetic_server(n_carparks: int, n_restaurants: int):
+    """Serves a QueryService over synthetic data on a free port. Returns the server and the request paths to replay."""
+    from benchmarks.synthetic_data import make_carparks_merged_df, make_zomato_feed
+    from carpark.availability_poller import CarparkAvailabilityPoller
+    from restaurant.restaurant_details import zomato_api_response_to_df
+    from server import QueryService, make_server
+
+    carparks_data_merged_df = make_carparks_merged_df(n_carparks)
+    restaurants_df = zomato_api_response_to_df(make_zomato_feed(n_restaurants)).explode('zomato_events')
+    service = QueryService(CarparkAvailabilityPoller(carparks_data_merged_df, "http://localhost/unused"), restaurants_df)
+    server = make_server(service, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    rng = random.Random(0)
+    carpark_numbers = carparks_data_merged_df['carpark_number'].unique().tolist()
+    addresses = carparks_data_merged_df['address'].unique().tolist()
+    paths = {
+        "carpark": [f"/carparks/{rng.choice(carpark_numbers)}" for _ in range(200)],
+        "search (exact)": [f"/carparks/search?address={quote(rng.choice(addresses))}" for _ in range(200)],
+        "search (fuzzy)": [f"/carparks/search?address={quote(rng.choice(addresses)[:-4])}" for _ in range(200)],
+        "events": [f"/restaurants/events?month={rng.randint(1, 12):02d}_{rng.choice([2018, 2019])}" for _ in range(200)],
+    }
+    return server, paths
+
+def run_load(host: str, port: int, paths: List[str], clients: int, requests_per_client: int) -> Dict[str, float]:
+    """
+    Replays paths from `clients` threads, each on its own keep-alive connection.
+
+    Returns:
+        dict: p50 and p99 latency in ms, requests per second and the number of non-2xx/4xx responses.
+    """
+    latencies = [[] for _ in range(clients)]
+    errors = [0] * clients
+
+    def client(i):
+        rng = random.Random(i)
+        connection = http.client.HTTPConnection(host, port, timeout=30)
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            connection.request("GET", rng.choice(paths))
+            response = connection.getresponse()
+            response.read()
+            latencies[i].append(time.perf_counter() - start)
+            if response.status >= 500:
+                errors[i] += 1
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    all_latencies = np.concatenate([np.array(l) for l in latencies]) * 1000
+    return {"p50": float(np.percentile(all_latencies, 50)), "p99": float(np.percentile(all_latencies, 99)),
+            "rps": len(all_latencies) / elapsed, "errors": sum(errors)}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the query server: p50/p99 latency and throughput per endpoint.")
+    parser.add_argument("--url", help="base url of a running `python -m server`, e.g. http://127.0.0.1:8000 "
+                                      "(default: serve synthetic data in process)")
+    parser.add_argument("--path", action="append", default=[], help="path to replay against --url, repeatable")
+    parser.add_argument("--carparks", type=int, default=2_200, help="number of synthetic carparks")
+    parser.add_argument("--restaurants", type=int, default=2_000, help="number of synthetic restaurants")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent keep-alive clients")
+    parser.add_argument("--requests", type=int, default=200, help="requests per client and endpoint")
+    args = parser.parse_args()
+
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+        paths = {path: [path] for path in args.path or ["/health"]}
+    else:
+        server, paths = make_synthetic_server(args.carparks, args.restaurants)
+        host, port = "127.0.0.1", server.server_port
+
+    print(f"{args.clients} clients x {args.requests} requests per endpoint")
+    print(f"{'endpoint':<16} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>9} {'5xx':>5}")
+    for name, endpoint_paths in paths.items():
+        result = run_load(host, port, endpoint_paths, args.clients, args.requests)
+        print(f"{name:<16} {result['p50']:8.2f} {result['p99']:8.2f} {result['rps']:9.0f} {result['errors']:5d}")
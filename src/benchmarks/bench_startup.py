@@ -0,0 +1,136 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set, Tuple
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+#modules the home menu must not import, they belong to the scenario that needs them. rich is not one of them:
+#the home menu is itself a rich prompt, so deferring it would only move its import to the first prompt
+HEAVY_MODULES = ["pandas", "numpy", "requests", "pyarrow", "rapidfuzz", "fuzzywuzzy", "matplotlib", "seaborn"]
+FIRST_PROMPT_BUDGET_SECONDS = 1.0
+FIRST_CARPARK_ANSWER_BUDGET_SECONDS = 10.0
+FIRST_PROMPT_MARKER = "Choose a scenario"
+CARPARK_ANSWER_MARKER = '"lot_types"'
+
+def import_profile(module: str = "main") -> Tuple[float, Set[str]]:
+    """
+    Imports a module in a fresh interpreter under `python -X importtime`.
+
+    Returns:
+        Tuple[float, Set[str]]: Cumulative import time of the module in seconds, and every module it imported.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=SRC_DIR,
+                            capture_output=True, text=True, check=True)
+    imported, elapsed = set(), 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.add(name.strip())
+        if name.rstrip() == f" {module}":
+            elapsed = int(cumulative) / 1e6
+    return elapsed, imported
+
+def run_menu(stdin_lines: List[str], markers: List[str], code: str = "import main; main.main()",
+             env: Optional[Dict[str, str]] = None, timeout: float = 120) -> Tuple[Dict[str, float], str]:
+    """
+    Starts the interactive menu in a fresh interpreter, feeds it stdin_lines and times the first appearance
+    of each marker in its output, from process start.
+
+    Returns:
+        Tuple[dict, str]: Marker to seconds, markers that never appeared being missing, and everything the
+                          process printed (stdout and stderr).
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", code], cwd=SRC_DIR, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, env={**os.environ, "PYTHONUNBUFFERED": "1", **(env or {})})
+    process.stdin.write("".join(line + "\n" for line in stdin_lines).encode())
+    process.stdin.close()
+    seen, output = {}, b""
+    while len(seen) < len(markers):
+        chunk = process.stdout.read1(65536)
+        if not chunk:
+            break
+        output += chunk
+        text = output.decode(errors="ignore")
+        for marker in markers:
+            if marker not in seen and marker in text:
+                seen[marker] = time.perf_counter() - start
+    process.stdout.close()
+    process.wait(timeout=timeout)
+    return seen, output.decode(errors="ignore")
+
+def marker_seconds(seen: Dict[str, float], output: str, marker: str) -> float:
+    """Seconds until a marker appeared, failing with the captured output if it never did (eg. a crash or a changed prompt)."""
+    assert marker in seen, f"{marker!r} was never printed, the menu printed:\n{output}"
+    return seen[marker]
+
+def serve_carpark_stub(n_carparks: int) -> Tuple[ThreadingHTTPServer, str, str, str]:
+    """
+    Serves a synthetic static carpark csv and availability payload locally, so the carpark scenario can be
+    timed without the network.
+
+    Returns:
+        Tuple[ThreadingHTTPServer, str, str, str]: The server, the availability url, the csv url and a carpark number.
+    """
+    from benchmarks.synthetic_data import make_carpark_static_df, make_carpark_availability_payload
+    static_df = make_carpark_static_df(n_carparks)
+    bodies = {
+        "/carpark-availability": json.dumps(make_carpark_availability_payload(static_df)).encode(),
+        "/HDBCarparkInformation.csv": static_df.to_csv(index=False).encode(),
+    }
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            body = bodies.get(self.path.split("?")[0])
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Length", str(len(body or b"")))
+            self.end_headers()
+            self.wfile.write(body or b"")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    return server, f"{base}/carpark-availability", f"{base}/HDBCarparkInformation.csv", str(static_df["car_park_no"].iloc[0])
+
+def time_to_first_prompt() -> float:
+    """Seconds from process start until the home menu prompt is printed."""
+    seen, output = run_menu(["exit"], [FIRST_PROMPT_MARKER])
+    return marker_seconds(seen, output, FIRST_PROMPT_MARKER)
+
+def time_to_first_carpark_answer(n_carparks: int = 2_200) -> float:
+    """Seconds from process start until the first carpark number lookup is printed, against a local stub of the APIs."""
+    server, availability_url, csv_url, carpark_number = serve_carpark_stub(n_carparks)
+    try:
+        with tempfile.TemporaryDirectory() as data_dir:
+            code = (f"import config; config.DATA_GOV_TRANSPORT_API_URL = {availability_url!r}; "
+                    f"config.CARPARK_STATIC_CSV_URL = {csv_url!r}; import main; main.main()")
+            seen, output = run_menu(["2", "1", carpark_number, "back", "exit"], [CARPARK_ANSWER_MARKER], code,
+                                    env={"DATA_FOLDER_DIR": data_dir})
+    finally:
+        server.shutdown()
+        server.server_close()
+    return marker_seconds(seen, output, CARPARK_ANSWER_MARKER)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark cli startup: import time, time to first prompt and to first carpark answer.")
+    parser.add_argument("--carparks", type=int, default=2_200, help="number of synthetic carparks served by the stub")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the best is reported")
+    args = parser.parse_args()
+
+    import_elapsed, imported = import_profile("main")
+    heavy = [module for module in HEAVY_MODULES if module in imported]
+    print(f"import main               : {import_elapsed * 1000:8.1f} ms, heavy modules imported: {heavy or 'none'}")
+    first_prompt = min(time_to_first_prompt() for _ in range(args.repeat))
+    print(f"time to first prompt      : {first_prompt * 1000:8.1f} ms (budget {FIRST_PROMPT_BUDGET_SECONDS * 1000:.0f} ms)")
+    first_answer = min(time_to_first_carpark_answer(args.carparks) for _ in range(args.repeat))
+    print(f"time to first carpark answer: {first_answer * 1000:6.1f} ms (budget {FIRST_CARPARK_ANSWER_BUDGET_SECONDS * 1000:.0f} ms)")
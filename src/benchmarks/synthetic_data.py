@@ -0,0 +1,223 @@
+import random
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+
+LOT_TYPES = ["C", "H", "Y", "S"]
+STREETS = ["ANG MO KIO AVE", "BISHAN ST", "TAMPINES ST", "JURONG WEST ST", "BEDOK NORTH RD",
+           "YISHUN RING RD", "CLEMENTI AVE", "TOA PAYOH LOR", "WOODLANDS DR", "SENGKANG EAST WAY"]
+
+def make_carpark_static_df(n_carparks: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Builds a static carpark table shaped like HDBCarparkInformation.csv.
+
+    Args:
+        n_carparks (int): Number of carparks to generate.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        pd.DataFrame: The static carpark table.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_carparks):
+        rows.append({
+            "car_park_no": f"{chr(65 + i % 26)}{chr(65 + (i // 26) % 26)}{i}",
+            "address": f"BLK {rng.randint(1, 999)} {rng.choice(STREETS)} {rng.randint(1, 99)}",
+            "x_coord": round(rng.uniform(2_000, 50_000), 4),
+            "y_coord": round(rng.uniform(25_000, 50_000), 4),
+            "car_park_type": rng.choice(["MULTI-STOREY CAR PARK", "SURFACE CAR PARK", "BASEMENT CAR PARK"]),
+            "type_of_parking_system": rng.choice(["ELECTRONIC PARKING", "COUPON PARKING"]),
+            "short_term_parking": rng.choice(["WHOLE DAY", "7AM-10.30PM", "NO"]),
+            "free_parking": rng.choice(["NO", "SUN & PH FR 7AM-10.30PM"]),
+            "night_parking": rng.choice(["YES", "NO"]),
+            "car_park_decks": rng.randint(0, 12),
+            "gantry_height": round(rng.uniform(1.8, 4.5), 2),
+            "car_park_basement": rng.choice(["Y", "N"]),
+        })
+    return pd.DataFrame(rows)
+
+def make_carpark_availability_payload(static_df: pd.DataFrame, seed: int = 0,
+                                      update_datetime: str = "2024-02-14T10:30:45") -> Dict:
+    """
+    Builds a data.gov.sg carpark-availability payload for the carparks in a static table.
+
+    Args:
+        static_df (pd.DataFrame): Static table from make_carpark_static_df.
+        seed (int): Seed for the random generator.
+        update_datetime (str): update_datetime of every carpark in the payload.
+
+    Returns:
+        dict: The API payload.
+    """
+    rng = random.Random(seed)
+    carpark_data = []
+    for carpark_number in static_df["car_park_no"]:
+        carpark_info = []
+        for lot_type in LOT_TYPES[:rng.choice([1, 1, 1, 2, 3])]:
+            total_lots = rng.randint(10, 800)
+            carpark_info.append({"total_lots": str(total_lots), "lot_type": lot_type,
+                                 "lots_available": str(rng.randint(0, total_lots))})
+        carpark_data.append({"carpark_info": carpark_info, "carpark_number": carpark_number,
+                             "update_datetime": update_datetime})
+    return {"items": [{"timestamp": f"{update_datetime}+08:00", "carpark_data": carpark_data}]}
+
+ADDRESS_SUFFIXES = ["", "", "", " MULTI-STOREY CAR PARK", " BASEMENT CAR PARK", " SURFACE CAR PARK"]
+
+def make_addresses(n_addresses: int, seed: int = 0) -> List[str]:
+    """
+    Builds distinct HDB-style carpark addresses.
+
+    Args:
+        n_addresses (int): Number of addresses to generate.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        List[str]: Distinct addresses such as "BLK 640A ANG MO KIO AVE 6 MULTI-STOREY CAR PARK".
+    """
+    rng = random.Random(seed)
+    addresses = set()
+    while len(addresses) < n_addresses:
+        block = f"{rng.randint(1, 999)}{rng.choice(['', '', 'A', 'B', 'C'])}"
+        addresses.add(f"BLK {block} {rng.choice(STREETS)} {rng.randint(1, 99)}{rng.choice(ADDRESS_SUFFIXES)}")
+    return sorted(addresses)
+
+def make_carparks_merged_df(n_carparks: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Builds a merged carpark DataFrame shaped like the output of get_carparks_data.
+
+    Args:
+        n_carparks (int): Number of carparks to generate.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        pd.DataFrame: One row per (carpark, lot type) with availability and static information.
+    """
+    static_df = make_carpark_static_df(n_carparks, seed)
+    payload = make_carpark_availability_payload(static_df, seed)
+    availability_rows = [
+        {"carpark_number": carpark["carpark_number"], "update_datetime": carpark["update_datetime"], **info}
+        for carpark in payload["items"][0]["carpark_data"] for info in carpark["carpark_info"]
+    ]
+    availability_df = pd.DataFrame(availability_rows)
+    return availability_df.merge(static_df, left_on="carpark_number", right_on="car_park_no", how="inner")
+
+CUISINES = ["Japanese", "Sushi", "Italian", "Pizza", "Cafe", "Desserts", "North Indian", "Chinese",
+            "Thai", "Burger", "Fast Food", "Seafood", "Bakery", "Mexican", "Healthy Food"]
+CITIES = [(1, "New Delhi"), (1, "Bangalore"), (14, "Sydney"), (30, "Sao Paulo"), (37, "Toronto"),
+          (94, "Jakarta"), (148, "Auckland"), (162, "Manila"), (184, "Singapore"), (189, "Cape Town"),
+          (191, "Colombo"), (208, "Istanbul"), (214, "Dubai"), (215, "London"), (216, "New York City")]
+RATING_TEXTS = [(1.0, "Poor"), (2.5, "Average"), (3.5, "Good"), (4.0, "Very Good"), (4.5, "Excellent")]
+
+def make_zomato_event(rng: random.Random, event_id: int) -> Dict:
+    start = pd.Timestamp(2017, 1, 1) + pd.Timedelta(days=rng.randrange(0, 1000))
+    end = start + pd.Timedelta(days=rng.randrange(0, 60))
+    photos = [{"photo": {"url": f"https://b.zmtcdn.com/data/zomato_events/photos/{event_id}_{i}.jpg",
+                         "thumb_url": f"https://b.zmtcdn.com/data/zomato_events/photos/{event_id}_{i}_thumb.jpg",
+                         "order": i, "md5sum": f"{rng.getrandbits(128):032x}", "id": event_id * 10 + i,
+                         "photo_id": event_id * 10 + i, "uuid": rng.getrandbits(48), "type": "NORMAL"}}
+              for i in range(rng.randint(0, 2))]
+    return {"event": {
+        "event_id": event_id, "friendly_start_date": start.strftime("%d %B"),
+        "friendly_end_date": end.strftime("%d %B"), "friendly_timing_str": "Saturday, 1st June",
+        "start_date": start.strftime("%Y-%m-%d"), "end_date": end.strftime("%Y-%m-%d"),
+        "end_time": "23:59:00", "start_time": "12:00:00", "is_active": 1,
+        "date_added": "2019-03-01 12:00:00", "photos": photos, "restaurants": [], "is_valid": 1,
+        "share_url": f"http://www.zoma.to/r/{event_id}", "show_share_url": 1,
+        "title": f"Event {event_id}", "description": "Live music and specials all evening " * 3,
+        "display_time": "12:00 pm - 11:59 pm", "display_date": "01 June - 30 June", "is_end_time_set": 1,
+        "disclaimer": "Restaurants are solely responsible for the service", "event_category": 1,
+        "event_category_name": "", "book_link": "", "types": [],
+        "share_data": {"should_show": 0},
+    }}
+
+def make_synthetic_events(n_events: int, seed: int = 0) -> pd.Series:
+    """
+    Builds a Series of Zomato-style event dicts, with a small share of rows without events.
+
+    Args:
+        n_events (int): Number of rows to generate.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        pd.Series: A Series of event dicts (or NaN for restaurants without events).
+    """
+    rng = random.Random(seed)
+    events = []
+    for i in range(n_events):
+        if rng.random() < 0.05:
+            events.append(np.nan)
+            continue
+        start = pd.Timestamp(2017, 1, 1) + pd.Timedelta(days=rng.randrange(0, 1500))
+        end = start + pd.Timedelta(days=rng.randrange(0, 60))
+        events.append({"event": {
+            "event_id": 300000 + i,
+            "title": f"Event {i}",
+            "start_date": start.strftime("%Y-%m-%d"),
+            "end_date": end.strftime("%Y-%m-%d"),
+            "photos": [],
+        }})
+    return pd.Series(events, dtype=object)
+
+def make_zomato_restaurant(rng: random.Random, restaurant_id: int, max_events: int) -> Dict:
+    country_id, city = rng.choice(CITIES)
+    rating, rating_text = rng.choice(RATING_TEXTS)
+    rating = min(4.9, round(rating + rng.uniform(0, 0.9), 1))
+    n_events = rng.randint(0, max_events)
+    restaurant = {
+        "R": {"res_id": restaurant_id, "is_grocery_store": False, "has_menu_status": {"delivery": -1, "takeaway": -1}},
+        "apikey": "abcdef0123456789", "id": str(restaurant_id), "name": f"Restaurant {restaurant_id}",
+        "url": f"https://www.zomato.com/restaurant-{restaurant_id}?utm_source=api_basic_user&utm_medium=api",
+        "location": {"address": f"{rng.randint(1, 300)} Some Street, {city}", "locality": "Central",
+                     "city": city, "city_id": country_id * 100, "latitude": f"{rng.uniform(-40, 50):.8f}",
+                     "longitude": f"{rng.uniform(-120, 150):.8f}", "zipcode": str(rng.randint(10000, 99999)),
+                     "country_id": country_id, "locality_verbose": f"Central, {city}"},
+        "switch_to_order_menu": 0,
+        "cuisines": ", ".join(rng.sample(CUISINES, rng.randint(1, 4))),
+        "timings": "11 AM to 11 PM", "average_cost_for_two": rng.choice([20, 50, 80, 1500]),
+        "price_range": rng.randint(1, 4), "currency": "$", "highlights": ["Lunch", "Dinner", "Cash", "Indoor Seating"],
+        "offers": [], "opentable_support": 0, "is_zomato_book_res": 0, "mezzo_provider": "OTHER",
+        "is_book_form_web_view": 0, "book_form_web_view_url": "", "book_again_url": "",
+        "thumb": f"https://b.zmtcdn.com/data/pictures/{restaurant_id}.jpg?fit=around%7C200%3A200",
+        "user_rating": {"aggregate_rating": str(rating), "rating_text": rating_text,
+                        "rating_color": "3F7E00", "rating_obj": {"title": {"text": str(rating)},
+                                                                 "bg_color": {"type": "lime", "tint": "800"}},
+                        "votes": str(rng.randint(0, 5000)), "has_fake_reviews": rng.choice([0, 1]),
+                        "custom_rating_text": None},
+        "all_reviews_count": rng.randint(0, 3000),
+        "photos_url": f"https://www.zomato.com/restaurant-{restaurant_id}/photos",
+        "photo_count": rng.randint(0, 500),
+        "menu_url": f"https://www.zomato.com/restaurant-{restaurant_id}/menu",
+        "featured_image": f"https://b.zmtcdn.com/data/pictures/{restaurant_id}_featured.jpg",
+        "has_online_delivery": 0, "is_delivering_now": 0, "store_type": "", "include_bogo_offers": True,
+        "deeplink": f"zomato://restaurant/{restaurant_id}", "is_table_reservation_supported": 0,
+        "has_table_booking": 0, "events_url": f"https://www.zomato.com/restaurant-{restaurant_id}/events",
+        "phone_numbers": "+1 555 0100", "all_reviews": {"reviews": [{"review": []}] * 5},
+        "establishment": ["Casual Dining"], "establishment_types": [],
+    }
+    if n_events:
+        restaurant["zomato_events"] = [make_zomato_event(rng, restaurant_id * 100 + i) for i in range(n_events)]
+    return restaurant
+
+def make_zomato_feed(n_restaurants: int, restaurants_per_page: int = 20, max_events: int = 3, seed: int = 0) -> List[Dict]:
+    """
+    Builds a restaurant feed shaped like RESTAURANT_JSON_URL: a list of Zomato search responses.
+
+    Args:
+        n_restaurants (int): Number of restaurants in the feed.
+        restaurants_per_page (int): Restaurants per search response.
+        max_events (int): Maximum number of zomato_events per restaurant.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        List[Dict]: The list of search responses.
+    """
+    rng = random.Random(seed)
+    responses = []
+    for page_start in range(0, n_restaurants, restaurants_per_page):
+        page_ids = range(page_start, min(page_start + restaurants_per_page, n_restaurants))
+        responses.append({
+            "results_found": n_restaurants, "results_start": page_start, "results_shown": len(page_ids),
+            "restaurants": [{"restaurant": make_zomato_restaurant(rng, 1000 + i, max_events)} for i in page_ids],
+        })
+    return responses
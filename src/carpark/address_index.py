@@ -0,0 +1,135 @@
+import numpy as np
+from typing import Dict, Iterable, List, Tuple
+from rapidfuzz import fuzz
+from rapidfuzz.process import cpdist
+from rapidfuzz.utils import default_process
+
+NGRAM_SIZE = 3
+MAX_CANDIDATES = 2_000
+
+def address_ngrams(processed_address: str, ngram_size: int = NGRAM_SIZE) -> set:
+    """
+    Splits a preprocessed address into its tokens and the character n-grams of each token.
+
+    Tokens shorter than ngram_size (eg. "st", "21") are kept whole so short block numbers still block.
+
+    Args:
+        processed_address (str): Address after default_process (lowercased, punctuation stripped).
+        ngram_size (int): Length of the character n-grams.
+
+    Returns:
+        set: The distinct keys to look up in the inverted index.
+    """
+    keys = set()
+    for token in processed_address.split():
+        if len(token) <= ngram_size:
+            keys.add(token)
+            continue
+        for i in range(len(token) - ngram_size + 1):
+            keys.add(token[i:i + ngram_size])
+    return keys
+
+class AddressIndex:
+    """
+    Fuzzy address matcher built once per dataset.
+
+    Addresses are deduplicated and preprocessed once. Each query first collects candidates from a
+    token / character n-gram inverted index, keeping the addresses that share the most keys with it,
+    and only those candidates are scored with rapidfuzz's WRatio (the scorer fuzzywuzzy used by default).
+    """
+    def __init__(self, addresses: Iterable[str], ngram_size: int = NGRAM_SIZE,
+                 max_candidates: int = MAX_CANDIDATES, workers: int = 1):
+        """
+        Args:
+            addresses (Iterable[str]): Addresses to match against, eg. the address column of the merged carpark df.
+                                       Duplicates and missing values are dropped.
+            ngram_size (int): Length of the character n-grams used for blocking.
+            max_candidates (int): Upper bound on the number of addresses scored per query.
+            workers (int): Threads used by cpdist for scoring, -1 for all cores.
+        """
+        self.addresses: List[str] = list(dict.fromkeys(a for a in addresses if isinstance(a, str)))
+        self.processed: List[str] = [default_process(a) for a in self.addresses]
+        self.ngram_size = ngram_size
+        self.max_candidates = max_candidates
+        self.workers = workers
+
+        postings: Dict[str, List[int]] = {}
+        for position, processed_address in enumerate(self.processed):
+            for key in address_ngrams(processed_address, ngram_size):
+                postings.setdefault(key, []).append(position)
+        self.postings: Dict[str, np.ndarray] = {key: np.array(ids, dtype=np.int32) for key, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def candidates(self, processed_query: str) -> np.ndarray:
+        """
+        Returns the positions of the addresses sharing the most n-grams with the query.
+
+        Args:
+            processed_query (str): Query after default_process.
+
+        Returns:
+            np.ndarray: Candidate positions, at most max_candidates of them. Every address is a candidate
+                        when the query shares no key with the index and the index is small enough to score fully.
+        """
+        hits = [self.postings[key] for key in address_ngrams(processed_query, self.ngram_size) if key in self.postings]
+        if not hits:
+            if len(self.addresses) <= self.max_candidates:
+                return np.arange(len(self.addresses))
+            return np.empty(0, dtype=np.int32)
+
+        #count shared keys per address and keep the best max_candidates
+        counts = np.bincount(np.concatenate(hits), minlength=len(self.addresses))
+        matched = np.flatnonzero(counts)
+        if len(matched) <= self.max_candidates:
+            return matched
+        top = np.argpartition(-counts[matched], self.max_candidates - 1)[:self.max_candidates]
+        return np.sort(matched[top])
+
+    def suggest_many(self, queries: List[str], limit: int = 5) -> List[List[Tuple[str, float, int]]]:
+        """
+        Suggests the closest addresses for a batch of queries.
+
+        Every (query, candidate) pair of the batch is scored in one cpdist call, which is spread over
+        `workers` threads, so a batch costs the sum of its candidate sets rather than queries x addresses.
+
+        Args:
+            queries (List[str]): The partial or full addresses typed by the user.
+            limit (int): Number of suggestions per query.
+
+        Returns:
+            List[List[Tuple[str, float, int]]]: For each query, (address, score, position) tuples, best first.
+        """
+        processed_queries = [default_process(str(query)) for query in queries]
+        candidate_sets = [self.candidates(query) for query in processed_queries]
+        pair_positions = np.concatenate(candidate_sets) if candidate_sets else np.empty(0, dtype=np.int32)
+        if len(pair_positions) == 0:
+            return [[] for _ in queries]
+
+        pair_queries = [query for query, candidate_set in zip(processed_queries, candidate_sets) for _ in range(len(candidate_set))]
+        scores = cpdist(pair_queries, [self.processed[i] for i in pair_positions], scorer=fuzz.WRatio,
+                        processor=None, workers=self.workers)
+
+        results = []
+        offset = 0
+        for candidate_set in candidate_sets:
+            row_scores = scores[offset:offset + len(candidate_set)]
+            offset += len(candidate_set)
+            #stable sort keeps the original address order among equal scores
+            best = np.argsort(-row_scores, kind="stable")[:limit]
+            results.append([(self.addresses[candidate_set[i]], float(row_scores[i]), int(candidate_set[i])) for i in best])
+        return results
+
+    def suggest(self, query: str, limit: int = 5) -> List[Tuple[str, float, int]]:
+        """
+        Suggests the closest addresses for one query.
+
+        Args:
+            query (str): The partial or full address typed by the user.
+            limit (int): Number of suggestions.
+
+        Returns:
+            List[Tuple[str, float, int]]: (address, score, position) tuples, best first.
+        """
+        return self.suggest_many([query], limit)[0]
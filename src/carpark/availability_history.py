@@ -0,0 +1,232 @@
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+HISTORY_COLUMNS = ['carpark_number', 'lot_type', 'update_datetime', 'lots_available', 'total_lots']
+#the API's update_datetime is Singapore wall time without an offset, every stored and queried time is kept that way
+HISTORY_TIMEZONE = 'Asia/Singapore'
+#one row per change, clustered on (carpark_number, lot_type, update_datetime) so window queries are range scans
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS availability (
+    carpark_number TEXT NOT NULL,
+    lot_type TEXT NOT NULL,
+    update_datetime INTEGER NOT NULL,
+    lots_available INTEGER,
+    total_lots INTEGER,
+    PRIMARY KEY (carpark_number, lot_type, update_datetime)
+) WITHOUT ROWID
+"""
+
+def to_local_timestamp(value) -> pd.Timestamp:
+    """Parses a datetime or ISO string as naive Singapore time, converting it first if it carries a timezone."""
+    value = pd.Timestamp(value)
+    return value if value.tz is None else value.tz_convert(HISTORY_TIMEZONE).tz_localize(None)
+
+def to_epoch_seconds(values) -> np.ndarray:
+    """Converts datetimes (or ISO strings) to integer seconds since the epoch, the storage format of update_datetime."""
+    values = pd.Series(values)
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values, format='ISO8601')
+    if values.dt.tz is not None:
+        values = values.dt.tz_convert(HISTORY_TIMEZONE).dt.tz_localize(None)
+    return values.to_numpy(dtype='datetime64[s]').astype('int64')
+
+def _nullable_ints(values: np.ndarray) -> List[Optional[int]]:
+    return [None if np.isnan(value) else int(value) for value in values.tolist()]
+
+class AvailabilityHistoryStore:
+    """
+    Append-only SQLite history of carpark availability.
+
+    Only changes are stored: a (carpark_number, lot_type) row is written when its lots_available or
+    total_lots differs from the last value recorded for it, so unchanged carparks cost nothing per poll.
+    The value at any time is the last row at or before it. Times are naive Singapore time like the API's
+    update_datetime; timezone-aware times passed in are converted to it.
+
+    Args:
+        db_path (str): SQLite file, created with its parent folder if missing. ":memory:" keeps the history in memory.
+    """
+    def __init__(self, db_path: str):
+        if db_path != ":memory:" and os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        # appends are frequent and small: WAL with NORMAL sync avoids an fsync per poll
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(CREATE_TABLE_SQL)
+
+        # latest recorded values per "carpark_number|lot_type" key, as arrays aligned with self._keys
+        latest = pd.read_sql_query(
+            "SELECT carpark_number, lot_type, MAX(update_datetime) AS update_datetime, lots_available, total_lots "
+            "FROM availability GROUP BY carpark_number, lot_type", self._connection)
+        self._keys = pd.Index(latest['carpark_number'].astype(str).to_numpy(dtype=object) + "|" + latest['lot_type'].astype(str).to_numpy(dtype=object))
+        self._last_update_datetime = np.array(latest['update_datetime'], dtype='int64')
+        self._last_lots_available = np.array(latest['lots_available'], dtype='float64')
+        self._last_total_lots = np.array(latest['total_lots'], dtype='float64')
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def record_snapshot(self, carparks_data_merged_df: pd.DataFrame) -> int:
+        """
+        Records the availability rows that changed since the last recorded value of their carpark and lot type.
+
+        The comparison is vectorized against the latest values kept in memory. Rows older than the latest
+        recorded time of their key are ignored, and only the first row of a repeated key is used.
+
+        Args:
+            carparks_data_merged_df (pd.DataFrame): Frame with carpark_number, lot_type, update_datetime, lots_available
+                                                    and total_lots columns, eg. the merged carpark table (typed or not).
+
+        Returns:
+            int: Number of rows written.
+        """
+        carpark_numbers = carparks_data_merged_df['carpark_number'].astype(str).to_numpy(dtype=object)
+        lot_types = carparks_data_merged_df['lot_type'].astype(str).to_numpy(dtype=object)
+        keys = pd.Index(carpark_numbers + "|" + lot_types)
+        keep = ~keys.duplicated() & carparks_data_merged_df[['carpark_number', 'lot_type', 'update_datetime']].notna().all(axis=1).to_numpy()
+        carpark_numbers, lot_types, keys = carpark_numbers[keep], lot_types[keep], keys[keep]
+        update_datetimes = to_epoch_seconds(carparks_data_merged_df['update_datetime'][keep])
+        lots_available = pd.to_numeric(carparks_data_merged_df['lots_available'][keep], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        total_lots = pd.to_numeric(carparks_data_merged_df['total_lots'][keep], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+
+        # register keys seen for the first time
+        positions = self._keys.get_indexer(keys)
+        new_keys = positions < 0
+        if new_keys.any():
+            self._keys = self._keys.append(pd.Index(keys[new_keys]))
+            self._last_update_datetime = np.append(self._last_update_datetime, np.full(new_keys.sum(), np.iinfo('int64').min))
+            self._last_lots_available = np.append(self._last_lots_available, np.full(new_keys.sum(), np.nan))
+            self._last_total_lots = np.append(self._last_total_lots, np.full(new_keys.sum(), np.nan))
+            positions = self._keys.get_indexer(keys)
+
+        # keep newer rows whose values moved, missing values compare equal to missing values
+        def moved(new, last):
+            return ~((new == last) | (np.isnan(new) & np.isnan(last)))
+        changed = (update_datetimes > self._last_update_datetime[positions]) & (
+            new_keys | moved(lots_available, self._last_lots_available[positions]) | moved(total_lots, self._last_total_lots[positions]))
+        if not changed.any():
+            return 0
+
+        rows = positions[changed]
+        self._last_update_datetime[rows] = update_datetimes[changed]
+        self._last_lots_available[rows] = lots_available[changed]
+        self._last_total_lots[rows] = total_lots[changed]
+        changed_rows = zip(carpark_numbers[changed].tolist(), lot_types[changed].tolist(),
+                           update_datetimes[changed].tolist(), _nullable_ints(lots_available[changed]), _nullable_ints(total_lots[changed]))
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO availability VALUES (?, ?, ?, ?, ?)", changed_rows)
+        return int(changed.sum())
+
+    def row_count(self) -> int:
+        """Number of stored change rows."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM availability").fetchone()[0]
+
+    def occupancy(self, carpark_number: str, start, end, lot_type: Optional[str] = None) -> pd.DataFrame:
+        """
+        Returns the availability of a carpark over a time window, one row per change.
+
+        The value in force at `start` (the last change before it) is included with its time clipped to `start`.
+
+        Args:
+            carpark_number (str): The carpark number.
+            start: Start of the window, a datetime or ISO string.
+            end: End of the window (inclusive).
+            lot_type (Optional[str]): Only this lot type. All lot types if None.
+
+        Returns:
+            pd.DataFrame: update_datetime, lot_type, lots_available, total_lots and occupancy
+                          (1 - lots_available / total_lots) columns, ordered by lot type then time.
+        """
+        start_s, end_s = to_epoch_seconds([to_local_timestamp(start), to_local_timestamp(end)]).tolist()
+        lot_type_sql = "" if lot_type is None else " AND lot_type = ?"
+        lot_type_args = () if lot_type is None else (lot_type,)
+        # the value in force at start is one index seek per lot type
+        query = f"""
+            SELECT a.lot_type, MAX(?, a.update_datetime), a.lots_available, a.total_lots
+            FROM (SELECT DISTINCT lot_type FROM availability WHERE carpark_number = ?{lot_type_sql}) t
+            JOIN availability a ON a.carpark_number = ? AND a.lot_type = t.lot_type AND a.update_datetime = (
+                SELECT MAX(update_datetime) FROM availability
+                WHERE carpark_number = ? AND lot_type = t.lot_type AND update_datetime <= ?)
+            UNION ALL
+            SELECT lot_type, update_datetime, lots_available, total_lots FROM availability
+            WHERE carpark_number = ?{lot_type_sql} AND update_datetime > ? AND update_datetime <= ?
+            ORDER BY 1, 2
+        """
+        args = (start_s, carpark_number, *lot_type_args, carpark_number, carpark_number, start_s,
+                carpark_number, *lot_type_args, start_s, end_s)
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+
+        occupancy_df = pd.DataFrame(rows, columns=['lot_type', 'update_datetime', 'lots_available', 'total_lots'])
+        occupancy_df['update_datetime'] = pd.to_datetime(occupancy_df['update_datetime'].astype('int64'), unit='s')
+        occupancy_df['lots_available'] = occupancy_df['lots_available'].astype('Int16')
+        occupancy_df['total_lots'] = occupancy_df['total_lots'].astype('Int16')
+        occupancy_df['occupancy'] = (1 - occupancy_df['lots_available'] / occupancy_df['total_lots']).astype('float64')
+        return occupancy_df[['update_datetime', 'lot_type', 'lots_available', 'total_lots', 'occupancy']]
+
+    def aggregate(self, carpark_number: str, start, end, freq: str = 'h', lot_type: Optional[str] = None) -> pd.DataFrame:
+        """
+        Downsamples the availability of a carpark into time buckets.
+
+        Each stored value holds until the next change, so the mean occupancy of a bucket is weighted
+        by how long each value was in force within it.
+
+        Args:
+            carpark_number (str): The carpark number.
+            start: Start of the window, a datetime or ISO string.
+            end: End of the window.
+            freq (str): Bucket size as a pandas frequency, 'h' for hourly or 'D' for daily.
+            lot_type (Optional[str]): Only this lot type. All lot types if None.
+
+        Returns:
+            pd.DataFrame: bucket, lot_type, mean_occupancy, min_lots_available and max_lots_available columns.
+        """
+        start, end = to_local_timestamp(start), to_local_timestamp(end)
+        occupancy_df = self.occupancy(carpark_number, start, end, lot_type)
+        aggregates = []
+        for current_lot_type, changes in occupancy_df.groupby('lot_type', sort=True):
+            # split the step function at bucket edges, then weight each piece by the time it was in force
+            edges = pd.date_range(start.floor(freq), end, freq=freq)
+            edges = edges[(edges > changes['update_datetime'].iloc[0]) & (edges < end)]
+            changes = changes.set_index('update_datetime')[['lots_available', 'occupancy']]
+            # edges take the value in force before them, changes keep their own value (even if missing)
+            steps = changes.reindex(changes.index.union(edges), method='ffill')
+            durations = np.diff(np.append(steps.index.to_numpy(), np.datetime64(end, 'ns'))) / np.timedelta64(1, 's')
+            known = steps['occupancy'].notna().to_numpy()
+            steps = steps.assign(duration=np.where(known, durations, 0.0),
+                                 weighted=np.where(known, steps['occupancy'].to_numpy(dtype='float64', na_value=np.nan) * durations, 0.0))
+            buckets = steps.groupby(steps.index.floor(freq))
+            aggregate_df = pd.DataFrame({
+                'mean_occupancy': buckets['weighted'].sum() / buckets['duration'].sum(),
+                'min_lots_available': buckets['lots_available'].min().astype('Int16'),
+                'max_lots_available': buckets['lots_available'].max().astype('Int16'),
+            })
+            aggregates.append(aggregate_df.rename_axis('bucket').reset_index().assign(lot_type=current_lot_type))
+        if not aggregates:
+            return pd.DataFrame(columns=['bucket', 'lot_type', 'mean_occupancy', 'min_lots_available', 'max_lots_available'])
+        return pd.concat(aggregates, ignore_index=True)[['bucket', 'lot_type', 'mean_occupancy', 'min_lots_available', 'max_lots_available']]
+
+    def occupancy_by_hour_of_day(self, carpark_number: str, start, end, lot_type: str = 'C') -> pd.Series:
+        """
+        Averages hourly occupancy by hour of day, eg. "how full is AM64 usually at 6pm".
+
+        Args:
+            carpark_number (str): The carpark number.
+            start: Start of the window, a datetime or ISO string.
+            end: End of the window.
+            lot_type (str): The lot type.
+
+        Returns:
+            pd.Series: Mean occupancy (0-1) indexed by hour of day (0-23). Hours without a known occupancy, eg. while
+                       total_lots was missing, are left out.
+        """
+        hourly_df = self.aggregate(carpark_number, start, end, 'h', lot_type)
+        return hourly_df.groupby(hourly_df['bucket'].dt.hour)['mean_occupancy'].mean().dropna().rename_axis('hour')
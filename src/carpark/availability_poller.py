@@ -0,0 +1,125 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+import pandas as pd
+from carpark.carpark_index import build_carpark_index, update_carpark_index
+from carpark.get_carparks_data import refresh_carparks_availability
+from carpark.availability_history import AvailabilityHistoryStore
+
+@dataclass(frozen=True)
+class CarparkSnapshot:
+    """An immutable view of carpark availability. Readers keep using a snapshot while a newer one is built."""
+    carparks_data_merged_df: pd.DataFrame
+    carpark_index: Dict
+    version: int
+    fetched_at: float
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.fetched_at
+
+class CarparkAvailabilityPoller:
+    """
+    Polls the carpark availability API on a background thread and publishes copy-on-write snapshots.
+
+    Each poll applies the availability payload to a copy of the current snapshot's DataFrame and index,
+    then swaps the new snapshot in with a single reference assignment, so readers never block on network
+    I/O or see a half-applied update. Failed polls back off exponentially (with jitter) up to max_backoff.
+
+    Args:
+        carparks_data_merged_df (pd.DataFrame): The merged carpark DataFrame from get_carparks_data.
+        CARPARKS_API_URL (str): The URL of the API endpoint providing real-time carpark availability data.
+        poll_interval (float): Seconds between successful polls.
+        max_backoff (float): Upper bound in seconds of the delay after failed polls.
+        history_store (Optional[AvailabilityHistoryStore]): If given, the initial table and every change found by a poll are recorded in it.
+    """
+    def __init__(self, carparks_data_merged_df: pd.DataFrame, CARPARKS_API_URL: str, poll_interval: float = 60, max_backoff: float = 600,
+                 history_store: Optional[AvailabilityHistoryStore] = None):
+        self.CARPARKS_API_URL = CARPARKS_API_URL
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.history_store = history_store
+        if history_store is not None:
+            history_store.record_snapshot(carparks_data_merged_df)
+        self.consecutive_failures = 0
+        self.last_error: Optional[str] = None
+        self._snapshot = CarparkSnapshot(carparks_data_merged_df, build_carpark_index(carparks_data_merged_df), 1, time.time())
+        self._poll_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> CarparkSnapshot:
+        """The latest published snapshot."""
+        return self._snapshot
+
+    def poll_once(self) -> Set[str]:
+        """
+        Fetches availability once and publishes a new snapshot.
+
+        Returns:
+            Set[str]: The carpark numbers whose availability changed.
+
+        Raises:
+            RuntimeError: If the availability payload could not be fetched or applied.
+        """
+        with self._poll_lock:
+            current = self._snapshot
+            carparks_data_merged_df = current.carparks_data_merged_df.copy()
+            updated_carpark_numbers = refresh_carparks_availability(carparks_data_merged_df, self.CARPARKS_API_URL)
+            if updated_carpark_numbers:
+                carpark_index = {key: dict(records) for key, records in current.carpark_index.items()}
+                update_carpark_index(carpark_index, carparks_data_merged_df, updated_carpark_numbers)
+                if self.history_store is not None:
+                    self.history_store.record_snapshot(carparks_data_merged_df[carparks_data_merged_df['carpark_number'].isin(updated_carpark_numbers)])
+                self._snapshot = CarparkSnapshot(carparks_data_merged_df, carpark_index, current.version + 1, time.time())
+            else:
+                self._snapshot = CarparkSnapshot(current.carparks_data_merged_df, current.carpark_index, current.version, time.time())
+            return updated_carpark_numbers
+
+    def backoff_seconds(self) -> float:
+        """Delay before the next poll without jitter: the poll interval, doubled per consecutive failure."""
+        if self.consecutive_failures == 0:
+            return self.poll_interval
+        return min(self.poll_interval * 2 ** self.consecutive_failures, self.max_backoff)
+
+    def next_delay(self) -> float:
+        """Seconds until the next poll, with jitter applied after failures."""
+        if self.consecutive_failures == 0:
+            return self.poll_interval
+        return self.backoff_seconds() * random.uniform(0.8, 1.0)
+
+    def _run(self):
+        while not self._stop_event.wait(self.next_delay()):
+            try:
+                self.poll_once()
+                self.consecutive_failures = 0
+                self.last_error = None
+            except Exception as e:
+                self.consecutive_failures += 1
+                self.last_error = str(e)
+
+    def start(self) -> None:
+        """Starts polling on a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="carpark-availability-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the polling thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def status(self) -> str:
+        """One-line summary of the snapshot age, poll interval and backoff state."""
+        snapshot = self._snapshot
+        status = f"Snapshot v{snapshot.version}, {snapshot.age_seconds:.0f}s old, polling every {self.poll_interval:.0f}s"
+        if self.consecutive_failures:
+            status += f", {self.consecutive_failures} failed poll(s), backing off {self.backoff_seconds():.0f}s ({self.last_error})"
+        return status
@@ -0,0 +1,103 @@
+import math
+import pandas as pd
+from typing import Dict, Iterable, List
+
+def normalize_address(address) -> str:
+    """
+    Normalizes an address for lookups by upper-casing it and collapsing whitespace.
+
+    Args:
+        address: The address to normalize.
+
+    Returns:
+        str: The normalized address.
+    """
+    return " ".join(str(address).upper().split())
+
+def _json_value(value):
+    """Converts values of the typed carpark table that json cannot encode (timestamps, and NaT, NA or NaN as None)."""
+    if value is pd.NaT or value is pd.NA or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+def _coordinate(value):
+    """Rounds a coordinate to the centimetre, so float32 columns print like the source csv. Missing coordinates are None."""
+    value = _json_value(value)
+    return round(value, 2) if isinstance(value, float) else value
+
+def build_carpark_record(carpark_rows: List[Dict]) -> Dict:
+    """
+    Builds the result record of one carpark from its per-lot-type rows.
+
+    Args:
+        carpark_rows (List[Dict]): Rows of the merged carpark DataFrame for a single carpark, as dicts.
+
+    Returns:
+        dict: The carpark information, with total and available lots keyed by lot type.
+    """
+    first_row = carpark_rows[0]
+    record = {
+        "update_time": _json_value(first_row['update_datetime']),
+        "total_lots": {},
+        "lots_available": {},
+        "lot_types": list(dict.fromkeys(row['lot_type'] for row in carpark_rows)),
+        "type_of_parking_system": _json_value(first_row['type_of_parking_system']),
+        "short_term_parking": _json_value(first_row['short_term_parking']),
+        "night_parking": _json_value(first_row['night_parking']),
+        "free_parking": _json_value(first_row['free_parking']),
+        "x_coord": _coordinate(first_row['x_coord']),
+        "y_coord": _coordinate(first_row['y_coord']),
+        "address": first_row['address']
+    }
+    for row in carpark_rows:
+        record["total_lots"][row['lot_type']] = _json_value(row['total_lots'])
+        record["lots_available"][row['lot_type']] = _json_value(row['lots_available'])
+    return record
+
+def build_carpark_index(carparks_data_merged_df: pd.DataFrame) -> Dict[str, Dict[str, Dict]]:
+    """
+    Builds an in-memory lookup index over the merged carpark DataFrame.
+
+    The DataFrame is walked once, and every carpark is turned into a prebuilt record holding its
+    per-lot-type totals and availability, so lookups are a dict access instead of a full scan.
+
+    Args:
+        carparks_data_merged_df (pd.DataFrame): The merged carpark DataFrame from get_carparks_data.
+
+    Returns:
+        dict: {"carpark_number": {carpark_number: record}, "address": {normalized address: record}}.
+              If several carparks share an address, the first one is indexed for it.
+    """
+    rows_by_carpark = {}
+    for row in carparks_data_merged_df.to_dict('records'):
+        rows_by_carpark.setdefault(row['carpark_number'], []).append(row)
+
+    carpark_index = {"carpark_number": {}, "address": {}}
+    for carpark_number, carpark_rows in rows_by_carpark.items():
+        record = build_carpark_record(carpark_rows)
+        carpark_index["carpark_number"][carpark_number] = record
+        carpark_index["address"].setdefault(normalize_address(record["address"]), record)
+    return carpark_index
+
+def update_carpark_index(carpark_index: Dict[str, Dict[str, Dict]], carparks_data_merged_df: pd.DataFrame, carpark_numbers: Iterable[str]) -> None:
+    """
+    Rebuilds the index records of the given carparks in place, e.g. after an availability refresh.
+
+    Args:
+        carpark_index (dict): Index from build_carpark_index, updated in place.
+        carparks_data_merged_df (pd.DataFrame): The merged carpark DataFrame the index was built from.
+        carpark_numbers (Iterable[str]): Carpark numbers whose rows have changed.
+    """
+    carpark_numbers = set(carpark_numbers)
+    if not carpark_numbers:
+        return
+    changed_df = carparks_data_merged_df[carparks_data_merged_df['carpark_number'].isin(carpark_numbers)]
+    for carpark_number, record in build_carpark_index(changed_df)["carpark_number"].items():
+        old_record = carpark_index["carpark_number"].get(carpark_number)
+        carpark_index["carpark_number"][carpark_number] = record
+        address = normalize_address(record["address"])
+        indexed_record = carpark_index["address"].get(address)
+        if indexed_record is None or indexed_record is old_record:
+            carpark_index["address"][address] = record
@@ -0,0 +1,232 @@
+import math
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from carpark.carpark_index import normalize_address
+
+GRID_CELL_SIZE_M = 500.0
+
+def has_available_lots(record: Dict, lot_type: Optional[str], min_available: int = 1) -> bool:
+    """
+    Checks whether a carpark record has at least min_available free lots of a lot type.
+
+    Args:
+        record (dict): Carpark record from build_carpark_index.
+        lot_type (Optional[str]): Lot type to check (eg. "C"). If None, the check always passes.
+        min_available (int): Minimum number of free lots.
+
+    Returns:
+        bool: True if the carpark qualifies.
+    """
+    if lot_type is None:
+        return True
+    lots_available = record["lots_available"].get(lot_type)
+    try:
+        return lots_available is not None and int(lots_available) >= min_available
+    except (TypeError, ValueError):
+        return False
+
+def matches_filters(record: Dict, lot_type: Optional[str] = None, free_parking: bool = False, night_parking: bool = False) -> bool:
+    """
+    Applies the nearby-search filters to one carpark record.
+
+    Args:
+        record (dict): Carpark record from build_carpark_index.
+        lot_type (Optional[str]): Only keep carparks with available lots of this type.
+        free_parking (bool): Only keep carparks offering free parking (free_parking other than "NO").
+        night_parking (bool): Only keep carparks offering night parking (night_parking "YES").
+
+    Returns:
+        bool: True if the carpark passes every filter.
+    """
+    if free_parking and str(record["free_parking"]).upper() in ("NO", "NAN", "NONE", ""):
+        return False
+    if night_parking and str(record["night_parking"]).upper() != "YES":
+        return False
+    return has_available_lots(record, lot_type)
+
+def address_location(carpark_index: Dict[str, Dict[str, Dict]], address: str) -> Optional[Tuple[float, float]]:
+    """
+    Returns the SVY21 coordinates of the carpark at an address, to use as the point of a nearby search.
+
+    Args:
+        carpark_index (dict): Index from build_carpark_index.
+        address (str): Full address, matched after normalize_address.
+
+    Returns:
+        Optional[Tuple[float, float]]: (x, y), or None if the address is unknown or has no coordinates.
+    """
+    record = carpark_index["address"].get(normalize_address(address))
+    if record is None:
+        return None
+    try:
+        x, y = float(record["x_coord"]), float(record["y_coord"])
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(x) or math.isnan(y):
+        return None
+    return x, y
+
+class CarparkSpatialIndex:
+    """
+    Grid-bucket index over carpark SVY21 coordinates.
+
+    Carparks are bucketed into square cells once. A query only measures the distance to carparks in the
+    cells around the point, growing ring by ring for nearest-k queries. Coordinates do not change between
+    availability polls, so the index holds positions only; availability and parking filters are read from
+    the current carpark index records at query time.
+    """
+    def __init__(self, carpark_index: Dict[str, Dict[str, Dict]], cell_size: float = GRID_CELL_SIZE_M):
+        """
+        Args:
+            carpark_index (dict): Index from build_carpark_index. Carparks without coordinates are skipped.
+            cell_size (float): Side of a grid cell in metres.
+        """
+        carpark_numbers, xs, ys = [], [], []
+        for carpark_number, record in carpark_index["carpark_number"].items():
+            try:
+                x, y = float(record["x_coord"]), float(record["y_coord"])
+            except (TypeError, ValueError):
+                continue
+            if math.isnan(x) or math.isnan(y):
+                continue
+            carpark_numbers.append(carpark_number)
+            xs.append(x)
+            ys.append(y)
+
+        self.cell_size = cell_size
+        self.carpark_numbers = carpark_numbers
+        self.xs = np.array(xs, dtype=np.float64)
+        self.ys = np.array(ys, dtype=np.float64)
+
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for position, cell in enumerate(zip(self._cells(self.xs), self._cells(self.ys))):
+            buckets.setdefault(cell, []).append(position)
+        self.buckets: Dict[Tuple[int, int], np.ndarray] = {cell: np.array(ids) for cell, ids in buckets.items()}
+        if buckets:
+            cells = np.array(list(buckets))
+            self.cell_min, self.cell_max = cells.min(axis=0), cells.max(axis=0)
+
+    def __len__(self) -> int:
+        return len(self.carpark_numbers)
+
+    def _cells(self, coords: np.ndarray) -> List[int]:
+        return np.floor(coords / self.cell_size).astype(np.int64).tolist()
+
+    def _ring(self, center: Tuple[int, int], ring: int) -> np.ndarray:
+        """Positions of the carparks in the cells exactly `ring` cells away from center (Chebyshev distance)."""
+        cx, cy = center
+        if ring == 0:
+            cells = [(cx, cy)]
+        else:
+            cells = [(cx + dx, cy + dy) for dx in range(-ring, ring + 1) for dy in (-ring, ring)]
+            cells += [(cx + dx, cy + dy) for dx in (-ring, ring) for dy in range(-ring + 1, ring)]
+        found = [self.buckets[cell] for cell in cells if cell in self.buckets]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def _max_ring(self, center: Tuple[int, int]) -> int:
+        """Ring beyond which no bucket exists."""
+        return int(max(abs(center[0] - self.cell_min[0]), abs(center[0] - self.cell_max[0]),
+                       abs(center[1] - self.cell_min[1]), abs(center[1] - self.cell_max[1])))
+
+    def _results(self, positions: np.ndarray, distances: np.ndarray, carpark_index: Dict, filters: Dict,
+                 limit: Optional[int] = None) -> List[Tuple[str, Dict, float]]:
+        results = []
+        for i in np.argsort(distances, kind="stable"):
+            carpark_number = self.carpark_numbers[positions[i]]
+            record = carpark_index["carpark_number"].get(carpark_number)
+            if record is None or not matches_filters(record, **filters):
+                continue
+            results.append((carpark_number, record, float(distances[i])))
+            if limit is not None and len(results) == limit:
+                break
+        return results
+
+    def nearest(self, x: float, y: float, carpark_index: Dict, k: int = 5, lot_type: Optional[str] = None,
+                free_parking: bool = False, night_parking: bool = False) -> List[Tuple[str, Dict, float]]:
+        """
+        Finds the k nearest carparks to a point that pass the filters.
+
+        Rings of cells are added around the point until k qualifying carparks are known to be closer
+        than anything in the cells not yet searched.
+
+        Args:
+            x (float): SVY21 x coordinate of the point.
+            y (float): SVY21 y coordinate of the point.
+            carpark_index (dict): Current index from build_carpark_index, read for availability and filters.
+            k (int): Number of carparks to return.
+            lot_type (Optional[str]): Only return carparks with available lots of this type.
+            free_parking (bool): Only return carparks offering free parking.
+            night_parking (bool): Only return carparks offering night parking.
+
+        Returns:
+            List[Tuple[str, dict, float]]: (carpark_number, record, distance in metres), nearest first.
+        """
+        if not self.buckets or k <= 0:
+            return []
+        filters = {"lot_type": lot_type, "free_parking": free_parking, "night_parking": night_parking}
+        center = (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+        max_ring = self._max_ring(center)
+        searched = []
+        for ring in range(max_ring + 1):
+            searched.append(self._ring(center, ring))
+            positions = np.concatenate(searched)
+            if ring < max_ring:
+                #everything within ring * cell_size of the point has been searched
+                covered = ring * self.cell_size
+                distances = np.hypot(self.xs[positions] - x, self.ys[positions] - y)
+                inside = distances <= covered
+                if inside.sum() < k:
+                    continue
+                results = self._results(positions[inside], distances[inside], carpark_index, filters, k)
+                if len(results) == k:
+                    return results
+        positions = np.concatenate(searched)
+        distances = np.hypot(self.xs[positions] - x, self.ys[positions] - y)
+        return self._results(positions, distances, carpark_index, filters, k)
+
+    def within_radius(self, x: float, y: float, radius: float, carpark_index: Dict, lot_type: Optional[str] = None,
+                      free_parking: bool = False, night_parking: bool = False) -> List[Tuple[str, Dict, float]]:
+        """
+        Finds every carpark within a radius of a point that passes the filters.
+
+        Args:
+            x (float): SVY21 x coordinate of the point.
+            y (float): SVY21 y coordinate of the point.
+            radius (float): Search radius in metres.
+            carpark_index (dict): Current index from build_carpark_index, read for availability and filters.
+            lot_type (Optional[str]): Only return carparks with available lots of this type.
+            free_parking (bool): Only return carparks offering free parking.
+            night_parking (bool): Only return carparks offering night parking.
+
+        Returns:
+            List[Tuple[str, dict, float]]: (carpark_number, record, distance in metres), nearest first.
+        """
+        if not self.buckets or radius < 0:
+            return []
+        filters = {"lot_type": lot_type, "free_parking": free_parking, "night_parking": night_parking}
+        center = (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+        rings = min(int(math.ceil(radius / self.cell_size)), self._max_ring(center))
+        positions = np.concatenate([self._ring(center, ring) for ring in range(rings + 1)])
+        distances = np.hypot(self.xs[positions] - x, self.ys[positions] - y)
+        inside = distances <= radius
+        return self._results(positions[inside], distances[inside], carpark_index, filters)
+
+def nearby_carparks_to_records(results: List[Tuple[str, Dict, float]]) -> List[Dict]:
+    """
+    Formats nearby-search results for display, adding the distance to each record.
+
+    Args:
+        results (List[Tuple[str, dict, float]]): Output of nearest or within_radius.
+
+    Returns:
+        List[dict]: carpark_number, address, distance_m, lots_available and the parking flags per carpark.
+    """
+    return [{
+        "carpark_number": carpark_number,
+        "address": record["address"],
+        "distance_m": round(distance, 1),
+        "lots_available": record["lots_available"],
+        "total_lots": record["total_lots"],
+        "free_parking": record["free_parking"],
+        "night_parking": record["night_parking"],
+    } for carpark_number, record, distance in results]
@@ -1,24 +1,44 @@
 from utils.load_url_response import load_json_url_response
-from utils.load_data_to_df import load_json_to_df, load_file_to_df
+from utils.http_client import NOT_MODIFIED
+from utils.load_data_to_df import load_file_to_df
 from utils.merge_data import merge_data
+from utils.apply_schema import apply_schema, memory_usage_mb
 import pandas as pd
 import numpy as np
 from rich.console import Console
-from typing import Dict
+from typing import Dict, List, Optional, Set
 console = Console()
+AVAILABILITY_COLUMNS = ['update_datetime', 'total_lots', 'lots_available']
+#compact dtypes for the merged carpark table, columns not listed keep their loaded dtype
+CARPARK_SCHEMA = {
+    'update_datetime': 'datetime64[ns]',
+    'total_lots': 'Int16',
+    'lots_available': 'Int16',
+    'lot_type': 'category',
+    'x_coord': 'float32',
+    'y_coord': 'float32',
+    'car_park_type': 'category',
+    'type_of_parking_system': 'category',
+    'short_term_parking': 'category',
+    'free_parking': 'category',
+    'night_parking': 'category',
+    'car_park_decks': 'Int8',
+    'gantry_height': 'float32',
+    'car_park_basement': 'category',
+}
 
 import numpy as np
  #func to extract start and end dates of events in df
 def extract_carpark_info(carpark_info:Dict):
     """
-    Extracts the start and end dates, title, and event ID from event details.
+    Extracts the total lots, lot type and available lots from one carpark_info entry.
 
     Args:
-        event_details (dict): A dictionary containing event information.
+        carpark_info (dict): One entry of a carpark's carpark_info list.
 
     Returns:
-        tuple: A tuple containing (start_date, end_date, title, event_id). 
-               If dates are missing or invalid, returns 'NA' instead.
+        tuple: A tuple containing (total_lots, lot_type, lots_available).
+               If the entry is not a dict, returns NaN instead.
     """
     try:
         if isinstance(carpark_info, dict):
@@ -29,13 +49,80 @@ def extract_carpark_info(carpark_info:Dict):
         return np.nan, np.nan, np.nan
     except (ValueError, TypeError):
         return np.nan, np.nan, np.nan
-def get_carparks_data(CARPARKS_API_URL: str, CARPARK_STATIC_CSV_URL: str) -> pd.DataFrame:
+def flatten_carpark_data(carpark_data: List[Dict]) -> pd.DataFrame:
+    """
+    Flattens the carpark_data list of an availability payload to one row per carpark and lot type.
+
+    The payload is walked once into parallel column lists, so no per-row Series is built. A carpark
+    with an empty or missing carpark_info list keeps one row with missing lot values, as explode would.
+
+    Args:
+        carpark_data (List[Dict]): items[0].carpark_data of the data.gov.sg availability payload.
+
+    Returns:
+        pd.DataFrame: carpark_number, update_datetime, total_lots, lot_type and lots_available columns,
+                      indexed by the position of the carpark in carpark_data.
+    """
+    positions, carpark_numbers, update_datetimes = [], [], []
+    total_lots, lot_types, lots_available = [], [], []
+    for position, carpark in enumerate(carpark_data):
+        carpark_info = carpark.get('carpark_info')
+        if isinstance(carpark_info, dict):
+            carpark_info = [carpark_info]
+        elif not isinstance(carpark_info, list) or not carpark_info:
+            carpark_info = [None]
+        for info in carpark_info:
+            positions.append(position)
+            carpark_numbers.append(carpark.get('carpark_number', np.nan))
+            update_datetimes.append(carpark.get('update_datetime', np.nan))
+            if isinstance(info, dict):
+                total_lots.append(info.get('total_lots'))
+                lot_types.append(info.get('lot_type'))
+                lots_available.append(info.get('lots_available'))
+            else:
+                total_lots.append(np.nan)
+                lot_types.append(np.nan)
+                lots_available.append(np.nan)
+    return pd.DataFrame({
+        'carpark_number': carpark_numbers,
+        'update_datetime': update_datetimes,
+        'total_lots': total_lots,
+        'lot_type': lot_types,
+        'lots_available': lots_available,
+    }, index=positions)
+
+def load_carpark_availability_df(CARPARKS_API_URL: str, conditional: bool = False) -> Optional[pd.DataFrame]:
+    """
+    Fetches the real-time carpark availability payload and flattens it to one row per carpark and lot type.
+
+    Args:
+        CARPARKS_API_URL (str): The URL of the API endpoint providing real-time carpark availability data in JSON format.
+        conditional (bool): Send a conditional GET, returning None if the payload has not changed since the last fetch.
+
+    Returns:
+        pd.DataFrame: A DataFrame with carpark_number, update_datetime, total_lots, lot_type and lots_available columns,
+                      or None if the payload was not modified.
+    """
+    # Get API response
+    response = load_json_url_response(CARPARKS_API_URL, conditional=conditional)
+    if response is NOT_MODIFIED:
+        return None
+
+    # Extract carpark data
+    items = response.get('items')
+    carpark_data = items[0].get('carpark_data')
+    return flatten_carpark_data(carpark_data)
+
+def get_carparks_data(CARPARKS_API_URL: str, CARPARK_STATIC_CSV_URL: str, CARPARK_SCHEMA: Optional[Dict[str, str]] = CARPARK_SCHEMA) -> pd.DataFrame:
     """
     Fetches and processes carpark availability data from an API and merges it with static carpark information from a CSV.
 
     Args:
         CARPARKS_API_URL (str): The URL of the API endpoint providing real-time carpark availability data in JSON format.
         CARPARK_STATIC_CSV_URL (str): The URL or file path of the CSV file containing static carpark information.
+        CARPARK_SCHEMA (Optional[Dict[str, str]]): Column dtypes applied after cleaning, see utils.apply_schema.
+                                                   Lot counts become nullable small ints, repeated strings categoricals,
+                                                   coordinates float32 and update_datetime a datetime. None keeps the loaded dtypes.
 
     Returns:
         pd.DataFrame: A pandas DataFrame containing the merged carpark data, with real-time availability and static information.
@@ -45,15 +132,7 @@ def get_carparks_data(CARPARKS_API_URL: str, CARPARK_STATIC_CSV_URL: str) -> pd.
         Exception: If there are issues loading data from the API or CSV, or during the merging process.
     """
     try:
-        # Get API response
-        response = load_json_url_response(CARPARKS_API_URL)
-
-        # Extract carpark data
-        items = response.get('items')
-        carpark_data = items[0].get('carpark_data')
-        carpark_data_df = load_json_to_df(carpark_data)
-        carpark_data_df = carpark_data_df.explode('carpark_info')
-        carpark_data_df[['total_lots', 'lot_type', 'lots_available']] = carpark_data_df['carpark_info'].apply(lambda carpark_info: pd.Series(extract_carpark_info(carpark_info)))
+        carpark_data_df = load_carpark_availability_df(CARPARKS_API_URL)
 
         # Load static carparks data from CSV
         static_carparks_df = load_file_to_df(CARPARK_STATIC_CSV_URL)
@@ -69,9 +148,16 @@ def get_carparks_data(CARPARKS_API_URL: str, CARPARK_STATIC_CSV_URL: str) -> pd.
         # Check missing values
         missing_values = carpark_data_merged_df.isnull().sum()
 
-        # Remove trailing spaces from object columns
-        for col in carpark_data_merged_df.select_dtypes(include=['object']).columns:
-            carpark_data_merged_df[col] = carpark_data_merged_df[col].str.strip()
+        # Remove trailing spaces from text columns
+        for col in carpark_data_merged_df.columns:
+            if carpark_data_merged_df[col].dtype == object or pd.api.types.is_string_dtype(carpark_data_merged_df[col]):
+                carpark_data_merged_df[col] = carpark_data_merged_df[col].str.strip()
+
+        # Cast to compact dtypes
+        if CARPARK_SCHEMA is not None:
+            memory_before = memory_usage_mb(carpark_data_merged_df)
+            carpark_data_merged_df = apply_schema(carpark_data_merged_df, CARPARK_SCHEMA)
+            console.print(f"[dim]Carpark table memory: {memory_before:.2f} MB -> {memory_usage_mb(carpark_data_merged_df):.2f} MB after typing[/dim]")
 
         # Print data summary (optional)
         # print("Missing Values and Data Types per Column:")
@@ -81,4 +167,64 @@ def get_carparks_data(CARPARKS_API_URL: str, CARPARK_STATIC_CSV_URL: str) -> pd.
         return carpark_data_merged_df
 
     except Exception as e:
-        raise RuntimeError(f"Failed to process carpark data: {e}")
\ No newline at end of file
+        raise RuntimeError(f"Failed to process carpark data: {e}")
+
+def apply_carpark_availability(carparks_data_merged_df: pd.DataFrame, carpark_data_df: pd.DataFrame) -> Set[str]:
+    """
+    Applies an availability snapshot to the merged carpark DataFrame as a keyed in-place update.
+
+    Rows are matched on (carpark_number, lot_type). Only rows whose update_datetime differs from
+    the snapshot are written, and only the availability columns are touched, so the static
+    information never has to be re-merged. Carparks or lot types missing from the merged
+    DataFrame are ignored.
+
+    Args:
+        carparks_data_merged_df (pd.DataFrame): The merged carpark DataFrame from get_carparks_data, updated in place.
+        carpark_data_df (pd.DataFrame): Availability rows, as returned by load_carpark_availability_df.
+
+    Returns:
+        Set[str]: The carpark numbers whose availability was updated.
+    """
+    new_values = {col: carpark_data_df[col].astype(str).str.strip().to_numpy() for col in ['carpark_number', 'lot_type']}
+    # cast the incoming availability to the dtypes of the (possibly typed) merged table
+    availability_df = apply_schema(carpark_data_df[AVAILABILITY_COLUMNS].assign(update_datetime=carpark_data_df['update_datetime'].astype(str).str.strip()),
+                                   {col: str(carparks_data_merged_df[col].dtype) for col in AVAILABILITY_COLUMNS})
+    merged_keys = pd.MultiIndex.from_arrays([carparks_data_merged_df['carpark_number'], carparks_data_merged_df['lot_type']])
+    first_positions = np.flatnonzero(~merged_keys.duplicated())
+    positions = merged_keys[first_positions].get_indexer(pd.MultiIndex.from_arrays([new_values['carpark_number'], new_values['lot_type']]))
+    positions = np.where(positions >= 0, first_positions[positions], -1)
+
+    # keep matched rows whose update time moved
+    matched = positions >= 0
+    current_update_datetime = carparks_data_merged_df['update_datetime'].to_numpy()[positions[matched]]
+    changed = np.flatnonzero(matched)[current_update_datetime != availability_df['update_datetime'].to_numpy()[matched]]
+    if len(changed) == 0:
+        return set()
+
+    rows = positions[changed]
+    for col in AVAILABILITY_COLUMNS:
+        carparks_data_merged_df.iloc[rows, carparks_data_merged_df.columns.get_loc(col)] = availability_df[col].array[changed]
+    return set(new_values['carpark_number'][changed])
+
+def refresh_carparks_availability(carparks_data_merged_df: pd.DataFrame, CARPARKS_API_URL: str) -> Set[str]:
+    """
+    Fetches only the availability payload and applies it to the resident merged carpark DataFrame.
+    A conditional GET is used, so an unchanged payload is neither downloaded nor parsed again.
+
+    Args:
+        carparks_data_merged_df (pd.DataFrame): The merged carpark DataFrame from get_carparks_data, updated in place.
+        CARPARKS_API_URL (str): The URL of the API endpoint providing real-time carpark availability data in JSON format.
+
+    Returns:
+        Set[str]: The carpark numbers whose availability was updated.
+
+    Raises:
+        RuntimeError: If the availability payload could not be fetched or applied.
+    """
+    try:
+        carpark_data_df = load_carpark_availability_df(CARPARKS_API_URL, conditional=True)
+        if carpark_data_df is None:
+            return set()
+        return apply_carpark_availability(carparks_data_merged_df, carpark_data_df)
+    except Exception as e:
+        raise RuntimeError(f"Failed to refresh carpark availability: {e}")
@@ -0,0 +1,100 @@
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional
+
+RESULT_CACHE_SIZE = 4096
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A query result serialized once: indented JSON for the CLI and compact JSON bytes for machine callers."""
+    record: Dict
+    pretty: str
+    compact: bytes
+
+def serialize_result(record: Dict) -> CachedResult:
+    return CachedResult(record, json.dumps(record, indent=4), json.dumps(record, separators=(",", ":")).encode())
+
+class CarparkResultCache:
+    """
+    Bounded LRU cache of serialized carpark query results, keyed by (query, snapshot version).
+
+    Results are only valid for the availability snapshot they were built from. The first lookup with a newer
+    snapshot version drops every entry, so stale availability is never served and old versions do not take
+    up room. Lookups that find nothing are not cached.
+
+    Args:
+        maxsize (int): Maximum number of cached results, the least recently used is evicted first.
+    """
+    def __init__(self, maxsize: int = RESULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.version: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Hashable, CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _invalidate_older(self, version: int) -> bool:
+        """Drops every entry if `version` is newer than the cached one. Returns False if `version` is older."""
+        if self.version is None or version > self.version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.version = version
+        return version == self.version
+
+    def get(self, query: Hashable, version: int, build: Callable[[], Optional[Dict]]) -> Optional[CachedResult]:
+        """
+        Returns the cached result of a query, building and serializing it on a miss.
+
+        Args:
+            query (Hashable): The query key, eg. ("carpark_number", "AM64").
+            version (int): Version of the snapshot `build` reads from.
+            build (Callable[[], Optional[dict]]): Returns the result record, or None if the query matches nothing.
+
+        Returns:
+            Optional[CachedResult]: The serialized result, or None if build returned None.
+        """
+        with self._lock:
+            current = self._invalidate_older(version)
+            entry = self._entries.get(query) if current else None
+            if entry is not None:
+                self._entries.move_to_end(query)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        record = build()
+        if record is None:
+            return None
+        entry = serialize_result(record)
+        with self._lock:
+            #a reader still holding an older snapshot must not fill the cache for the newer one
+            if self._invalidate_older(version):
+                self._entries[query] = entry
+                self._entries.move_to_end(query)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def carpark_by_number(self, carpark_index: Dict, version: int, carpark_number: str) -> Optional[CachedResult]:
+        """Cached lookup of a carpark number in a carpark index of the given snapshot version."""
+        return self.get(("carpark_number", carpark_number), version, lambda: carpark_index["carpark_number"].get(carpark_number))
+
+    def carpark_by_address(self, carpark_index: Dict, version: int, normalized_address: str) -> Optional[CachedResult]:
+        """Cached lookup of a normalized address in a carpark index of the given snapshot version."""
+        return self.get(("address", normalized_address), version, lambda: carpark_index["address"].get(normalized_address))
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict:
+        """Counters for monitoring: hits, misses, hit_rate, invalidations, size and the snapshot version cached."""
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hit_rate(), 4),
+                "invalidations": self.invalidations, "size": len(self._entries), "version": self.version}
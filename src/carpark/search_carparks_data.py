@@ -1,82 +1,77 @@
 import pandas as pd
 import json
+from typing import Dict, Optional
 from rich.prompt import Prompt
 from rich.table import Table
-from fuzzywuzzy import process
 from rich.console import Console
+from carpark.carpark_index import build_carpark_record, normalize_address
+from carpark.address_index import AddressIndex
+from carpark.result_cache import CarparkResultCache
 console = Console()
-def search_carparks_data_from_cp_num(carparks_data_merged_df:pd.DataFrame, carpark_number:str):
+def search_carparks_data_from_cp_num(carparks_data_merged_df:pd.DataFrame, carpark_number:str, carpark_index:Optional[Dict]=None,
+                                     result_cache:Optional[CarparkResultCache]=None, snapshot_version:int=0):
     """
     Retrieves information for a given carpark number and returns it as a JSON object.
 
     Args:
         df (pd.DataFrame): The DataFrame containing carpark information.
         carpark_number (str): The carpark number to retrieve information for.
+        carpark_index (Optional[Dict]): Prebuilt index from build_carpark_index. If provided, the lookup
+                                        is served from it instead of scanning the DataFrame.
+        result_cache (Optional[CarparkResultCache]): If provided with carpark_index, repeated lookups against the
+                                                     same snapshot return the already serialized JSON.
+        snapshot_version (int): Version of the snapshot carpark_index belongs to, used as part of the cache key.
 
     Returns:
         str: A JSON string containing the carpark information, or None if the carpark number is not found.
     """
+    if carpark_index is not None and result_cache is not None:
+        cached = result_cache.carpark_by_number(carpark_index, snapshot_version, carpark_number)
+        return "Carpark Number does not exist" if cached is None else cached.pretty
+    if carpark_index is not None:
+        record = carpark_index["carpark_number"].get(carpark_number)
+        if record is None:
+            return "Carpark Number does not exist"
+        return json.dumps(record, indent=4)
+
     carpark_data = carparks_data_merged_df[carparks_data_merged_df['carpark_number'] == carpark_number]
     if carpark_data.empty:  
         return "Carpark Number does not exist"
-    
-    result = {
-        "update_time":carpark_data['update_datetime'].iloc[0],
-        "total_lots": {},
-        "lots_available": {},
-        "lot_types": list(carpark_data['lot_type'].unique()),
-        "type_of_parking_system": carpark_data['type_of_parking_system'].iloc[0],
-        "short_term_parking": carpark_data['short_term_parking'].iloc[0],
-        "night_parking": carpark_data['night_parking'].iloc[0],
-        "free_parking": carpark_data['free_parking'].iloc[0],
-        "x_coord": carpark_data['x_coord'].iloc[0],
-        "y_coord": carpark_data['y_coord'].iloc[0],
-        "address": carpark_data['address'].iloc[0]
-    }
-
-    for index, row in carpark_data.iterrows():
-        lot_type = row['lot_type']
-        result["total_lots"][lot_type] = row['total_lots']
-        result["lots_available"][lot_type] = row['lots_available']
-
-    return json.dumps(result, indent=4)
-def search_carparks_data_from_address(carparks_data_merged_df:pd.DataFrame, address:str):
+
+    return json.dumps(build_carpark_record(carpark_data.to_dict('records')), indent=4)
+def search_carparks_data_from_address(carparks_data_merged_df:pd.DataFrame, address:str, carpark_index:Optional[Dict]=None,
+                                      result_cache:Optional[CarparkResultCache]=None, snapshot_version:int=0):
     """
     Retrieves information for a given address and returns it as a JSON object.
 
     Args:
         df (pd.DataFrame): The DataFrame containing carpark information.
         address (str): The address to retrieve information for.
+        carpark_index (Optional[Dict]): Prebuilt index from build_carpark_index. If provided, the address
+                                        is normalized and looked up in it instead of scanning the DataFrame.
+        result_cache (Optional[CarparkResultCache]): If provided with carpark_index, repeated lookups against the
+                                                     same snapshot return the already serialized JSON.
+        snapshot_version (int): Version of the snapshot carpark_index belongs to, used as part of the cache key.
 
     Returns:
         str: A JSON string containing the carpark information, or None if the address is not found.
     """
+    if carpark_index is not None and result_cache is not None:
+        cached = result_cache.carpark_by_address(carpark_index, snapshot_version, normalize_address(address))
+        return "Address does not exist" if cached is None else cached.pretty
+    if carpark_index is not None:
+        record = carpark_index["address"].get(normalize_address(address))
+        if record is None:
+            return "Address does not exist"
+        return json.dumps(record, indent=4)
+
     carpark_data = carparks_data_merged_df[carparks_data_merged_df['address'] == address]
     if carpark_data.empty:  
         return "Address does not exist"
 
-    result = {
-        "update_time":carpark_data['update_datetime'].iloc[0],
-        "total_lots": {},
-        "lots_available": {},
-        "lot_types": list(carpark_data['lot_type'].unique()),
-        "type_of_parking_system": carpark_data['type_of_parking_system'].iloc[0],
-        "short_term_parking": carpark_data['short_term_parking'].iloc[0],
-        "night_parking": carpark_data['night_parking'].iloc[0],
-        "free_parking": carpark_data['free_parking'].iloc[0],
-        "x_coord": carpark_data['x_coord'].iloc[0],
-        "y_coord": carpark_data['y_coord'].iloc[0],
-        "address": carpark_data['address'].iloc[0]
-    }
-
-    for index, row in carpark_data.iterrows():
-        lot_type = row['lot_type']
-        result["total_lots"][lot_type] = row['total_lots']
-        result["lots_available"][lot_type] = row['lots_available']
-
-    return json.dumps(result, indent=4)
-
-def suggest_addresses(addresses, address):
+    return json.dumps(build_carpark_record(carpark_data.to_dict('records')), indent=4)
+
+def suggest_addresses(addresses, address, address_index:Optional[AddressIndex]=None):
     """
     Suggests the best matching address from a list of addresses based on a given input address.
 
@@ -87,14 +82,17 @@ def suggest_addresses(addresses, address):
     Args:
         addresses (list of str): A list of available addresses to match against.
         address (str): The address input by the user to search for matches.
+        address_index (Optional[AddressIndex]): Prebuilt fuzzy index over the same addresses. If not provided,
+                                                one is built from `addresses` for this call.
 
     Returns:
         str or None: The selected address if a valid match is found, or None if the user exits the search.
     """
-    
+    if address_index is None:
+        address_index = AddressIndex(addresses)
     while True:
         # Get top 5 closest matches
-        matches = process.extract(address, addresses, limit=5)
+        matches = address_index.suggest(address, limit=5)
         print(matches)
         # Create a table for better display
         table = Table(title="Did you mean one of these addresses?", show_header=True, header_style="bold magenta")
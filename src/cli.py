@@ -0,0 +1,272 @@
+import argparse
+import json
+import re
+import sys
+from typing import Callable, Dict, List
+from config import (RESTAURANT_DETAILS_MAP, RESTAURANTS_EVENT_MAP, RATING_TEXT_LIST, MIN_MAX_RATING, DATA_FOLDER_DIR,
+                    RESTAURANT_JSON_URL, RESTAURANT_DETAILS_FILENAME, RESTAURANT_EVENTS_MONTH_FILENAME, COUNTRY_CODE_FILENAME,
+                    MM_YYYY_PATTERN, DATA_GOV_TRANSPORT_API_URL, CARPARK_STATIC_CSV_URL, RESTAURANT_NORMALIZE_WORKERS, RESTAURANT_FIELDS)
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+def mm_yyyy(value: str) -> str:
+    """argparse type for mm_yyyy month arguments."""
+    if not re.match(MM_YYYY_PATTERN, value):
+        raise argparse.ArgumentTypeError(f"invalid month '{value}', expected mm_yyyy (e.g. 04_2019)")
+    return value
+
+def non_negative_int(value: str) -> int:
+    """argparse type for counts such as --limit."""
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid count '{value}', expected an integer")
+    if count < 0:
+        raise argparse.ArgumentTypeError(f"invalid count '{value}', expected 0 or more")
+    return count
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Headless restaurant and carpark commands. Several commands can be chained in one invocation "
+                    "and share the loaded datasets, e.g. `python -m cli export-details events --month 04_2019 --month 05_2019 analyze-ratings`.")
+    parser.add_argument("--refresh", action="store_true", help="ignore cached datasets and rebuild them from source")
+    parser.add_argument("--stream", action="store_true", help="parse the restaurant feed incrementally to bound peak memory")
+    parser.add_argument("--data-dir", default=DATA_FOLDER_DIR, help=f"data folder (default: {DATA_FOLDER_DIR})")
+    parser.add_argument("--restaurant-url", action="append", default=[],
+                        help="page url of a paginated restaurant feed, repeatable; pages are fetched concurrently (default: the single feed url)")
+    parser.add_argument("--workers", type=int, default=RESTAURANT_NORMALIZE_WORKERS,
+                        help=f"processes normalizing the restaurant feed, worth it only with free cores (default: {RESTAURANT_NORMALIZE_WORKERS})")
+    parser.add_argument("--pages", type=int, help="expand each --restaurant-url as a template with {page}/{start} into this many pages")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    export_details = commands.add_parser("export-details", help="export restaurant details")
+    export_details.add_argument("--output", default=RESTAURANT_DETAILS_FILENAME, help="file name inside the data folder")
+
+    events = commands.add_parser("events", help="extract restaurant events for one or more months")
+    events.add_argument("--month", type=mm_yyyy, action="append", default=[], help="mm_yyyy, repeat for several months")
+    events.add_argument("--from", dest="from_month", type=mm_yyyy, help="first month (mm_yyyy) of a range, used with --to")
+    events.add_argument("--to", dest="to_month", type=mm_yyyy, help="last month (mm_yyyy) of a range, used with --from")
+    events.add_argument("--output", default=RESTAURANT_EVENTS_MONTH_FILENAME,
+                        help="file name template inside the data folder, {mm_yyyy} is replaced by the month")
+
+    analyze_ratings = commands.add_parser("analyze-ratings", help="compute rating text thresholds")
+    analyze_ratings.add_argument("--report-dir", help="also plot the rating distributions to png files in this folder")
+
+    restaurants = commands.add_parser("restaurants", help="find restaurants by city, country, cuisine, rating and votes")
+    restaurants.add_argument("--city", action="append", default=[], help="city, repeatable (any of them)")
+    restaurants.add_argument("--country", action="append", default=[], help="country as in Country-Code.xlsx, repeatable (any of them)")
+    restaurants.add_argument("--cuisine", action="append", default=[], help="text contained in one of the cuisines, repeatable (all of them)")
+    restaurants.add_argument("--min-rating", type=float, help="lowest aggregate rating")
+    restaurants.add_argument("--max-rating", type=float, help="highest aggregate rating")
+    restaurants.add_argument("--min-votes", type=int, help="lowest number of votes")
+    restaurants.add_argument("--limit", type=non_negative_int, default=20, help="number of restaurants to print, best rated first (default: 20)")
+
+    carpark = commands.add_parser("carpark", help="carpark commands")
+    carpark_commands = carpark.add_subparsers(dest="carpark_command", required=True, metavar="carpark_command")
+    lookup = carpark_commands.add_parser("lookup", help="look up carparks by number or address")
+    lookup.add_argument("--number", action="append", default=[], help="carpark number, repeatable")
+    lookup.add_argument("--address", action="append", default=[], help="full address, repeatable")
+    nearby = carpark_commands.add_parser("nearby", help="find the carparks nearest to an address or SVY21 point")
+    nearby.add_argument("--address", help="full address of a carpark to search around")
+    nearby.add_argument("--x", type=float, help="SVY21 x coordinate, used with --y")
+    nearby.add_argument("--y", type=float, help="SVY21 y coordinate, used with --x")
+    nearby.add_argument("--k", type=int, default=5, help="number of carparks to return (default: 5)")
+    nearby.add_argument("--radius", type=float, help="return every carpark within this many metres instead of the k nearest")
+    nearby.add_argument("--lot-type", help="only carparks with available lots of this type, e.g. C")
+    nearby.add_argument("--free-parking", action="store_true", help="only carparks offering free parking")
+    nearby.add_argument("--night-parking", action="store_true", help="only carparks offering night parking")
+    return parser
+
+def parse_commands(argv: List[str]) -> List[argparse.Namespace]:
+    """
+    Parses a chain of commands. Each command's unparsed trailing arguments are parsed as the next command.
+
+    Args:
+        argv (List[str]): Command line arguments without the program name.
+
+    Returns:
+        List[argparse.Namespace]: One namespace per command. Global options are read from the first one.
+
+    Raises:
+        SystemExit: With status 2 on invalid arguments.
+    """
+    parser = build_parser()
+    parsed_commands = []
+    remaining = argv
+    while True:
+        args, remaining = parser.parse_known_args(remaining)
+        parsed_commands.append(args)
+        if not remaining:
+            return parsed_commands
+
+class Datasets:
+    """Loads each dataset at most once per invocation, on first use."""
+    def __init__(self, data_dir: str, refresh: bool, stream: bool, restaurant_urls: List[str] = None, pages: int = None, workers: int = 1):
+        self.data_dir = data_dir
+        self.refresh = refresh
+        self.stream = stream
+        self.restaurant_urls = restaurant_urls or []
+        self.pages = pages
+        self.workers = workers
+        self._restaurants = None
+        self._restaurant_query_index = None
+        self._carparks = None
+        self._carpark_spatial_index = None
+
+    def restaurants(self):
+        """Returns the restaurants table and the events table (see zomato_restaurant_countries_events_to_tables)."""
+        if self._restaurants is None:
+            from restaurant.restaurant_details import zomato_restaurant_countries_events_to_tables, restaurant_page_urls
+            source = RESTAURANT_JSON_URL
+            if self.restaurant_urls and self.pages:
+                source = [url for template in self.restaurant_urls for url in restaurant_page_urls(template, self.pages)]
+            elif self.restaurant_urls:
+                source = self.restaurant_urls
+            self._restaurants = zomato_restaurant_countries_events_to_tables(
+                source, self.data_dir, COUNTRY_CODE_FILENAME,
+                refresh=self.refresh, stream=self.stream, workers=self.workers, fields=RESTAURANT_FIELDS)
+        return self._restaurants
+
+    def restaurant_query_index(self):
+        if self._restaurant_query_index is None:
+            from restaurant.restaurant_query import RestaurantQueryIndex
+            self._restaurant_query_index = RestaurantQueryIndex(self.restaurants()[0], RESTAURANT_DETAILS_MAP)
+        return self._restaurant_query_index
+
+    def carparks(self):
+        if self._carparks is None:
+            from carpark.get_carparks_data import get_carparks_data
+            from carpark.carpark_index import build_carpark_index
+            carparks_data_merged_df = get_carparks_data(DATA_GOV_TRANSPORT_API_URL, CARPARK_STATIC_CSV_URL)
+            self._carparks = (carparks_data_merged_df, build_carpark_index(carparks_data_merged_df))
+        return self._carparks
+
+    def carpark_spatial_index(self):
+        if self._carpark_spatial_index is None:
+            from carpark.carpark_spatial_index import CarparkSpatialIndex
+            self._carpark_spatial_index = CarparkSpatialIndex(self.carparks()[1])
+        return self._carpark_spatial_index
+
+def run_export_details(args: argparse.Namespace, datasets: Datasets) -> bool:
+    from restaurant.restaurant_details import zomato_restaurant_details_to_csv
+    restaurants_df, events_df = datasets.restaurants()
+    zomato_restaurant_details_to_csv(restaurants_df, RESTAURANT_DETAILS_MAP, args.output, datasets.data_dir, raise_errors=True, events_df=events_df)
+    return True
+
+def run_events(args: argparse.Namespace, datasets: Datasets) -> bool:
+    from restaurant.restaurant_events import extract_restaurant_events_by_months, month_range
+    months = list(args.month)
+    if args.from_month or args.to_month:
+        if not (args.from_month and args.to_month):
+            print("events: --from and --to must be given together", file=sys.stderr)
+            return False
+        months += month_range(args.from_month, args.to_month)
+    if not months:
+        print("events: give at least one --month or a --from/--to range", file=sys.stderr)
+        return False
+    restaurants_df, events_df = datasets.restaurants()
+    filtered_dfs = extract_restaurant_events_by_months(list(dict.fromkeys(months)), restaurants_df, datasets.data_dir,
+                                                       RESTAURANTS_EVENT_MAP, args.output, raise_errors=True, events_df=events_df)
+    for month, events_df in filtered_dfs.items():
+        print(f"{month}: {len(events_df)} events")
+    return True
+
+def run_analyze_ratings(args: argparse.Namespace, datasets: Datasets) -> bool:
+    from restaurant.restaurant_analysis import compute_rating_text_thresholds, render_rating_report
+    restaurants_df, _ = datasets.restaurants()
+    rating_bins, rating_text_stats = compute_rating_text_thresholds(restaurants_df, RATING_TEXT_LIST, MIN_MAX_RATING)
+    if args.report_dir:
+        for path in render_rating_report(restaurants_df, RATING_TEXT_LIST, args.report_dir, rating_text_stats):
+            print(f"wrote {path}", file=sys.stderr)
+    print(json.dumps(rating_bins))
+    return True
+
+def run_restaurants(args: argparse.Namespace, datasets: Datasets) -> bool:
+    query_index = datasets.restaurant_query_index()
+    filters = {"city": args.city, "country": args.country, "cuisine": args.cuisine, "min_rating": args.min_rating,
+               "max_rating": args.max_rating, "min_votes": args.min_votes}
+    matches = query_index.query(**filters)
+    print(f"restaurants: {len(matches)} match", file=sys.stderr)
+    print(json.dumps(query_index.records(limit=args.limit, **filters), indent=4))
+    return len(matches) > 0
+
+def run_carpark(args: argparse.Namespace, datasets: Datasets) -> bool:
+    if args.carpark_command == "nearby":
+        return run_carpark_nearby(args, datasets)
+    from carpark.search_carparks_data import search_carparks_data_from_cp_num, search_carparks_data_from_address
+    if not args.number and not args.address:
+        print("carpark lookup: give at least one --number or --address", file=sys.stderr)
+        return False
+    carparks_data_merged_df, carpark_index = datasets.carparks()
+    all_found = True
+    for carpark_number in args.number:
+        if carpark_number not in carpark_index["carpark_number"]:
+            all_found = False
+        print(search_carparks_data_from_cp_num(carparks_data_merged_df, carpark_number, carpark_index))
+    for address in args.address:
+        returned = search_carparks_data_from_address(carparks_data_merged_df, address, carpark_index)
+        if returned == "Address does not exist":
+            all_found = False
+        print(returned)
+    return all_found
+
+def run_carpark_nearby(args: argparse.Namespace, datasets: Datasets) -> bool:
+    from carpark.carpark_spatial_index import address_location, nearby_carparks_to_records
+    if args.address is None and (args.x is None or args.y is None):
+        print("carpark nearby: give --address or both --x and --y", file=sys.stderr)
+        return False
+    _, carpark_index = datasets.carparks()
+    if args.address is not None:
+        point = address_location(carpark_index, args.address)
+        if point is None:
+            print(f"carpark nearby: address '{args.address}' not found", file=sys.stderr)
+            return False
+    else:
+        point = (args.x, args.y)
+    filters = {"lot_type": args.lot_type, "free_parking": args.free_parking, "night_parking": args.night_parking}
+    spatial_index = datasets.carpark_spatial_index()
+    if args.radius is not None:
+        results = spatial_index.within_radius(*point, args.radius, carpark_index, **filters)
+    else:
+        results = spatial_index.nearest(*point, carpark_index, k=args.k, **filters)
+    print(json.dumps(nearby_carparks_to_records(results), indent=4))
+    return bool(results)
+
+COMMAND_HANDLERS: Dict[str, Callable[[argparse.Namespace, Datasets], bool]] = {
+    "export-details": run_export_details,
+    "events": run_events,
+    "analyze-ratings": run_analyze_ratings,
+    "restaurants": run_restaurants,
+    "carpark": run_carpark,
+}
+
+def main(argv: List[str] = None) -> int:
+    """
+    Runs the chained commands and returns the process exit status.
+
+    Returns:
+        int: 0 if every command succeeded, 1 if any command failed (or a lookup found nothing), 2 on usage errors.
+    """
+    try:
+        parsed_commands = parse_commands(sys.argv[1:] if argv is None else argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+
+    global_args = parsed_commands[0]
+    datasets = Datasets(global_args.data_dir, global_args.refresh, global_args.stream, global_args.restaurant_url, global_args.pages, global_args.workers)
+    status = EXIT_OK
+    for args in parsed_commands:
+        try:
+            succeeded = COMMAND_HANDLERS[args.command](args, datasets)
+        except Exception as e:
+            print(f"{args.command} failed: {e}", file=sys.stderr)
+            succeeded = False
+        if not succeeded:
+            status = EXIT_FAILED
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import os
+#restaurant scenario constants
+RESTAURANT_DETAILS_MAP = {"id":"restaurant_id",
+                            "name":"restaurant_name",
+                            "Country":"country",
+                            "location.city":"city",
+                            "user_rating.votes":"user_rating_voted",
+                            "user_rating.aggregate_rating":"user_aggregate_rating",
+                            "cuisines":"cuisines",
+                            "zomato_events":"event_date"
+}
+RESTAURANTS_EVENT_MAP = {"event_id":"event_id",
+                         "id":"restaurant_id",
+                         "name":"restaurant_name",
+                         "photos":"photo_url",
+                        "title":"event_title",
+                        "start_date":"event_start_date",
+                        "end_date":"event_end_date"
+
+}
+#dotted paths of the restaurant feed used downstream, with the dtype each is loaded as
+RESTAURANT_FIELDS = {"id":"str",
+                     "name":"str",
+                     "location.city":"str",
+                     "location.country_id":"Int64",
+                     "cuisines":"str",
+                     "user_rating.aggregate_rating":"float64",
+                     "user_rating.rating_text":"str",
+                     "user_rating.votes":"Int64",
+                     "user_rating.has_fake_reviews":"Int64",
+                     "zomato_events":"object"
+}
+RATING_TEXT_LIST = ['Poor','Average', 'Good', 'Very Good', 'Excellent']
+MIN_MAX_RATING = (0,5) #assume we have this info
+DATA_FOLDER_DIR = os.getenv("DATA_FOLDER_DIR", "../data")
+RESTAURANT_JSON_URL="https://raw.githubusercontent.com/Papagoat/brain-assessment/main/restaurant_data.json"
+RESTAURANT_DETAILS_FILENAME = "restaurant_details.csv"
+RESTAURANT_EVENTS_FILENAME = "restaurant_events.csv"
+COUNTRY_CODE_FILENAME = "Country-Code.xlsx"
+RESTAURANT_EVENTS_MONTH_FILENAME = "restaurant_events_{mm_yyyy}.csv"
+MM_YYYY_PATTERN = r"^(0[1-9]|1[0-2])_(20\d{2})$"
+RATING_REPORT_DIRNAME = "rating_report"
+RESTAURANT_NORMALIZE_WORKERS = int(os.getenv("RESTAURANT_NORMALIZE_WORKERS", "1")) #processes normalizing the restaurant feed, 1 = in process
+
+#carpark scenario constants
+DATA_GOV_API_HEAD = "https://api.data.gov.sg/v1"
+DATA_GOV_TRANSPORT_API_URL = f"{DATA_GOV_API_HEAD}/transport/carpark-availability"
+CARPARK_STATIC_CSV_URL = "https://raw.githubusercontent.com/Papagoat/brain-assessment/refs/heads/main/HDBCarparkInformation.csv"
+CARPARK_POLL_INTERVAL_SECONDS = 60
+CARPARK_HISTORY_DB_FILENAME = "carpark_history.sqlite"
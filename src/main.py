@@ -1,66 +1,36 @@
-import os
+import argparse
 from rich.console import Console
 from rich.prompt import Prompt
 import re
-#carpark modules
-from carpark.get_carparks_data import get_carparks_data
-from carpark.search_carparks_data import search_carparks_data_from_cp_num,search_carparks_data_from_address,suggest_addresses
+#restaurant and carpark modules (pandas, requests, rapidfuzz...) are imported by their scenario, so the menu shows up fast
 
-#restaurant modules
-from restaurant.restaurant_details import zomato_restaurant_countries_events_to_df,zomato_restaurant_details_to_csv
-from restaurant.restaurant_events import extract_restaurant_events_by_mm_yyyy
-from restaurant.restaurant_analysis import rating_text_thresholds_analyser
+#constants
+from config import (RESTAURANT_DETAILS_MAP, RESTAURANTS_EVENT_MAP, RATING_TEXT_LIST, MIN_MAX_RATING, DATA_FOLDER_DIR,
+                    RESTAURANT_JSON_URL, RESTAURANT_DETAILS_FILENAME, RESTAURANT_EVENTS_FILENAME, COUNTRY_CODE_FILENAME,
+                    MM_YYYY_PATTERN, DATA_GOV_TRANSPORT_API_URL, CARPARK_STATIC_CSV_URL, CARPARK_POLL_INTERVAL_SECONDS,
+                    CARPARK_HISTORY_DB_FILENAME, RATING_REPORT_DIRNAME, RESTAURANT_NORMALIZE_WORKERS, RESTAURANT_FIELDS)
 console = Console()
 
-#restaurant scenario constants
-RESTAURANT_DETAILS_MAP = {"id":"restaurant_id",
-                            "name":"restaurant_name",
-                            "Country":"country",
-                            "location.city":"city",
-                            "user_rating.votes":"user_rating_voted",
-                            "user_rating.aggregate_rating":"user_aggregate_rating",
-                            "cuisines":"cuisines",
-                            "zomato_events":"event_date"
-}
-RESTAURANTS_EVENT_MAP = {"event_id":"event_id",
-                         "id":"restaurant_id",
-                         "name":"restaurant_name",
-                         "photos":"photo_url",
-                        "title":"event_title",
-                        "start_date":"event_start_date",
-                        "end_date":"event_end_date"
-
-}
-RATING_TEXT_LIST = ['Poor','Average', 'Good', 'Very Good', 'Excellent']
-MIN_MAX_RATING = (0,5) #assume we have this info
-DATA_FOLDER_DIR = os.getenv("DATA_FOLDER_DIR")
-DATA_FOLDER_DIR = "../data"
-RESTAURANT_JSON_URL="https://raw.githubusercontent.com/Papagoat/brain-assessment/main/restaurant_data.json"
-RESTAURANT_DETAILS_FILENAME = "restaurant_details.csv"
-RESTAURANT_EVENTS_FILENAME = "restaurant_events.csv"
-COUNTRY_CODE_FILENAME = "Country-Code.xlsx"
-
-#carpark scenario constants
-DATA_GOV_API_HEAD = "https://api.data.gov.sg/v1"
-DATA_GOV_TRANSPORT_API_URL = f"{DATA_GOV_API_HEAD}/transport/carpark-availability"
-CARPARK_STATIC_CSV_URL = "https://raw.githubusercontent.com/Papagoat/brain-assessment/refs/heads/main/HDBCarparkInformation.csv"
-
 def get_valid_mm_yyyy_input():
     """Prompts the user for a month and year (mm_yyyy) and validates the input, with a 'back' option."""
     while True:
         mm_yyyy = Prompt.ask("Enter month and year (mm_yyyy), or 'back' to return:")
         if mm_yyyy == "back":
             return None  # Return None to indicate the user wants to go back
-        elif re.match(r"^(0[1-9]|1[0-2])_(20\d{2})$", mm_yyyy):  # Validate mm_yyyy format
+        elif re.match(MM_YYYY_PATTERN, mm_yyyy):  # Validate mm_yyyy format
             return mm_yyyy
         else:
             console.print("[bold red]Invalid format. Please enter mm_yyyy (e.g., 01_2024), or 'back'.[/bold red]")
 
 #runs restaurant scenario in cli
-def restaurant_scenario():
+def restaurant_scenario(refresh=False, stream=False):
     try:
-        restaurants_countries_expanded_df = zomato_restaurant_countries_events_to_df(
-            RESTAURANT_JSON_URL, DATA_FOLDER_DIR, COUNTRY_CODE_FILENAME, RESTAURANT_DETAILS_MAP
+        from restaurant.restaurant_details import zomato_restaurant_countries_events_to_tables,zomato_restaurant_details_to_csv
+        from restaurant.restaurant_events import extract_restaurant_events_by_mm_yyyy
+        from restaurant.restaurant_analysis import rating_text_thresholds_analyser
+        restaurants_countries_df, events_df = zomato_restaurant_countries_events_to_tables(
+            RESTAURANT_JSON_URL, DATA_FOLDER_DIR, COUNTRY_CODE_FILENAME, refresh=refresh, stream=stream,
+            workers=RESTAURANT_NORMALIZE_WORKERS, fields=RESTAURANT_FIELDS
         )
     except Exception as e:
         print(f"Something went wrong...{e}")
@@ -75,10 +45,11 @@ def restaurant_scenario():
         if choice == "1":
             try:
                 zomato_restaurant_details_to_csv(
-                    restaurants_countries_expanded_df,
+                    restaurants_countries_df,
                     RESTAURANT_DETAILS_MAP,
                     RESTAURANT_DETAILS_FILENAME,
                     DATA_FOLDER_DIR,
+                    events_df=events_df,
                 )
             except Exception as e:
                 print(f"Something went wrong...{e}")
@@ -89,17 +60,19 @@ def restaurant_scenario():
             try:
                 extract_restaurant_events_by_mm_yyyy(
                     event_mm_yyyy,
-                    restaurants_countries_expanded_df,
+                    restaurants_countries_df,
                     DATA_FOLDER_DIR,
                     RESTAURANTS_EVENT_MAP,
                     RESTAURANT_EVENTS_FILENAME,
+                    events_df=events_df,
                 )
             except Exception as e:
                 print(f"Something went wrong...{e}")
         elif choice == "3":
             try:
                 rating_text_thresholds_analyser(
-                    restaurants_countries_expanded_df, RATING_TEXT_LIST, MIN_MAX_RATING
+                    restaurants_countries_df, RATING_TEXT_LIST, MIN_MAX_RATING,
+                    report_dir=f"{DATA_FOLDER_DIR}/{RATING_REPORT_DIRNAME}"
                 )
             except Exception as e:
                 print(f"Something went wrong...{e}")
@@ -107,41 +80,118 @@ def restaurant_scenario():
             return
 #runs carpark scenario in cli
 def carpark_scenario():
+    history_store = None
     try:
+        import json
+        import pandas as pd
+        from carpark.get_carparks_data import get_carparks_data
+        from carpark.search_carparks_data import search_carparks_data_from_cp_num,search_carparks_data_from_address,suggest_addresses
+        from carpark.address_index import AddressIndex
+        from carpark.carpark_spatial_index import CarparkSpatialIndex, address_location, nearby_carparks_to_records
+        from carpark.availability_poller import CarparkAvailabilityPoller
+        from carpark.availability_history import AvailabilityHistoryStore, HISTORY_TIMEZONE
+        from carpark.result_cache import CarparkResultCache
         carparks_data_merged_df = get_carparks_data(DATA_GOV_TRANSPORT_API_URL, CARPARK_STATIC_CSV_URL)
+        #every change seen by the poller is kept, so usual occupancy can be answered without rescraping
+        history_store = AvailabilityHistoryStore(f"{DATA_FOLDER_DIR}/{CARPARK_HISTORY_DB_FILENAME}")
+        poller = CarparkAvailabilityPoller(carparks_data_merged_df, DATA_GOV_TRANSPORT_API_URL, CARPARK_POLL_INTERVAL_SECONDS,
+                                           history_store=history_store)
+        #addresses are static, so the fuzzy index is built once and survives availability polls
+        address_index = AddressIndex(carparks_data_merged_df["address"])
+        #coordinates are static too, availability is read from the latest snapshot per query
+        spatial_index = CarparkSpatialIndex(poller.snapshot.carpark_index)
+        #serialized results are reused until the poller publishes a newer snapshot
+        result_cache = CarparkResultCache()
     except Exception as e:
         print(f"Something went wrong...{e}")
+        if history_store is not None:
+            history_store.close()
         return
 
-    while True:
-        choice = Prompt.ask(
-            "Query by [bold blue]1[/bold blue] Carpark Number, [bold blue]2[/bold blue] Address, or [bold red]back[/bold red] to home?",
-            choices=["1", "2", "back"],
-        )
+    poller.start()
+    try:
+        while True:
+            choice = Prompt.ask(
+                "Query by [bold blue]1[/bold blue] Carpark Number, [bold blue]2[/bold blue] Address, [bold blue]3[/bold blue] Refresh availability now, [bold blue]4[/bold blue] Carparks near an address, [bold blue]5[/bold blue] Usual occupancy by hour, or [bold red]back[/bold red] to home?",
+                choices=["1", "2", "3", "4", "5", "back"],
+            )
+            if choice == "1":
+                cp_num = Prompt.ask("Enter Carpark Number (eg 'AM64')")
+                #always read the latest published snapshot, never wait on the poller
+                snapshot = poller.snapshot
+                returned = search_carparks_data_from_cp_num(snapshot.carparks_data_merged_df, cp_num, snapshot.carpark_index,
+                                                            result_cache, snapshot.version)
+                console.print(returned)
 
-        if choice == "1":
-            cp_num = Prompt.ask("Enter Carpark Number (eg 'AM64')")
-            returned = search_carparks_data_from_cp_num(carparks_data_merged_df, cp_num)
-            console.print(returned)
+            elif choice == "2":
+                address = Prompt.ask("Enter Address (partial or full) eg. Bishan")
+                chosen_address = suggest_addresses(address_index.addresses, address, address_index)
+                if chosen_address:
+                    snapshot = poller.snapshot
+                    returned = search_carparks_data_from_address(snapshot.carparks_data_merged_df, chosen_address, snapshot.carpark_index,
+                                                                 result_cache, snapshot.version)
+                    console.print(returned)
 
-        elif choice == "2":
-            address = Prompt.ask("Enter Address (partial or full) eg. Bishan")
-            addresses = carparks_data_merged_df["address"]
-            chosen_address = suggest_addresses(addresses,address)
-            if chosen_address:
-                returned = search_carparks_data_from_address(carparks_data_merged_df, chosen_address)
-                console.print(returned)
+            elif choice == "3":
+                try:
+                    updated_carpark_numbers = poller.poll_once()
+                    console.print(f"[green]Availability refreshed, {len(updated_carpark_numbers)} carparks updated[/green]")
+                except Exception as e:
+                    print(f"Something went wrong...{e}")
 
-        elif choice == "back":
-            return
-def main():
+            elif choice == "4":
+                try:
+                    address = Prompt.ask("Enter Address near you (partial or full) eg. Bishan")
+                    chosen_address = suggest_addresses(address_index.addresses, address, address_index)
+                    point = address_location(poller.snapshot.carpark_index, chosen_address) if chosen_address else None
+                    if chosen_address and point is None:
+                        console.print("[bold red]No coordinates for this address[/bold red]")
+                    elif point:
+                        lot_type = Prompt.ask("Lot type with available lots", choices=["C", "H", "Y", "any"], default="C")
+                        free_parking = Prompt.ask("Free parking only?", choices=["y", "n"], default="n") == "y"
+                        night_parking = Prompt.ask("Night parking only?", choices=["y", "n"], default="n") == "y"
+                        snapshot = poller.snapshot
+                        results = spatial_index.nearest(*point, snapshot.carpark_index, k=5,
+                                                        lot_type=None if lot_type == "any" else lot_type,
+                                                        free_parking=free_parking, night_parking=night_parking)
+                        console.print(json.dumps(nearby_carparks_to_records(results), indent=4))
+                except Exception as e:
+                    print(f"Something went wrong...{e}")
+
+            elif choice == "5":
+                try:
+                    cp_num = Prompt.ask("Enter Carpark Number (eg 'AM64')")
+                    #stored times are Singapore time, whatever the machine's timezone
+                    now = pd.Timestamp.now(tz=HISTORY_TIMEZONE)
+                    by_hour = history_store.occupancy_by_hour_of_day(cp_num, now - pd.Timedelta(days=30), now)
+                    if by_hour.empty:
+                        console.print("[bold yellow]No recorded occupancy for this carpark yet[/bold yellow]")
+                    else:
+                        console.print((by_hour * 100).round(0).astype(int).astype(str).add("% full").to_string())
+                except Exception as e:
+                    print(f"Something went wrong...{e}")
+
+            elif choice == "back":
+                return
+            console.print(f"[dim]{poller.status()}[/dim]")
+    finally:
+        poller.stop()
+        history_store.close()
+def parse_args():
+    parser = argparse.ArgumentParser(description="Govtech THT restaurant and carpark cli")
+    parser.add_argument("--refresh", action="store_true", help="ignore cached datasets and rebuild them from source")
+    parser.add_argument("--stream", action="store_true", help="parse the restaurant feed incrementally to bound peak memory")
+    return parser.parse_args()
+
+def main(refresh=False, stream=False):
     while True:
         choice = Prompt.ask(
             "Choose a scenario: [bold blue]1[/bold blue] Restaurant, [bold blue]2[/bold blue] Carpark, or [bold red]exit[/bold red]?",
             choices=["1", "2", "exit"],
         )
         if choice == "1":
-            restaurant_scenario()
+            restaurant_scenario(refresh, stream)
+            refresh = False  # only the first load of the session bypasses the cache
         elif choice == "2":
             carpark_scenario()
         elif choice == "exit":
@@ -149,5 +199,6 @@ def main():
             break
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(args.refresh, args.stream)
         
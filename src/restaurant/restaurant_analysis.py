@@ -1,103 +1,161 @@
+import os
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import List
-def rating_text_thresholds_analyser(restaurants_countries_expanded_df:pd.DataFrame,RATING_TEXT_LIST:List[str],MIN_MAX_RATING:tuple):
+from typing import Dict, List, Optional, Tuple
+
+RATING_COLUMN = 'user_rating.aggregate_rating'
+RATING_TEXT_COLUMN = 'user_rating.rating_text'
+VOTES_COLUMN = 'user_rating.votes'
+FAKE_REVIEWS_COLUMN = 'user_rating.has_fake_reviews'
+RATING_REPORT_FILENAMES = ("rating_distribution.png", "rating_vs_votes_fake_reviews.png", "rating_by_rating_text.png")
+
+def _to_numeric_by_value(column: pd.Series) -> np.ndarray:
+    """pd.to_numeric(errors='coerce') as float, parsing each distinct value once (ratings and votes repeat a lot)."""
+    codes, uniques = pd.factorize(column)
+    parsed = np.append(pd.to_numeric(pd.Series(uniques, dtype=object), errors='coerce').to_numpy(dtype='float64', na_value=np.nan), np.nan)
+    return parsed[codes]
+
+def valid_ratings(restaurants_countries_expanded_df: pd.DataFrame, RATING_TEXT_LIST: List[str], columns: Tuple[str, ...] = ()) -> pd.DataFrame:
     """
-    Analyzes restaurant rating data and computes dynamic rating thresholds for different rating texts.
+    Selects the rated restaurants used for threshold analysis, reading only the rating columns.
 
-    This function processes the restaurant review data by filtering relevant columns, cleaning missing values,
-    visualizing the distribution of aggregate ratings, and plotting relationships between aggregate ratings, votes,
-    and fake reviews. It also computes dynamic rating thresholds based on the minimum and maximum values of aggregate ratings
-    for each rating text.
+    Rows are kept when the rating text is one of RATING_TEXT_LIST, the aggregate rating is numeric and
+    the restaurant has votes.
 
     Args:
-        restaurants_countries_expanded_df (pd.DataFrame): A DataFrame containing the restaurant review data, with columns for
-                                                        aggregate ratings, rating texts, votes, and fake reviews.
-        RATING_TEXT_LIST (List[str]): A list of valid rating texts to filter the dataset (e.g., ['Poor', 'Average', 'Good', 'Very Good', 'Excellent']).
-        MIN_MAX_RATING (tuple): A tuple containing the minimum and maximum rating values (e.g., (0, 5)) used to define rating ranges.
+        restaurants_countries_expanded_df (pd.DataFrame): Restaurants with user_rating.* columns.
+        RATING_TEXT_LIST (List[str]): Valid rating texts.
+        columns (Tuple[str, ...]): Extra columns to carry along, eg. for plotting.
 
     Returns:
-        dict: A dictionary containing the computed dynamic rating thresholds for each rating text. Each entry in the dictionary 
-            maps a rating text to a tuple of (start_value, end_value), which defines the range for that rating text.
+        pd.DataFrame: The rating text, the aggregate rating as float, the votes as int and the extra columns.
+    """
+    ratings = _to_numeric_by_value(restaurants_countries_expanded_df[RATING_COLUMN])
+    votes = np.trunc(np.nan_to_num(_to_numeric_by_value(restaurants_countries_expanded_df[VOTES_COLUMN]))).astype(int)
+    rating_texts = restaurants_countries_expanded_df[RATING_TEXT_COLUMN]
+    keep = rating_texts.isin(RATING_TEXT_LIST).to_numpy() & ~np.isnan(ratings) & (votes != 0)
+    return pd.DataFrame({
+        RATING_TEXT_COLUMN: rating_texts.to_numpy()[keep],
+        RATING_COLUMN: ratings[keep],
+        VOTES_COLUMN: votes[keep],
+        **{col: restaurants_countries_expanded_df[col].to_numpy()[keep] for col in columns},
+    })
+
+def compute_rating_text_thresholds(restaurants_countries_expanded_df: pd.DataFrame, RATING_TEXT_LIST: List[str],
+                                   MIN_MAX_RATING: tuple) -> Tuple[Dict[str, tuple], pd.DataFrame]:
+    """
+    Computes the aggregate rating range of each rating text, without printing or plotting.
+
+    The per-rating-text stats are one groupby over the valid ratings. The ranges then run from MIN_MAX_RATING[0]
+    up, each rating text ending at the larger of its own max and the next rating text's min.
+
+    Args:
+        restaurants_countries_expanded_df (pd.DataFrame): Restaurants with user_rating.* columns.
+        RATING_TEXT_LIST (List[str]): Rating texts from lowest to highest (e.g., ['Poor', 'Average', 'Good', 'Very Good', 'Excellent']).
+        MIN_MAX_RATING (tuple): Minimum and maximum rating values (e.g., (0, 5)).
+
+    Returns:
+        Tuple[dict, pd.DataFrame]: Rating text to (start_value, end_value), and the min, max, mean, median,
+                                   std and count of the aggregate rating per rating text, sorted by mean.
     """
-    #step 1: filtering columns relevant to reviews
-    restaurants_reviews_data_df = restaurants_countries_expanded_df[[
-        'user_rating.aggregate_rating',
-        'user_rating.rating_text',
-        'user_rating.rating_color',
-        'user_rating.votes',
-        'user_rating.has_fake_reviews',
-        'user_rating.custom_rating_text'
-    ]].copy()
-    # step 2: Drop rows where 'user_rating.aggregate_rating' or 'user_rating.rating_text' is None, NA, or NaN
-    restaurants_reviews_data_df.dropna(subset=['user_rating.aggregate_rating', 'user_rating.rating_text'], inplace=True)
-
-    #step 3: visualize data 
-    for col in restaurants_reviews_data_df.columns:
-        print(f"{col}: {restaurants_reviews_data_df[col].apply(type).value_counts().to_dict()}")
-    print(restaurants_reviews_data_df['user_rating.rating_text'].unique())
-    #step 3.1  only keep relevant text rating restaurants
-    restaurants_reviews_data_df.drop(restaurants_reviews_data_df[~restaurants_reviews_data_df['user_rating.rating_text'].isin(RATING_TEXT_LIST)].index, inplace=True)
-
-    #step 4 convert user_rating.aggregate_rating to float
-    restaurants_reviews_data_df['user_rating.aggregate_rating'] = pd.to_numeric(restaurants_reviews_data_df['user_rating.aggregate_rating'], errors='coerce')
-    restaurants_reviews_data_df.dropna(subset=['user_rating.aggregate_rating'], inplace=True)
-
-    #step 5 convert user_rating.votes to int
-    restaurants_reviews_data_df["user_rating.votes"] = pd.to_numeric(restaurants_reviews_data_df["user_rating.votes"], errors='coerce').fillna(0).astype(int)
-    restaurants_reviews_data_df.drop(restaurants_reviews_data_df[restaurants_reviews_data_df["user_rating.votes"] == 0].index, inplace=True)
-
-    #step 6
-    # Plot Distribution of Aggregate Ratings
-    plt.figure(figsize=(8,5))
-    sns.histplot(restaurants_reviews_data_df['user_rating.aggregate_rating'], bins=20, kde=True, color="blue")
-    plt.title("Distribution of Aggregate Ratings")
-    plt.xlabel("Aggregate Rating")
-    plt.ylabel("Frequency")
-    plt.show()
-
-    # Grouping by Rating Text and Analyzing Ratings
-    rating_text_stats = restaurants_reviews_data_df.groupby('user_rating.rating_text')['user_rating.aggregate_rating'].agg(['min', 'max', 'mean', 'median', 'std', 'count'])
-
-
-    # Visualizing relationships
-    plt.figure(figsize=(12, 5))
-
-    plt.subplot(1, 2, 1)
-    sns.scatterplot(x=restaurants_reviews_data_df['user_rating.aggregate_rating'], y=restaurants_reviews_data_df['user_rating.votes'], alpha=0.6)
-    plt.title("Aggregate Rating vs Votes")
-
-    plt.subplot(1, 2, 2)
-    sns.scatterplot(x=restaurants_reviews_data_df['user_rating.aggregate_rating'], y=restaurants_reviews_data_df['user_rating.has_fake_reviews'], alpha=0.6, color="red")
-    plt.title("Aggregate Rating vs Fake Reviews")
-    plt.show()
-    
-    plt.figure(figsize=(10, 5))
-    sns.boxplot(x='user_rating.rating_text', y='user_rating.aggregate_rating', data=restaurants_reviews_data_df, order=rating_text_stats.index)
-    plt.xticks(rotation=45)
-    plt.title("Aggregate Rating Distribution by Rating Text")
-    plt.show()
-
-    #assume not outliers given this is data from api response 
+    ratings_df = valid_ratings(restaurants_countries_expanded_df, RATING_TEXT_LIST)
+    rating_text_stats = ratings_df.groupby(RATING_TEXT_COLUMN)[RATING_COLUMN].agg(['min', 'max', 'mean', 'median', 'std', 'count'])
+
+    #assume not outliers given this is data from api response
     category_rating_stats = rating_text_stats.sort_values(by="mean")
-    print("\nAggregate Rating Ranges for Each Rating Text:")
-    print(category_rating_stats)
     min_values = [float(val) for val in category_rating_stats['min'].values]
     max_values = [float(val) for val in category_rating_stats['max'].values]
 
     #to dynamcally extract threshold ranges
     min_values.append(MIN_MAX_RATING[1])
-    rating_bins={}
+    rating_bins = {}
     prev_end_val = None
     for idx, rating_text in enumerate(RATING_TEXT_LIST):
         if not prev_end_val:
             start_val = MIN_MAX_RATING[0]
         else:
             start_val = prev_end_val
-        end_val = max(min_values[idx+1],max_values[idx])
-        prev_end_val =end_val
+        end_val = max(min_values[idx+1], max_values[idx])
+        prev_end_val = end_val
         rating_bins[rating_text] = (start_val, end_val)
+    return rating_bins, category_rating_stats
+
+def render_rating_report(restaurants_countries_expanded_df: pd.DataFrame, RATING_TEXT_LIST: List[str], report_dir: str,
+                         rating_text_stats: Optional[pd.DataFrame] = None) -> List[str]:
+    """
+    Renders the rating plots to PNG files, without a display.
+
+    Figures are drawn through matplotlib's object API rather than pyplot, so no GUI backend is involved.
+    matplotlib and seaborn are only imported here.
+
+    Args:
+        restaurants_countries_expanded_df (pd.DataFrame): Restaurants with user_rating.* columns.
+        RATING_TEXT_LIST (List[str]): Valid rating texts.
+        report_dir (str): Folder to write the plots to, created if missing.
+        rating_text_stats (Optional[pd.DataFrame]): Stats from compute_rating_text_thresholds, used to order the box plot.
+
+    Returns:
+        List[str]: Paths of the written files.
+    """
+    from matplotlib.figure import Figure
+    import seaborn as sns
+
+    ratings_df = valid_ratings(restaurants_countries_expanded_df, RATING_TEXT_LIST, (FAKE_REVIEWS_COLUMN,))
+    order = list(rating_text_stats.index) if rating_text_stats is not None else [t for t in RATING_TEXT_LIST if t in set(ratings_df[RATING_TEXT_COLUMN])]
+    os.makedirs(report_dir, exist_ok=True)
+    paths = [os.path.join(report_dir, filename) for filename in RATING_REPORT_FILENAMES]
+
+    # Distribution of Aggregate Ratings
+    figure = Figure(figsize=(8, 5))
+    ax = figure.subplots()
+    sns.histplot(ratings_df[RATING_COLUMN], bins=20, kde=True, color="blue", ax=ax)
+    ax.set(title="Distribution of Aggregate Ratings", xlabel="Aggregate Rating", ylabel="Frequency")
+    figure.savefig(paths[0])
+
+    # Relationships with votes and fake reviews
+    figure = Figure(figsize=(12, 5))
+    votes_ax, fake_reviews_ax = figure.subplots(1, 2)
+    sns.scatterplot(x=ratings_df[RATING_COLUMN], y=ratings_df[VOTES_COLUMN], alpha=0.6, ax=votes_ax)
+    votes_ax.set_title("Aggregate Rating vs Votes")
+    sns.scatterplot(x=ratings_df[RATING_COLUMN], y=ratings_df[FAKE_REVIEWS_COLUMN], alpha=0.6, color="red", ax=fake_reviews_ax)
+    fake_reviews_ax.set_title("Aggregate Rating vs Fake Reviews")
+    figure.savefig(paths[1])
+
+    # Aggregate Rating Distribution by Rating Text
+    figure = Figure(figsize=(10, 5))
+    ax = figure.subplots()
+    sns.boxplot(x=RATING_TEXT_COLUMN, y=RATING_COLUMN, data=ratings_df, order=order, ax=ax)
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.set_title("Aggregate Rating Distribution by Rating Text")
+    figure.tight_layout()
+    figure.savefig(paths[2])
+    return paths
+
+def rating_text_thresholds_analyser(restaurants_countries_expanded_df:pd.DataFrame,RATING_TEXT_LIST:List[str],MIN_MAX_RATING:tuple,report_dir:Optional[str]=None):
+    """
+    Analyzes restaurant rating data and computes dynamic rating thresholds for different rating texts.
+
+    The thresholds come from compute_rating_text_thresholds and are printed with the per-rating-text stats.
+    If report_dir is given, the distribution of aggregate ratings, its relationship with votes and fake reviews,
+    and its spread per rating text are also plotted to files there.
+
+    Args:
+        restaurants_countries_expanded_df (pd.DataFrame): A DataFrame containing the restaurant review data, with columns for
+                                                        aggregate ratings, rating texts, votes, and fake reviews.
+        RATING_TEXT_LIST (List[str]): A list of valid rating texts to filter the dataset (e.g., ['Poor', 'Average', 'Good', 'Very Good', 'Excellent']).
+        MIN_MAX_RATING (tuple): A tuple containing the minimum and maximum rating values (e.g., (0, 5)) used to define rating ranges.
+        report_dir (Optional[str]): Folder to write the plots to. No plots are drawn if None.
+
+    Returns:
+        dict: A dictionary containing the computed dynamic rating thresholds for each rating text. Each entry in the dictionary
+            maps a rating text to a tuple of (start_value, end_value), which defines the range for that rating text.
+    """
+    rating_bins, category_rating_stats = compute_rating_text_thresholds(restaurants_countries_expanded_df, RATING_TEXT_LIST, MIN_MAX_RATING)
+    print("\nAggregate Rating Ranges for Each Rating Text:")
+    print(category_rating_stats)
     print("\n Threshhold Ranges:")
     print(rating_bins)
+    if report_dir is not None:
+        paths = render_rating_report(restaurants_countries_expanded_df, RATING_TEXT_LIST, report_dir, category_rating_stats)
+        print(f"\nRating report written to {', '.join(paths)}")
     return rating_bins
@@ -1,16 +1,34 @@
 import json
+import math
+from itertools import repeat
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-from typing import List, Dict
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
 from rich.console import Console
-from utils.extract_rename_save_csv import extract_rename_save_csv
+from utils.extract_columns import extract_columns
+from utils.save_df import save_df
+from restaurant.restaurant_events import build_events_table, extract_events_columns
 from utils.load_data_to_df import load_file_to_df
-from utils.merge_data import merge_data
+from utils.merge_data import lookup_join
 from utils.load_url_response import load_json_url_response
+from utils.http_client import FETCH_WORKERS, PER_HOST_LIMIT, fetch_url, fetch_json_pages
+from utils.dataset_cache import (CACHE_SUBDIR, file_sha256, fingerprint_source, fingerprint_sources, load_cached_df, save_cached_df,
+                                 load_file_to_df_cached)
 import numpy as np
 console = Console()
+RESTAURANT_CACHE_NAME = "restaurants_countries_expanded"
+RESTAURANT_TABLE_CACHE_NAME = "restaurants_countries"
+RESTAURANT_EVENTS_TABLE_CACHE_NAME = "restaurant_events"
+COUNTRY_CODE_CACHE_NAME = "country_codes"
+RESTAURANT_STREAM_CHUNK_SIZE = 1000
+RESTAURANT_PAGE_SIZE = 20
+RESTAURANT_SHARDS_PER_WORKER = 4
+#shards handed to forked normalization workers, which inherit them instead of receiving a pickled copy
+_restaurant_shards: List[List[Dict]] = []
 # pd.options.mode.chained_assignment = None
 
-def zomato_api_response_to_df(responses: List[Dict]) -> pd.DataFrame:
+def zomato_api_response_to_df(responses: List[Dict], workers: int = 1, fields: Dict[str, str] = None) -> pd.DataFrame:
     """
     Converts a list of Zomato API responses into a pandas DataFrame.
 
@@ -20,6 +38,8 @@ def zomato_api_response_to_df(responses: List[Dict]) -> pd.DataFrame:
     Args:
         responses (List[Dict]): A list of dictionaries, where each dictionary represents
             a Zomato API response containing restaurant data.
+        workers (int): Number of processes normalizing the restaurants (see normalize_restaurants_parallel).
+        fields (Dict[str, str]): Dotted paths to extract with their dtypes (see project_restaurants). None flattens every field.
 
     Returns:
         pd.DataFrame: A pandas DataFrame containing the extracted restaurant details.
@@ -33,29 +53,242 @@ def zomato_api_response_to_df(responses: List[Dict]) -> pd.DataFrame:
             for restaurant in interim_restaurant_details
         ])
 
-    restaurants_df = pd.json_normalize(all_restaurant_details)
+    restaurants_df = normalize_restaurants_parallel(all_restaurant_details, workers, fields=fields)
     return restaurants_df
 
-#call zomato api and retrieve restaurant details to restaurant_details.csv
-def zomato_restaurant_countries_events_to_df(RESTAURANT_JSON_URL:str,DATA_FOLDER_DIR:str,COUNTRY_CODE_FILENAME:str,RESTAURANT_DETAILS_MAP:Dict):
+def normalize_restaurants(restaurants: List[Dict], fields: Dict[str, str] = None) -> pd.DataFrame:
     """
-    Fetches restaurant data from a Zomato API URL, enriches it with country information,
-    and expands the zomato_events column.
+    Flattens a list of Zomato restaurant dicts into a DataFrame with dotted column names.
 
     Args:
-        RESTAURANT_JSON_URL (str): The URL to fetch restaurant data from the Zomato API.
-        DATA_FOLDER_DIR (str): The directory containing the 'Country-Codde' file.
-        RESTAURANT_DETAILS_MAP(dict): Mapping of current df columns required to new names
+        restaurants (List[Dict]): The "restaurant" objects of the API responses.
+        fields (Dict[str, str]): Dotted paths to extract with their dtypes (see project_restaurants). None flattens every field.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing restaurant details enriched with country
-                          information and expanded zomato_events.
+        pd.DataFrame: One row per restaurant.
+    """
+    if fields is not None:
+        return project_restaurants(restaurants, fields)
+    return pd.json_normalize(restaurants)
+
+def _path_values(restaurants: List[Dict], path: str) -> List:
+    values = restaurants
+    for key in path.split("."):
+        values = [value.get(key, np.nan) if isinstance(value, dict) else np.nan for value in values]
+    return values
+
+def _typed_column(values: List, dtype: str):
+    column = pd.Series(values, dtype=object)
+    if dtype == "object":
+        return column
+    if pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype)):
+        return pd.to_numeric(column, errors="coerce").astype(dtype)
+    #before pandas 3, astype("str") turns missing values into the string "nan", so they are masked back
+    return column.astype(dtype).where(column.notna())
+
+def project_restaurants(restaurants: List[Dict], fields: Dict[str, str]) -> pd.DataFrame:
+    """
+    Extracts only the given dotted paths of Zomato restaurant dicts, straight into typed columns.
+
+    Unlike json_normalize, nothing outside the paths is flattened (menus, photos, R fields...), so the frame
+    is only as wide as what is used downstream. A path whose value is missing, or whose parent is not a dict,
+    gives NaN. Numeric dtypes are parsed from strings such as "4.2", unparseable values becoming missing.
+
+    Args:
+        restaurants (List[Dict]): The "restaurant" objects of the API responses.
+        fields (Dict[str, str]): Dotted path (e.g. "user_rating.aggregate_rating") to pandas dtype, see RESTAURANT_FIELDS.
+                                 "object" keeps the values as they are, e.g. the list of zomato_events.
+
+    Returns:
+        pd.DataFrame: One row per restaurant and one column per path, named by the path.
+    """
+    return pd.DataFrame({path: _typed_column(_path_values(restaurants, path), dtype) for path, dtype in fields.items()})
+
+def _normalize_restaurant_shard(position: int, fields: Dict[str, str] = None) -> pd.DataFrame:
+    return normalize_restaurants(_restaurant_shards[position], fields)
+
+def normalize_restaurants_parallel(restaurants: List[Dict], workers: int = 1, shard_size: int = None, fields: Dict[str, str] = None) -> pd.DataFrame:
     """
-    #mock calling of zomato api into json_responses
-    json_responses = load_json_url_response(RESTAURANT_JSON_URL)
+    Normalizes restaurants on a process pool, for large feeds where json_normalize keeps one core busy.
 
-    #parse responses to df
-    restaurants_df = zomato_api_response_to_df(json_responses)
+    The list is cut into contiguous shards (RESTAURANT_SHARDS_PER_WORKER per worker by default), each worker
+    normalizes shards to columnar chunks, and the chunks are concatenated in order. Columns missing from a
+    shard are filled with NaN, so the result has the same columns, order and values as normalize_restaurants.
+    Where fork is available the workers inherit the shards and only shard numbers are sent, otherwise each
+    shard is pickled to its worker. Moving rows between processes costs about as much as normalizing them,
+    so this only pays off with several free cores.
+
+    Args:
+        restaurants (List[Dict]): The "restaurant" objects of the API responses.
+        workers (int): Number of processes. 1 normalizes in this process.
+        shard_size (int): Restaurants per shard.
+        fields (Dict[str, str]): Dotted paths to extract with their dtypes (see project_restaurants). None flattens every field.
+
+    Returns:
+        pd.DataFrame: One row per restaurant.
+    """
+    global _restaurant_shards
+    if workers <= 1 or len(restaurants) < 2:
+        return normalize_restaurants(restaurants, fields)
+    shard_size = shard_size or math.ceil(len(restaurants) / (workers * RESTAURANT_SHARDS_PER_WORKER))
+    shards = [restaurants[start:start + shard_size] for start in range(0, len(restaurants), shard_size)]
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        _restaurant_shards = shards
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                chunks = list(executor.map(_normalize_restaurant_shard, range(len(shards)), repeat(fields)))
+        finally:
+            _restaurant_shards = []
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(normalize_restaurants, shards, repeat(fields)))
+    return pd.concat(chunks, ignore_index=True, sort=False)
+
+def zomato_api_stream_to_df(stream: BinaryIO, chunk_size: int = RESTAURANT_STREAM_CHUNK_SIZE, fields: Dict[str, str] = None) -> pd.DataFrame:
+    """
+    Converts a stream of Zomato API responses into a pandas DataFrame without loading the whole document.
+
+    The stream holds the same JSON as zomato_api_response_to_df expects (a list of responses). It is parsed
+    incrementally with ijson, restaurants are normalized in chunks of chunk_size, and the columnar chunks are
+    concatenated. Peak memory is roughly the final DataFrame plus one chunk, instead of the raw text, the
+    parsed document and the DataFrame at once.
+
+    Args:
+        stream (BinaryIO): A binary file-like object, e.g. an open file or an HTTP response body.
+        chunk_size (int): Number of restaurants normalized at a time.
+        fields (Dict[str, str]): Dotted paths to extract with their dtypes (see project_restaurants). None flattens every field.
+
+    Returns:
+        pd.DataFrame: A pandas DataFrame containing the extracted restaurant details.
+    """
+    import ijson
+
+    restaurants_chunks = []
+    chunk = []
+    for restaurant in ijson.items(stream, "item.restaurants.item.restaurant", use_float=True):
+        chunk.append(restaurant)
+        if len(chunk) == chunk_size:
+            restaurants_chunks.append(normalize_restaurants(chunk, fields))
+            chunk = []
+    if chunk:
+        restaurants_chunks.append(normalize_restaurants(chunk, fields))
+    if not restaurants_chunks:
+        return pd.DataFrame()
+    return pd.concat(restaurants_chunks, ignore_index=True, sort=False)
+
+def load_zomato_restaurants_streaming(RESTAURANT_JSON_URL: str, chunk_size: int = RESTAURANT_STREAM_CHUNK_SIZE, fields: Dict[str, str] = None) -> pd.DataFrame:
+    """
+    Streams the restaurant feed from a URL or local file into a DataFrame (see zomato_api_stream_to_df).
+
+    Args:
+        RESTAURANT_JSON_URL (str): URL or file path of the restaurant feed.
+        chunk_size (int): Number of restaurants normalized at a time.
+        fields (Dict[str, str]): Dotted paths to extract with their dtypes (see project_restaurants). None flattens every field.
+
+    Returns:
+        pd.DataFrame: A pandas DataFrame containing the extracted restaurant details.
+    """
+    if not RESTAURANT_JSON_URL.startswith(("http://", "https://")):
+        with open(RESTAURANT_JSON_URL, "rb") as f:
+            return zomato_api_stream_to_df(f, chunk_size, fields)
+    with fetch_url(RESTAURANT_JSON_URL, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return zomato_api_stream_to_df(response.raw, chunk_size, fields)
+
+def restaurant_page_urls(page_url_template: str, n_pages: int, page_size: int = RESTAURANT_PAGE_SIZE) -> List[str]:
+    """
+    Expands a page URL template into the URLs of a paginated feed.
+
+    Args:
+        page_url_template (str): URL with a {page} (0-based page number) and/or {start} (offset of the page's
+                                 first restaurant) placeholder, eg. ".../search?entity_id=1&start={start}&count=20".
+        n_pages (int): Number of pages.
+        page_size (int): Restaurants per page, used for {start}.
+
+    Returns:
+        List[str]: One URL per page, in page order.
+    """
+    return [page_url_template.format(page=page, start=page * page_size) for page in range(n_pages)]
+
+def load_zomato_restaurant_pages(page_urls: List[str], max_workers: int = FETCH_WORKERS, per_host_limit: int = PER_HOST_LIMIT,
+                                 fields: Dict[str, str] = None) -> pd.DataFrame:
+    """
+    Downloads the pages of a paginated restaurant feed concurrently and normalizes each page as it arrives.
+
+    Pages are fetched by fetch_json_pages while earlier pages are being normalized, so parsing overlaps the
+    downloads. The page frames are concatenated in page order whatever order they arrived in, giving the same
+    rows as zomato_api_response_to_df over all pages.
+
+    Args:
+        page_urls (List[str]): Page URLs, eg. from restaurant_page_urls. Each page is a Zomato search response
+                               or a list of them.
+        max_workers (int): Maximum number of pages downloading at once.
+        per_host_limit (int): Maximum number of pages downloading at once from the same host.
+        fields (Dict[str, str]): Dotted paths to extract with their dtypes (see project_restaurants). None flattens every field.
+
+    Returns:
+        pd.DataFrame: A pandas DataFrame containing the extracted restaurant details, in page order.
+    """
+    page_dfs = {}
+    for position, page in fetch_json_pages(page_urls, max_workers, per_host_limit):
+        page_dfs[position] = zomato_api_response_to_df(page if isinstance(page, list) else [page], fields=fields)
+    page_dfs = [page_dfs[position] for position in sorted(page_dfs) if not page_dfs[position].empty]
+    if not page_dfs:
+        return pd.DataFrame()
+    return pd.concat(page_dfs, ignore_index=True, sort=False)
+
+def _restaurant_cache_fingerprint(RESTAURANT_JSON_URL:Union[str, List[str]],DATA_FOLDER_DIR:str,COUNTRY_CODE_FILENAME:str,fields:Dict[str, str]=None) -> Optional[str]:
+    #fingerprint of the restaurant source, the country code file and the projection, None if the source can't be fingerprinted
+    if isinstance(RESTAURANT_JSON_URL, str):
+        source_fingerprint = fingerprint_source(RESTAURANT_JSON_URL)
+    else:
+        source_fingerprint = fingerprint_sources(RESTAURANT_JSON_URL)
+    if not source_fingerprint:
+        return None
+    fingerprint = f"{source_fingerprint}|country:{file_sha256(f'{DATA_FOLDER_DIR}/{COUNTRY_CODE_FILENAME}')}"
+    if fields is not None:
+        fingerprint += f"|fields:{json.dumps(fields)}"
+    return fingerprint
+
+def _load_cached_restaurants(cache_dir:str,cache_names:List[str],fingerprint:Optional[str],refresh:bool) -> Optional[List[pd.DataFrame]]:
+    #cached frames if all of them are fresh, printing the hit or the reason of the miss
+    if fingerprint and not refresh:
+        cached_dfs = []
+        for cache_name in cache_names:
+            cached_df, reason = load_cached_df(cache_dir, cache_name, fingerprint)
+            if cached_df is None:
+                break
+            cached_dfs.append(cached_df)
+        else:
+            console.print(f"[green]Restaurant cache hit[/green] ({', '.join(f'{cache_dir}/{name}.parquet' for name in cache_names)})")
+            return cached_dfs
+    else:
+        reason = "refresh requested" if fingerprint else "source fingerprint unavailable"
+    console.print(f"[yellow]Restaurant cache miss[/yellow] ({reason}), rebuilding from source")
+    return None
+
+def load_zomato_restaurant_countries(RESTAURANT_JSON_URL:Union[str, List[str]],DATA_FOLDER_DIR:str,COUNTRY_CODE_FILENAME:str,use_cache:bool=True,stream:bool=False,workers:int=1,fields:Dict[str, str]=None) -> pd.DataFrame:
+    """
+    Loads the restaurant feed and joins the country code table onto it, one row per restaurant.
+
+    The country code table is read from its own Parquet copy (refreshed when the xlsx changes) if use_cache,
+    and joined by a country code lookup. See zomato_restaurant_countries_events_to_df for the arguments.
+
+    Returns:
+        pandas.DataFrame: Restaurants of a known country, with their zomato_events lists.
+    """
+    if not isinstance(RESTAURANT_JSON_URL, str):
+        restaurants_df = load_zomato_restaurant_pages(RESTAURANT_JSON_URL, fields=fields)
+    elif stream:
+        restaurants_df = load_zomato_restaurants_streaming(RESTAURANT_JSON_URL, fields=fields)
+    else:
+        #mock calling of zomato api into json_responses
+        json_responses = load_json_url_response(RESTAURANT_JSON_URL)
+
+        #parse responses to df
+        restaurants_df = zomato_api_response_to_df(json_responses, workers, fields)
 
     #basic validation and data summary
     # print(restaurants_df.info())
@@ -63,68 +296,148 @@ def zomato_restaurant_countries_events_to_df(RESTAURANT_JSON_URL:str,DATA_FOLDER
     #fill empty fields with nan
     restaurants_df.fillna(np.nan,inplace=True)
 
-    #load countries
-    countries_df = load_file_to_df(f"{DATA_FOLDER_DIR}/{COUNTRY_CODE_FILENAME}")
+    #load countries, from the parquet copy unless the xlsx changed
+    cache_dir = f"{DATA_FOLDER_DIR}/{CACHE_SUBDIR}"
+    country_code_path = f"{DATA_FOLDER_DIR}/{COUNTRY_CODE_FILENAME}"
+    countries_df = load_file_to_df_cached(country_code_path, cache_dir, COUNTRY_CODE_CACHE_NAME) if use_cache else load_file_to_df(country_code_path)
 
-    #merge countries_df and restaurants_df
-    restaurants_countries_df,merge_logs = merge_data(restaurants_df,countries_df,"location.country_id","Country Code","inner")
+    #join countries_df onto restaurants_df by country code lookup
+    restaurants_countries_df,merge_logs = lookup_join(restaurants_df,countries_df,"location.country_id","Country Code")
     print(merge_logs)
+    return restaurants_countries_df
+
+#call zomato api and retrieve restaurant details to restaurant_details.csv
+def zomato_restaurant_countries_events_to_df(RESTAURANT_JSON_URL:Union[str, List[str]],DATA_FOLDER_DIR:str,COUNTRY_CODE_FILENAME:str,RESTAURANT_DETAILS_MAP:Dict,use_cache:bool=True,refresh:bool=False,stream:bool=False,workers:int=1,fields:Dict[str, str]=None):
+    """
+    Fetches restaurant data from a Zomato API URL, enriches it with country information,
+    and expands the zomato_events column.
+
+    Every restaurant column is repeated once per event, see zomato_restaurant_countries_events_to_tables
+    for the restaurants and events as two tables instead.
+
+    The final frame is cached as Parquet under DATA_FOLDER_DIR/cache, keyed by a fingerprint of
+    the restaurant source and a hash of the country code file, so a warm start is a single read.
+    On a rebuild, the country code table is read from its own Parquet copy (refreshed when the xlsx
+    changes) and joined by a country code lookup.
+
+    Args:
+        RESTAURANT_JSON_URL (str or List[str]): The URL to fetch restaurant data from the Zomato API, or the page
+                                                URLs of a paginated feed, fetched concurrently (load_zomato_restaurant_pages).
+        DATA_FOLDER_DIR (str): The directory containing the 'Country-Codde' file.
+        RESTAURANT_DETAILS_MAP(dict): Mapping of current df columns required to new names
+        use_cache (bool): Whether to read from and write to the on-disk cache.
+        refresh (bool): Ignore any cached frame and rebuild it from the sources.
+        stream (bool): Parse the feed incrementally and normalize it in chunks to bound peak memory.
+                       Paginated feeds are always normalized page by page.
+        workers (int): Processes normalizing a single (non-streamed) feed, see normalize_restaurants_parallel.
+        fields (Dict[str, str]): Only load these dotted paths, as typed columns (e.g. RESTAURANT_FIELDS, see project_restaurants).
+                                 None flattens every field of the feed. Part of the cache fingerprint.
+
+    Returns:
+        pandas.DataFrame: A DataFrame containing restaurant details enriched with country
+                          information and expanded zomato_events.
+    """
+    cache_dir = f"{DATA_FOLDER_DIR}/{CACHE_SUBDIR}"
+    fingerprint = None
+    if use_cache:
+        fingerprint = _restaurant_cache_fingerprint(RESTAURANT_JSON_URL, DATA_FOLDER_DIR, COUNTRY_CODE_FILENAME, fields)
+        cached_dfs = _load_cached_restaurants(cache_dir, [RESTAURANT_CACHE_NAME], fingerprint, refresh)
+        if cached_dfs is not None:
+            return cached_dfs[0]
+
+    restaurants_countries_df = load_zomato_restaurant_countries(RESTAURANT_JSON_URL, DATA_FOLDER_DIR, COUNTRY_CODE_FILENAME,
+                                                                use_cache, stream, workers, fields)
 
     #expand zomate_events column
     restaurants_countries_expanded_df = restaurants_countries_df.explode('zomato_events')
     
     # print(filtered_restaurants_countries_expanded_df['zomato_events'][0])
+    if fingerprint:
+        save_cached_df(restaurants_countries_expanded_df, cache_dir, RESTAURANT_CACHE_NAME, fingerprint)
     return restaurants_countries_expanded_df
 
-def zomato_restaurant_details_to_csv(restaurant_details_df_main:pd.DataFrame,RESTAURANT_DETAILS_MAP:Dict,RESTAURANT_DETAILS_FILENAME:str,DATA_FOLDER_DIR:str):
+def zomato_restaurant_countries_events_to_tables(RESTAURANT_JSON_URL:Union[str, List[str]],DATA_FOLDER_DIR:str,COUNTRY_CODE_FILENAME:str,use_cache:bool=True,refresh:bool=False,stream:bool=False,workers:int=1,fields:Dict[str, str]=None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Fetches restaurant data enriched with country information, as a restaurants table and an events table.
+
+    Unlike zomato_restaurant_countries_events_to_df, restaurant columns are not repeated per event: events
+    are parsed once into their own typed table (build_events_table), indexed by the row label of their
+    restaurant, and consumers join only the restaurant columns they need. Both tables are cached as Parquet
+    under DATA_FOLDER_DIR/cache with the same fingerprint. See zomato_restaurant_countries_events_to_df for the arguments.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: One row per restaurant (without zomato_events), and one row per event
+                                           with restaurant_id, event_id, start_date, end_date, title and photos.
+    """
+    cache_dir = f"{DATA_FOLDER_DIR}/{CACHE_SUBDIR}"
+    fingerprint = None
+    if use_cache:
+        fingerprint = _restaurant_cache_fingerprint(RESTAURANT_JSON_URL, DATA_FOLDER_DIR, COUNTRY_CODE_FILENAME, fields)
+        cached_dfs = _load_cached_restaurants(cache_dir, [RESTAURANT_TABLE_CACHE_NAME, RESTAURANT_EVENTS_TABLE_CACHE_NAME], fingerprint, refresh)
+        if cached_dfs is not None:
+            return cached_dfs[0], cached_dfs[1]
+
+    restaurants_countries_df = load_zomato_restaurant_countries(RESTAURANT_JSON_URL, DATA_FOLDER_DIR, COUNTRY_CODE_FILENAME,
+                                                                use_cache, stream, workers, fields)
+
+    #parse the events once into their own table, keyed by the restaurant's row
+    events_df = build_events_table(restaurants_countries_df['zomato_events'], restaurants_countries_df['id'])
+    restaurants_df = restaurants_countries_df.drop(columns='zomato_events')
+
+    if fingerprint:
+        save_cached_df(restaurants_df, cache_dir, RESTAURANT_TABLE_CACHE_NAME, fingerprint)
+        save_cached_df(events_df, cache_dir, RESTAURANT_EVENTS_TABLE_CACHE_NAME, fingerprint)
+    return restaurants_df, events_df
+
+def zomato_restaurant_details_to_csv(restaurant_details_df_main:pd.DataFrame,RESTAURANT_DETAILS_MAP:Dict,RESTAURANT_DETAILS_FILENAME:str,DATA_FOLDER_DIR:str,raise_errors:bool=False,events_df:Optional[pd.DataFrame]=None):
     """
     Fetches dataframe that contains restaurant and country details with expanded events field
 
+    Only the columns in RESTAURANT_DETAILS_MAP are taken from the frame before any work is done, event
+    start dates are parsed in one vectorized pass, and the output is written in chunks. The format is
+    picked by the file extension (.csv, .csv.gz, .csv.bz2, .csv.xz or .parquet).
+
+    Given events_df, restaurant_details_df_main is the restaurants table and the start date of each event is
+    joined from events_df instead (one row per event, restaurants without events keeping a single row).
+
     Args:
         restaurant_details_df_main (pd.DataFrame)
-        RESTAURANT_JSON_URL (str): The URL to fetch restaurant data from the Zomato API.
+        RESTAURANT_DETAILS_MAP (dict): Mapping of the columns to export to their output names.
+        RESTAURANT_DETAILS_FILENAME (str): Name of the output file inside DATA_FOLDER_DIR.
         DATA_FOLDER_DIR (str): The directory containing the 'Country-Code.xlsx' file.
+        raise_errors (bool): Re-raise errors after printing them instead of only printing them.
+        events_df (Optional[pd.DataFrame]): Events table from zomato_restaurant_countries_events_to_tables.
 
     Returns:
         pandas.DataFrame: A DataFrame containing restaurant details with country
                           information and start date of each event according to map
     """
-    #func to apply to restaurant_details_df to only leave event start date in event column
-    def extract_and_convert_date(event_details):
-        """
-        Extracts the start date from event details.
-
-        Args:
-            event_details: A dictionary containing event information.
-
-        Returns:
-            pandas.Timestamp.date: A date object representing the start date if valid,
-                                or 'NA' if the date is invalid or missing.
-        """
-        try:
-            if isinstance(event_details, dict) and 'event' in event_details:
-                date_str = event_details['event'].get('start_date')
-                if date_str:
-                    pd.to_datetime(date_str).date() #Check if it can be converted.
-                    return pd.to_datetime(date_str).date()
-            return np.nan
-        except (ValueError, TypeError): 
-            return np.nan
-        except:
-            return np.nan
-    #create copy
-    restaurant_details_df = restaurant_details_df_main.copy()
     try:
-        #apply above function extract start date of event
-        restaurant_details_df['zomato_events'] = restaurant_details_df['zomato_events'].apply(extract_and_convert_date)
+        if events_df is None:
+            #select only the exported columns
+            restaurant_details_df = extract_columns(restaurant_details_df_main, list(RESTAURANT_DETAILS_MAP.keys()))
+            #only leave the event start date in the event column
+            restaurant_details_df['zomato_events'] = extract_events_columns(restaurant_details_df['zomato_events'])['start_date'].to_numpy()
+        else:
+            #select the exported restaurant columns, and join the already parsed event start dates onto them
+            restaurant_columns = [col for col in RESTAURANT_DETAILS_MAP if col != 'zomato_events']
+            restaurant_details_df = extract_columns(restaurant_details_df_main, restaurant_columns).join(
+                events_df['start_date'].rename('zomato_events'), how='left')[list(RESTAURANT_DETAILS_MAP)]
         #convert user_aggregate_rating to float type
         restaurant_details_df["user_rating.aggregate_rating"] = restaurant_details_df["user_rating.aggregate_rating"].astype(float)
-        #extract and save result
-        extract_rename_save_csv(restaurant_details_df,DATA_FOLDER_DIR,RESTAURANT_DETAILS_FILENAME,RESTAURANT_DETAILS_MAP)
+        #rename and save result
+        save_df(restaurant_details_df.rename(columns=RESTAURANT_DETAILS_MAP), f"{DATA_FOLDER_DIR}/{RESTAURANT_DETAILS_FILENAME}")
+        print(f"Restaurant details saved to {RESTAURANT_DETAILS_FILENAME}")
+        return restaurant_details_df
     except KeyError as e:
         print(f"KeyError: Missing key in DataFrame or mapping: {e}")
+        if raise_errors:
+            raise
     except FileNotFoundError as e:
         print(f"FileNotFoundError: Could not save to file: {e}")
+        if raise_errors:
+            raise
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
-
+        if raise_errors:
+            raise
@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from utils.extract_rename_save_csv import extract_rename_save_csv
 import numpy as np
  #func to extract start and end dates of events in df
@@ -28,7 +28,49 @@ def extract_dates_title_eventId(event_details:Dict):
         return np.nan, np.nan, np.nan , np.nan
     except (ValueError, TypeError):
         return np.nan, np.nan, np.nan , np.nan
-    
+
+#func to convert event title/id to str, leaving missing values as nan
+def _to_str_or_nan(value):
+    if isinstance(value, float) and np.isnan(value):
+        return value
+    return str(value)
+
+#func to extract start and end dates, title and event id of all events in one pass
+def extract_events_columns(zomato_events: pd.Series) -> pd.DataFrame:
+    """
+    Extracts the start and end dates, title, and event ID from a Series of event details.
+
+    The nested dicts are walked once into plain lists and the dates are then parsed with a
+    single vectorized pd.to_datetime call per column, instead of building a pd.Series per row.
+
+    Args:
+        zomato_events (pd.Series): A Series where each value is a dictionary containing event information.
+
+    Returns:
+        pd.DataFrame: A DataFrame with columns (start_date, end_date, title, event_id), sharing the index
+                      of zomato_events. Missing or invalid dates are NaT, missing titles/ids are NaN.
+    """
+    start_dates, end_dates, titles, event_ids = [], [], [], []
+    for event_details in zomato_events:
+        event = event_details.get('event') if isinstance(event_details, dict) else None
+        if isinstance(event, dict):
+            start_dates.append(event.get('start_date') or None)
+            end_dates.append(event.get('end_date') or None)
+            titles.append(_to_str_or_nan(event.get('title', np.nan)))
+            event_ids.append(_to_str_or_nan(event.get('event_id', np.nan)))
+        else:
+            start_dates.append(None)
+            end_dates.append(None)
+            titles.append(np.nan)
+            event_ids.append(np.nan)
+
+    return pd.DataFrame({
+        'start_date': pd.to_datetime(start_dates, errors='coerce', format='ISO8601').normalize(),
+        'end_date': pd.to_datetime(end_dates, errors='coerce', format='ISO8601').normalize(),
+        'title': pd.array(titles, dtype=object),
+        'event_id': pd.array(event_ids, dtype=object),
+    }, index=zomato_events.index)
+
 #func to extract photos from events
 def extract_photos(event_details):
     """
@@ -64,8 +106,209 @@ def extract_photos_url(photo_details:Dict):
         return np.nan
     except:
         return np.nan
+#func to parse the events of every restaurant once into their own table
+def build_events_table(zomato_events: pd.Series, restaurant_ids: pd.Series) -> pd.DataFrame:
+    """
+    Builds a table with one row per event from the zomato_events lists of a one-row-per-restaurant frame.
+
+    Only the event lists are exploded, not the restaurant columns. Each event is parsed once into typed
+    columns, and its photos into a list of urls.
+
+    Args:
+        zomato_events (pd.Series): The zomato_events column, a list of event dicts (or NaN) per restaurant.
+        restaurant_ids (pd.Series): The id column of the same frame.
+
+    Returns:
+        pd.DataFrame: Columns (restaurant_id, event_id, start_date, end_date, title, photos), indexed by the row label of
+                      each event's restaurant so that restaurant columns join by index. Restaurants without events have no rows.
+    """
+    exploded_events = zomato_events.explode()
+    exploded_events = exploded_events[[isinstance(event_details, dict) for event_details in exploded_events]]
+    events_df = extract_events_columns(exploded_events)
+    events_df.insert(0, 'restaurant_id', restaurant_ids.loc[exploded_events.index].to_numpy())
+    events_df.insert(1, 'event_id', events_df.pop('event_id'))
+    events_df['photos'] = [[extract_photos_url(photo_details) for photo_details in extract_photos(event_details)]
+                           for event_details in exploded_events]
+    return events_df
+
+#func to get the first day of the month and of the following month from mm_yyyy
+def month_bounds(mm_yyyy: str) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    Returns the start of the month and the start of the following month for a 'MM_YYYY' string.
+
+    Args:
+        mm_yyyy (str): The month and year in 'MM_YYYY' format.
+
+    Returns:
+        tuple: (start_of_month, start_of_next_month)
+    """
+    month, year = map(int, mm_yyyy.split('_'))
+    start_of_month = pd.Timestamp(year, month, 1)
+    return start_of_month, start_of_month + pd.DateOffset(months=1)
+
+def month_range(start_mm_yyyy: str, end_mm_yyyy: str) -> List[str]:
+    """
+    Lists every month from start_mm_yyyy to end_mm_yyyy inclusive, in 'MM_YYYY' format.
+
+    Args:
+        start_mm_yyyy (str): First month in 'MM_YYYY' format.
+        end_mm_yyyy (str): Last month in 'MM_YYYY' format.
+
+    Returns:
+        List[str]: The months in order.
+    """
+    periods = pd.period_range(month_bounds(start_mm_yyyy)[0], month_bounds(end_mm_yyyy)[0], freq='M')
+    return [period.strftime('%m_%Y') for period in periods]
+
+def build_event_date_index(events_df: pd.DataFrame) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Builds a sorted index over the start and end dates of events for range queries.
+
+    Args:
+        events_df (pd.DataFrame): Output of extract_events_columns.
+
+    Returns:
+        dict: For 'start_date' and 'end_date', a tuple of (sorted dates, row positions in sorted order).
+              Missing dates (NaT) sort last and never match a range.
+    """
+    event_date_index = {}
+    for col in ['start_date', 'end_date']:
+        dates = events_df[col].to_numpy(dtype='datetime64[ns]')
+        order = np.argsort(dates, kind='stable')
+        event_date_index[col] = (dates[order], order)
+    return event_date_index
+
+def query_event_date_index(event_date_index: Dict[str, Tuple[np.ndarray, np.ndarray]], range_start: pd.Timestamp, range_end: pd.Timestamp) -> np.ndarray:
+    """
+    Finds events whose start date or end date falls in [range_start, range_end).
+
+    Args:
+        event_date_index (dict): Index from build_event_date_index.
+        range_start (pd.Timestamp): Inclusive start of the range.
+        range_end (pd.Timestamp): Exclusive end of the range.
+
+    Returns:
+        np.ndarray: Sorted row positions of the matching events.
+    """
+    bounds = np.array([range_start.to_datetime64(), range_end.to_datetime64()], dtype='datetime64[ns]')
+    matches = []
+    for sorted_dates, order in event_date_index.values():
+        lo, hi = np.searchsorted(sorted_dates, bounds, side='left')
+        matches.append(order[lo:hi])
+    return np.union1d(*matches)
+
+#extract events for several months from a single parse of the event dates
+def extract_restaurant_events_by_months(months: List[str], expanded_zomato_restaurants_main_df: pd.DataFrame, DATA_FOLDER_DIR: str, RESTAURANTS_EVENT_MAP: Dict, RESTAURANT_EVENTS_FILENAME: str, raise_errors: bool = False,
+                                        events_df: Optional[pd.DataFrame] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Extracts and filters restaurant events for several months, writing one CSV per month.
+
+    Event dates are extracted and parsed once, and a sorted index over start and end dates is
+    queried per month, so each extra month costs a binary search plus its own output instead of
+    a full pass over the frame.
+
+    Given events_df (from build_events_table), expanded_zomato_restaurants_main_df is the restaurants table: the
+    events are already parsed, and only the restaurant rows of each month's events are taken from it.
+
+    Args:
+        months (List[str]): Months in 'MM_YYYY' format, e.g. from month_range.
+        expanded_zomato_restaurants_main_df (pd.DataFrame): DataFrame containing restaurant event details.
+        DATA_FOLDER_DIR (str): Directory path to save the processed CSV files.
+        RESTAURANTS_EVENT_MAP (dict): Mapping for renaming event-related columns.
+        RESTAURANT_EVENTS_FILENAME (str): Filename for saving the event data of a month. A '{mm_yyyy}'
+                                          placeholder is replaced by the month, and is required for several months.
+        raise_errors (bool): Re-raise errors after printing them instead of returning an empty dict.
+        events_df (Optional[pd.DataFrame]): Events table, indexed by the row label of each event's restaurant.
+
+    Returns:
+        Dict[str, pd.DataFrame]: For each month, the rows with an event starting or ending in it.
+
+    Raises:
+        ValueError: If several months would be written to the same file, the filename lacking '{mm_yyyy}'.
+    """
+    if len(set(months)) > 1 and "{mm_yyyy}" not in RESTAURANT_EVENTS_FILENAME:
+        raise ValueError(f"'{RESTAURANT_EVENTS_FILENAME}' has no {{mm_yyyy}} placeholder, every month would overwrite the same file")
+    try:
+        if events_df is None:
+            #parse event details once, each row holding at most one event
+            events_df = extract_events_columns(expanded_zomato_restaurants_main_df['zomato_events'])
+            restaurant_rows = np.arange(len(expanded_zomato_restaurants_main_df))
+        else:
+            restaurant_rows = expanded_zomato_restaurants_main_df.index.get_indexer(events_df.index)
+        #index the event dates
+        event_date_index = build_event_date_index(events_df)
+
+        filtered_dfs = {}
+        for mm_yyyy in months:
+            #rows whose start or end date falls in the month
+            positions = query_event_date_index(event_date_index, *month_bounds(mm_yyyy))
+            filtered_df = expanded_zomato_restaurants_main_df.iloc[restaurant_rows[positions]].copy()
+            for col in events_df.columns:
+                filtered_df[col] = events_df[col].to_numpy()[positions]
+
+            if 'photos' in events_df.columns:
+                #photo urls were extracted with the events
+                filtered_photos_expanded_df = filtered_df.explode('photos')
+            else:
+                #extract photos, and then each photo's url link
+                filtered_df['photos'] = filtered_df['zomato_events'].apply(extract_photos)
+                filtered_photos_expanded_df = filtered_df.explode('photos')
+                filtered_photos_expanded_df['photos'] = filtered_photos_expanded_df['photos'].apply(extract_photos_url)
+
+            extract_rename_save_csv(filtered_photos_expanded_df, DATA_FOLDER_DIR, RESTAURANT_EVENTS_FILENAME.format(mm_yyyy=mm_yyyy), RESTAURANTS_EVENT_MAP)
+            filtered_dfs[mm_yyyy] = filtered_df
+        return filtered_dfs
+
+    except Exception as e:
+        print(f"Error in extract_restaurant_events_by_months: {e}")
+        if raise_errors:
+            raise
+        return {}
+
+def _iso_date_or_none(value):
+    return None if pd.isna(value) else value.date().isoformat()
+
+def build_restaurant_events_table(expanded_zomato_restaurants_main_df: pd.DataFrame, events_df: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Dict[str, Tuple[np.ndarray, np.ndarray]]]:
+    """
+    Builds an in-memory events table and its date index, for answering month queries without writing CSVs.
+
+    Rows stay aligned with the positions of the events (the rows of the input frame, or of events_df), so
+    positions from query_event_date_index select rows of the table directly.
+
+    Args:
+        expanded_zomato_restaurants_main_df (pd.DataFrame): Restaurants with one row per event (zomato_events), plus id and name.
+                                                            With events_df, the restaurants table.
+        events_df (Optional[pd.DataFrame]): Events table from build_events_table.
+
+    Returns:
+        Tuple[pd.DataFrame, dict]: The table (event_id, restaurant_id, restaurant_name, event_title, event_start_date,
+                                   event_end_date as ISO dates, photo_urls as lists, missing values as None) and the
+                                   index from build_event_date_index.
+    """
+    if events_df is None:
+        events_df = extract_events_columns(expanded_zomato_restaurants_main_df['zomato_events'])
+        photo_urls = [[url for url in map(extract_photos_url, extract_photos(event)) if isinstance(url, str)]
+                      for event in expanded_zomato_restaurants_main_df['zomato_events']]
+        restaurants_df = expanded_zomato_restaurants_main_df
+    else:
+        photo_urls = [[url for url in photos if isinstance(url, str)] for photos in events_df['photos']]
+        restaurants_df = expanded_zomato_restaurants_main_df.loc[events_df.index]
+    events_table_df = pd.DataFrame({
+        'event_id': events_df['event_id'].to_numpy(),
+        'restaurant_id': restaurants_df['id'].to_numpy(),
+        'restaurant_name': restaurants_df['name'].to_numpy(),
+        'event_title': events_df['title'].to_numpy(),
+        'event_start_date': [_iso_date_or_none(value) for value in events_df['start_date']],
+        'event_end_date': [_iso_date_or_none(value) for value in events_df['end_date']],
+        'photo_urls': photo_urls,
+    })
+    #missing ids, names and titles become None, NaN is not valid JSON
+    events_table_df = events_table_df.astype(object).where(events_table_df.notna(), None)
+    return events_table_df, build_event_date_index(events_df)
+
 #extract events
-def extract_restaurant_events_by_mm_yyyy(mm_yyyy: str, expanded_zomato_restaurants_main_df: pd.DataFrame, DATA_FOLDER_DIR: str, RESTAURANTS_EVENT_MAP: Dict, RESTAURANT_EVENTS_FILENAME: str) -> pd.DataFrame:
+def extract_restaurant_events_by_mm_yyyy(mm_yyyy: str, expanded_zomato_restaurants_main_df: pd.DataFrame, DATA_FOLDER_DIR: str, RESTAURANTS_EVENT_MAP: Dict, RESTAURANT_EVENTS_FILENAME: str, raise_errors: bool = False,
+                                        events_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Extracts and filters restaurant events based on a given month and year.
 
@@ -75,43 +318,12 @@ def extract_restaurant_events_by_mm_yyyy(mm_yyyy: str, expanded_zomato_restauran
         DATA_FOLDER_DIR (str): Directory path to save the processed CSV file.
         RESTAURANTS_EVENT_MAP (dict): Mapping for renaming event-related columns.
         RESTAURANT_EVENTS_FILENAME (str): Filename for saving the processed event data.
+        raise_errors (bool): Re-raise errors after printing them instead of returning an empty DataFrame.
+        events_df (Optional[pd.DataFrame]): Events table, see extract_restaurant_events_by_months.
 
     Returns:
         pd.DataFrame: The filtered DataFrame containing relevant events within the specified month and year.
     """
-    try:
-        #copy main df to avoid conflicts
-        expanded_zomato_restaurants_df = expanded_zomato_restaurants_main_df.copy()
-        #extract necessary event details to separate cols
-        expanded_zomato_restaurants_df[['start_date', 'end_date', 'title', 'event_id']] = expanded_zomato_restaurants_df['zomato_events'].apply(lambda event: pd.Series(extract_dates_title_eventId(event)))
-
-        #get date range to search from mm_yyyy string
-        month, year = map(int, mm_yyyy.split('_'))
-        start_of_month = pd.Timestamp(year, month, 1)
-        end_of_month = start_of_month + pd.DateOffset(months=1) - pd.Timedelta(days=1)
-
-        #convert start and end date columns to datetime
-        expanded_zomato_restaurants_df['start_date'] = pd.to_datetime(expanded_zomato_restaurants_df['start_date'], errors='coerce')
-        expanded_zomato_restaurants_df['end_date'] = pd.to_datetime(expanded_zomato_restaurants_df['end_date'], errors='coerce')
-
-        #compare mm_yyyy range with every col's start and end date
-        filtered_df = expanded_zomato_restaurants_df[
-            ((expanded_zomato_restaurants_df['start_date'].notna()) &
-             (expanded_zomato_restaurants_df['start_date'] >= start_of_month) &
-             (expanded_zomato_restaurants_df['start_date'] <= end_of_month)) |
-            ((expanded_zomato_restaurants_df['end_date'].notna()) &
-             (expanded_zomato_restaurants_df['end_date'] >= start_of_month) &
-             (expanded_zomato_restaurants_df['end_date'] <= end_of_month))
-        ].copy()
-
-        #extract photos, and then each photo's url link
-        filtered_df['photos'] = filtered_df['zomato_events'].apply(extract_photos)
-        filtered_photos_expanded_df = filtered_df.explode('photos')
-        filtered_photos_expanded_df['photos'] = filtered_photos_expanded_df['photos'].apply(extract_photos_url)
-
-        extract_rename_save_csv(filtered_photos_expanded_df, DATA_FOLDER_DIR, RESTAURANT_EVENTS_FILENAME, RESTAURANTS_EVENT_MAP)
-        return filtered_df
-
-    except Exception as e:
-        print(f"Error in extract_restaurant_events_by_mm_yyyy: {e}")
-        return pd.DataFrame()
+    filtered_dfs = extract_restaurant_events_by_months([mm_yyyy], expanded_zomato_restaurants_main_df, DATA_FOLDER_DIR,
+                                                       RESTAURANTS_EVENT_MAP, RESTAURANT_EVENTS_FILENAME, raise_errors, events_df)
+    return filtered_dfs.get(mm_yyyy, pd.DataFrame())
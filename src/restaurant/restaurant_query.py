@@ -0,0 +1,228 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+ID_COLUMN = 'id'
+CITY_COLUMN = 'location.city'
+COUNTRY_COLUMN = 'Country'
+CUISINES_COLUMN = 'cuisines'
+RATING_COLUMN = 'user_rating.aggregate_rating'
+VOTES_COLUMN = 'user_rating.votes'
+EVENTS_COLUMN = 'zomato_events'
+QUERY_CACHE_SIZE = 1024
+
+def normalize_term(value) -> str:
+    """Case-folds a city, country or cuisine and collapses its whitespace, so lookups ignore case and spacing."""
+    return " ".join(str(value).split()).casefold()
+
+def _as_terms(values: Union[None, str, Iterable[str]]) -> Tuple[str, ...]:
+    if values is None:
+        return ()
+    if isinstance(values, str):
+        values = [values]
+    return tuple(sorted({normalize_term(value) for value in values if str(value).strip()}))
+
+def _as_bound(value) -> Optional[float]:
+    return None if value is None else float(value)
+
+def _postings(values: pd.Series, separator: Optional[str] = None) -> Dict[str, np.ndarray]:
+    #sorted row positions of each normalized term, splitting values on separator; each distinct value is normalized once
+    codes, uniques = pd.factorize(values)
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    postings: Dict[str, List[np.ndarray]] = {}
+    for code, value in enumerate(uniques):
+        terms = str(value).split(separator) if separator else [str(value)]
+        for term in {normalize_term(term) for term in terms if term.strip()}:
+            postings.setdefault(term, []).append(order[bounds[code]:bounds[code + 1]])
+    return {term: np.sort(np.concatenate(rows)) for term, rows in postings.items()}
+
+def _sorted_index(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    #(sorted values, row positions in sorted order), missing values left out
+    present = np.flatnonzero(~np.isnan(values))
+    order = present[np.argsort(values[present], kind='stable')]
+    return values[order], order
+
+def _range(sorted_index: Tuple[np.ndarray, np.ndarray], low: Optional[float], high: Optional[float]) -> np.ndarray:
+    #sorted row positions with low <= value <= high
+    sorted_values, order = sorted_index
+    lo = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+    hi = len(sorted_values) if high is None else np.searchsorted(sorted_values, high, side='right')
+    return np.sort(order[lo:hi])
+
+def _union(postings: List[np.ndarray]) -> np.ndarray:
+    if not postings:
+        return np.empty(0, dtype=np.int64)
+    return postings[0] if len(postings) == 1 else np.unique(np.concatenate(postings))
+
+class RestaurantQueryIndex:
+    """
+    Indexes over the restaurants table for filtering by city, country, cuisine, rating and votes.
+
+    Built once per table: an inverted index of row positions per city and per country, an inverted index
+    over the comma-separated cuisines, and sorted indexes of aggregate rating and votes for range queries.
+    A query intersects the row positions of the city, country and cuisine filters, smallest first, then checks
+    rating and votes on the remaining rows; a query on ranges alone starts from a sorted index. Results are
+    memoized in a bounded LRU, so a repeated query is a dict lookup.
+    """
+    def __init__(self, restaurants_df: pd.DataFrame, column_map: Dict[str, str], cache_size: int = QUERY_CACHE_SIZE):
+        """
+        Args:
+            restaurants_df (pd.DataFrame): One row per restaurant, e.g. the restaurants table of
+                                           zomato_restaurant_countries_events_to_tables. A frame exploded per
+                                           event is reduced to the first row of each restaurant id.
+            column_map (Dict[str, str]): Columns returned by records() with their output names, e.g.
+                                         RESTAURANT_DETAILS_MAP. Columns missing from the frame, and the per-event
+                                         zomato_events, are skipped.
+            cache_size (int): Maximum number of memoized queries.
+        """
+        if restaurants_df[ID_COLUMN].duplicated().any():
+            restaurants_df = restaurants_df.drop_duplicates(subset=ID_COLUMN)
+        self.restaurants_df = restaurants_df
+
+        self.city_postings = _postings(restaurants_df[CITY_COLUMN])
+        self.country_postings = _postings(restaurants_df[COUNTRY_COLUMN])
+        self.cuisine_postings = _postings(restaurants_df[CUISINES_COLUMN], separator=',')
+        ratings = pd.to_numeric(restaurants_df[RATING_COLUMN], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        votes = pd.to_numeric(restaurants_df[VOTES_COLUMN], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        self.ratings = ratings
+        self.votes = votes
+        self.rating_index = _sorted_index(ratings)
+        self.votes_index = _sorted_index(votes)
+
+        #results are ordered by rating, best first, then by votes and feed order; unrated restaurants last
+        result_order = np.lexsort((np.arange(len(restaurants_df)), -np.nan_to_num(votes, nan=-1), -np.nan_to_num(ratings, nan=-np.inf)))
+        self.result_rank = np.empty(len(restaurants_df), dtype=np.int64)
+        self.result_rank[result_order] = np.arange(len(restaurants_df))
+
+        #result records are built on first use and kept
+        self._result_columns = {column_map[col]: restaurants_df[col].to_numpy(dtype=object)
+                                for col in column_map if col in restaurants_df.columns and col != EVENTS_COLUMN}
+        self._records: List[Optional[Dict]] = [None] * len(restaurants_df)
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.restaurants_df)
+
+    def _record(self, position: int) -> Dict:
+        record = self._records[position]
+        if record is None:
+            record = {name: None if pd.isna(values[position]) else values[position] for name, values in self._result_columns.items()}
+            self._records[position] = record
+        return record
+
+    def _cuisine_matches(self, needle: str) -> np.ndarray:
+        #restaurants with a cuisine containing the needle, e.g. "indian" matches "north indian" and "south indian"
+        return _union([positions for cuisine, positions in self.cuisine_postings.items() if needle in cuisine])
+
+    def _evaluate(self, cities: Tuple[str, ...], countries: Tuple[str, ...], cuisines: Tuple[str, ...], min_rating: Optional[float],
+                  max_rating: Optional[float], min_votes: Optional[float]) -> np.ndarray:
+        candidates = []
+        if cities:
+            candidates.append(_union([self.city_postings[city] for city in cities if city in self.city_postings]))
+        if countries:
+            candidates.append(_union([self.country_postings[country] for country in countries if country in self.country_postings]))
+        candidates += [self._cuisine_matches(cuisine) for cuisine in cuisines]
+        ranges = [(values, sorted_index, low, high) for values, sorted_index, low, high in
+                  [(self.ratings, self.rating_index, min_rating, max_rating), (self.votes, self.votes_index, min_votes, None)]
+                  if low is not None or high is not None]
+
+        if candidates:
+            candidates.sort(key=len)
+            positions = candidates[0]
+            for other in candidates[1:]:
+                if len(positions) == 0:
+                    break
+                positions = np.intersect1d(positions, other, assume_unique=True)
+        elif ranges:
+            #no term filter, the first range comes from its sorted index
+            values, sorted_index, low, high = ranges.pop(0)
+            positions = _range(sorted_index, low, high)
+        else:
+            positions = np.arange(len(self.restaurants_df))
+        #the remaining ranges are checked on the candidates, cheaper than intersecting a wide range
+        for values, _, low, high in ranges:
+            candidate_values = values[positions]
+            keep = ~np.isnan(candidate_values)
+            if low is not None:
+                keep &= candidate_values >= low
+            if high is not None:
+                keep &= candidate_values <= high
+            positions = positions[keep]
+        return positions[np.argsort(self.result_rank[positions], kind='stable')]
+
+    def query(self, city: Union[None, str, Iterable[str]] = None, country: Union[None, str, Iterable[str]] = None,
+              cuisine: Union[None, str, Iterable[str]] = None, min_rating: Optional[float] = None, max_rating: Optional[float] = None,
+              min_votes: Optional[float] = None) -> np.ndarray:
+        """
+        Finds the restaurants matching every given filter.
+
+        Cities and countries match case-insensitively, any of several values. Each cuisine must be contained
+        in one of a restaurant's cuisines, e.g. "pizza" or "indian".
+
+        Args:
+            city (str or List[str]): City or cities.
+            country (str or List[str]): Country or countries, as named in Country-Code.xlsx.
+            cuisine (str or List[str]): Cuisine(s) the restaurant must serve.
+            min_rating (Optional[float]): Lowest aggregate rating, inclusive.
+            max_rating (Optional[float]): Highest aggregate rating, inclusive.
+            min_votes (Optional[float]): Lowest number of votes, inclusive.
+
+        Returns:
+            np.ndarray: Read-only row positions in the restaurants table, best rated first.
+        """
+        key = (_as_terms(city), _as_terms(country), _as_terms(cuisine), _as_bound(min_rating), _as_bound(max_rating), _as_bound(min_votes))
+        with self._lock:
+            positions = self._cache.get(key)
+            if positions is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return positions
+            self.misses += 1
+
+        positions = self._evaluate(*key)
+        positions.setflags(write=False)
+        with self._lock:
+            self._cache[key] = positions
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return positions
+
+    def search(self, limit: Optional[int] = None, **filters) -> pd.DataFrame:
+        """
+        Returns the rows of the restaurants table matching the filters of query(), best rated first.
+
+        Args:
+            limit (Optional[int]): Maximum number of rows.
+            **filters: Keyword arguments of query().
+
+        Returns:
+            pd.DataFrame: The matching restaurants.
+        """
+        return self.restaurants_df.iloc[self.query(**filters)[:limit]]
+
+    def records(self, limit: Optional[int] = None, **filters) -> List[Dict]:
+        """
+        Returns the matching restaurants as dicts of the columns in column_map, best rated first.
+
+        Each restaurant's dict is built on first use and shared between queries, so it must not be modified.
+
+        Args:
+            limit (Optional[int]): Maximum number of restaurants.
+            **filters: Keyword arguments of query().
+
+        Returns:
+            List[dict]: One dict per restaurant, missing values as None.
+        """
+        return [self._record(position) for position in self.query(**filters)[:limit]]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._cache), "hits": self.hits, "misses": self.misses}
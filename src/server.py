@@ -0,0 +1,198 @@
+import argparse
+import json
+import re
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+import pandas as pd
+from carpark.address_index import AddressIndex
+from carpark.availability_poller import CarparkAvailabilityPoller
+from carpark.carpark_index import normalize_address
+from carpark.result_cache import CarparkResultCache
+from restaurant.restaurant_events import build_restaurant_events_table, month_bounds, query_event_date_index
+from restaurant.restaurant_query import RestaurantQueryIndex
+from config import (RESTAURANT_DETAILS_MAP, DATA_FOLDER_DIR, RESTAURANT_JSON_URL, COUNTRY_CODE_FILENAME, MM_YYYY_PATTERN,
+                    DATA_GOV_TRANSPORT_API_URL, CARPARK_STATIC_CSV_URL, CARPARK_POLL_INTERVAL_SECONDS, RESTAURANT_FIELDS)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+SUGGESTION_LIMIT = 5
+RESTAURANT_SEARCH_LIMIT = 20
+
+def carpark_response(carpark_index: Dict, carpark_number: str) -> Optional[Dict]:
+    """The /carparks/{number} body: the indexed record with its carpark number, or None if unknown."""
+    record = carpark_index["carpark_number"].get(carpark_number)
+    return None if record is None else {"carpark_number": carpark_number, **record}
+
+class QueryService:
+    """
+    Answers carpark and restaurant queries from in-memory indexes.
+
+    Carpark lookups read the poller's latest snapshot, so a background refresh never blocks a request.
+    Restaurant events are indexed by date once, and each month query is a binary search. Restaurant searches
+    go through a RestaurantQueryIndex.
+
+    Args:
+        poller (CarparkAvailabilityPoller): Poller holding the carpark snapshots. It is started by main().
+        restaurants_df (pd.DataFrame): Restaurants with one row per event, as from zomato_restaurant_countries_events_to_df,
+                                       or the restaurants table if events_df is given.
+        events_df (Optional[pd.DataFrame]): Events table, as from zomato_restaurant_countries_events_to_tables.
+    """
+    def __init__(self, poller: CarparkAvailabilityPoller, restaurants_df: pd.DataFrame, events_df: Optional[pd.DataFrame] = None):
+        self.poller = poller
+        self.address_index = AddressIndex(poller.snapshot.carparks_data_merged_df['address'])
+        self.result_cache = CarparkResultCache()
+        self.events_table_df, self.event_date_index = build_restaurant_events_table(restaurants_df, events_df)
+        self.restaurant_query_index = RestaurantQueryIndex(restaurants_df, RESTAURANT_DETAILS_MAP)
+        #the events table never changes, so each month's response is built once
+        self._events_by_month: Dict[str, Dict] = {}
+
+    def carpark(self, carpark_number: str) -> Tuple[int, Union[Dict, bytes]]:
+        snapshot = self.poller.snapshot
+        #cached apart from the menu's carpark_by_number results, which print the record alone
+        cached = self.result_cache.get(("carpark_response", carpark_number), snapshot.version,
+                                       lambda: carpark_response(snapshot.carpark_index, carpark_number))
+        if cached is None:
+            return 404, {"error": f"carpark {carpark_number} not found"}
+        return 200, cached.compact
+
+    def search_carparks(self, address: Optional[str]) -> Tuple[int, Union[Dict, bytes]]:
+        if not address:
+            return 400, {"error": "address query parameter is required"}
+        snapshot = self.poller.snapshot
+        cached = self.result_cache.carpark_by_address(snapshot.carpark_index, snapshot.version, normalize_address(address))
+        if cached is not None:
+            return 200, b'{"match":' + cached.compact + b',"suggestions":[]}'
+        suggestions = [{"address": match, "score": round(score, 1)} for match, score, _ in self.address_index.suggest(address, SUGGESTION_LIMIT)]
+        return 404, {"match": None, "suggestions": suggestions}
+
+    def search_restaurants(self, query: Dict[str, List[str]]) -> Tuple[int, Dict]:
+        try:
+            bounds = {name: float(query[name][0]) for name in ("min_rating", "max_rating", "min_votes") if name in query}
+            limit = int(query.get("limit", [RESTAURANT_SEARCH_LIMIT])[0])
+        except ValueError:
+            return 400, {"error": "min_rating, max_rating, min_votes and limit must be numbers"}
+        if limit < 0:
+            return 400, {"error": "limit must be 0 or more"}
+        filters = {"city": query.get("city"), "country": query.get("country"), "cuisine": query.get("cuisine"), **bounds}
+        matches = self.restaurant_query_index.query(**filters)
+        return 200, {"count": len(matches), "restaurants": self.restaurant_query_index.records(limit=limit, **filters)}
+
+    def restaurant_events(self, month: Optional[str]) -> Tuple[int, Dict]:
+        if not month or not re.match(MM_YYYY_PATTERN, month):
+            return 400, {"error": "month query parameter must be mm_yyyy, e.g. 04_2019"}
+        if month not in self._events_by_month:
+            positions = query_event_date_index(self.event_date_index, *month_bounds(month))
+            events = self.events_table_df.iloc[positions].to_dict('records')
+            self._events_by_month[month] = {"month": month, "count": len(events), "events": events}
+        return 200, self._events_by_month[month]
+
+    def health(self) -> Tuple[int, Dict]:
+        snapshot = self.poller.snapshot
+        return 200, {"snapshot_version": snapshot.version, "snapshot_age_seconds": round(snapshot.age_seconds, 1),
+                     "status": self.poller.status(), "result_cache": self.result_cache.stats(),
+                     "restaurant_query_cache": self.restaurant_query_index.stats()}
+
+    def route(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, Union[Dict, bytes]]:
+        """
+        Maps a request path and query string to a (status, body) pair.
+
+        Args:
+            path (str): URL path, e.g. /carparks/AM64.
+            query (Dict[str, List[str]]): Parsed query string.
+
+        Returns:
+            Tuple[int, Union[dict, bytes]]: HTTP status and JSON body, either a dict or already serialized bytes.
+        """
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        if parts == ["carparks", "search"]:
+            return self.search_carparks(query.get("address", [None])[0])
+        if len(parts) == 2 and parts[0] == "carparks":
+            return self.carpark(parts[1])
+        if parts == ["restaurants", "search"]:
+            return self.search_restaurants(query)
+        if parts == ["restaurants", "events"]:
+            return self.restaurant_events(query.get("month", [None])[0])
+        if parts == ["health"]:
+            return self.health()
+        return 404, {"error": f"no route for {path}"}
+
+def make_handler(service: QueryService):
+    """Builds a request handler class bound to a QueryService."""
+    class QueryHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so clients reuse connections
+        disable_nagle_algorithm = True  # headers and body are separate writes, don't let the body wait for an ack
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            try:
+                status, body = service.route(url.path, parse_qs(url.query))
+            except Exception as e:
+                status, body = 500, {"error": str(e)}
+            payload = body if isinstance(body, bytes) else json.dumps(body, separators=(",", ":")).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+    return QueryHandler
+
+def make_server(service: QueryService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Creates the HTTP server. Each connection is handled on its own thread.
+
+    Args:
+        service (QueryService): The service answering the queries.
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 for any free port.
+
+    Returns:
+        ThreadingHTTPServer: The server, not yet serving.
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    return server
+
+def load_query_service(data_dir: str, refresh: bool = False, stream: bool = False,
+                       poll_interval: float = CARPARK_POLL_INTERVAL_SECONDS) -> QueryService:
+    """Loads both datasets once and builds the service over them."""
+    from carpark.get_carparks_data import get_carparks_data
+    from restaurant.restaurant_details import zomato_restaurant_countries_events_to_tables
+    carparks_data_merged_df = get_carparks_data(DATA_GOV_TRANSPORT_API_URL, CARPARK_STATIC_CSV_URL)
+    restaurants_df, events_df = zomato_restaurant_countries_events_to_tables(RESTAURANT_JSON_URL, data_dir, COUNTRY_CODE_FILENAME,
+                                                                             refresh=refresh, stream=stream, fields=RESTAURANT_FIELDS)
+    poller = CarparkAvailabilityPoller(carparks_data_merged_df, DATA_GOV_TRANSPORT_API_URL, poll_interval)
+    return QueryService(poller, restaurants_df, events_df)
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m server", description="HTTP query service for carpark and restaurant lookups.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to bind (default: {DEFAULT_PORT})")
+    parser.add_argument("--data-dir", default=DATA_FOLDER_DIR, help=f"data folder (default: {DATA_FOLDER_DIR})")
+    parser.add_argument("--refresh", action="store_true", help="ignore cached datasets and rebuild them from source")
+    parser.add_argument("--stream", action="store_true", help="parse the restaurant feed incrementally to bound peak memory")
+    parser.add_argument("--poll-interval", type=float, default=CARPARK_POLL_INTERVAL_SECONDS,
+                        help=f"seconds between carpark availability refreshes (default: {CARPARK_POLL_INTERVAL_SECONDS})")
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    service = load_query_service(args.data_dir, args.refresh, args.stream, args.poll_interval)
+    server = make_server(service, args.host, args.port)
+    service.poller.start()
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.poller.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
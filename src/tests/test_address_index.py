@@ -0,0 +1,50 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+from carpark.address_index import AddressIndex, address_ngrams
+from benchmarks.synthetic_data import make_addresses
+
+@pytest.fixture
+def addresses():
+    """Fixture with a few thousand distinct synthetic carpark addresses."""
+    return make_addresses(3_000, seed=3)
+
+def test_address_ngrams_keeps_short_tokens_whole():
+    """
+    Test that short tokens are kept whole and longer ones are split into trigrams.
+    """
+    assert address_ngrams("blk 40 bishan") == {"blk", "40", "bis", "ish", "sha", "han"}
+
+def test_suggestions_match_full_scan(addresses):
+    """
+    Test that the blocked index finds the same best score as scoring every address.
+    """
+    address_index = AddressIndex(addresses, max_candidates=200)
+    for query in ["bishan st 21", "blk 640a ang mo kio", "tampnies st 4", "woodlands dr 1 basement"]:
+        suggestions = address_index.suggest(query, limit=5)
+        full_scan = process.extract(query, addresses, scorer=fuzz.WRatio, processor=default_process, limit=5)
+        assert len(suggestions) == 5
+        assert suggestions[0][1] == pytest.approx(full_scan[0][1])
+        assert [score for _, score, _ in suggestions] == sorted((score for _, score, _ in suggestions), reverse=True)
+
+def test_batch_matches_single_queries(addresses):
+    """
+    Test that suggest_many returns the same suggestions as one suggest call per query.
+    """
+    address_index = AddressIndex(addresses)
+    queries = ["bishan", "clementi ave 3", "zzzz", "yishun ring rd 50 multi storey"]
+    assert address_index.suggest_many(queries) == [address_index.suggest(query) for query in queries]
+    assert address_index.suggest("zzzz") == []
+
+def test_duplicates_and_missing_addresses_are_dropped():
+    """
+    Test that repeated addresses (one row per lot type) are indexed once and missing values are skipped.
+    """
+    address_index = AddressIndex(["BLK 40 BISHAN ST 21", "BLK 40 BISHAN ST 21", None, "BLK 640 ANG MO KIO AVE 6"])
+    assert len(address_index) == 2
+    suggestions = address_index.suggest("blk 40 bishan", limit=5)
+    assert suggestions[0][0] == "BLK 40 BISHAN ST 21"
+    assert len(suggestions) == 2
@@ -0,0 +1,112 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import pandas as pd
+import requests_mock
+from carpark.availability_history import AvailabilityHistoryStore
+from carpark.availability_poller import CarparkAvailabilityPoller
+
+API_URL = "https://example.com/transport/carpark-availability"
+
+def snapshot(update_datetime, lots_c, lots_y):
+    return pd.DataFrame({
+        'carpark_number': ['AM64', 'AM64'], 'lot_type': ['C', 'Y'], 'update_datetime': [update_datetime] * 2,
+        'lots_available': [lots_c, lots_y], 'total_lots': ['100', '20'],
+    })
+
+@pytest.fixture
+def history_store(tmp_path):
+    """Fixture with a store holding C changes at 10:00, 10:30 and 11:15, and one Y value."""
+    history_store = AvailabilityHistoryStore(str(tmp_path / "history.sqlite"))
+    history_store.record_snapshot(snapshot('2024-02-14T10:00:00', '30', '5'))
+    history_store.record_snapshot(snapshot('2024-02-14T10:01:00', '30', '5'))
+    history_store.record_snapshot(snapshot('2024-02-14T10:30:00', '50', '5'))
+    history_store.record_snapshot(snapshot('2024-02-14T11:15:00', '80', '5'))
+    yield history_store
+    history_store.close()
+
+def test_only_changes_are_recorded(history_store, tmp_path):
+    """
+    Test that unchanged and stale rows are skipped, and that a reopened store continues from its last values.
+    """
+    assert history_store.row_count() == 4
+    assert history_store.record_snapshot(snapshot('2024-02-14T09:00:00', '1', '1')) == 0
+    history_store.close()
+
+    reopened = AvailabilityHistoryStore(str(tmp_path / "history.sqlite"))
+    assert reopened.record_snapshot(snapshot('2024-02-14T11:20:00', '80', '5')) == 0
+    assert reopened.record_snapshot(snapshot('2024-02-14T11:21:00', '80', '4')) == 1
+    reopened.close()
+
+def test_occupancy_window_includes_value_in_force_at_start(history_store):
+    """
+    Test that a window query starts from the last change before the window.
+    """
+    occupancy_df = history_store.occupancy('AM64', '2024-02-14T10:10:00', '2024-02-14T11:00:00', lot_type='C')
+    assert list(occupancy_df['update_datetime']) == [pd.Timestamp('2024-02-14T10:10:00'), pd.Timestamp('2024-02-14T10:30:00')]
+    assert list(occupancy_df['lots_available']) == [30, 50]
+    assert list(occupancy_df['occupancy']) == pytest.approx([0.7, 0.5])
+    assert history_store.occupancy('XX1', '2024-02-14T10:00:00', '2024-02-14T11:00:00').empty
+
+def test_hourly_and_daily_aggregates_are_time_weighted(history_store):
+    """
+    Test that bucket means weight each value by how long it was in force.
+    """
+    hourly_df = history_store.aggregate('AM64', '2024-02-14T10:00:00', '2024-02-14T12:00:00', 'h', lot_type='C')
+    assert list(hourly_df['mean_occupancy']) == pytest.approx([0.6, (0.5 * 15 + 0.2 * 45) / 60])
+    assert list(hourly_df['min_lots_available']) == [30, 50]
+    assert list(hourly_df['max_lots_available']) == [50, 80]
+
+    daily_df = history_store.aggregate('AM64', '2024-02-14T10:00:00', '2024-02-15T00:00:00', 'D')
+    assert list(daily_df['lot_type']) == ['C', 'Y']
+    assert daily_df['mean_occupancy'].iloc[1] == pytest.approx(0.75)
+
+    by_hour = history_store.occupancy_by_hour_of_day('AM64', '2024-02-14T10:00:00', '2024-02-14T12:00:00')
+    assert list(by_hour.index) == [10, 11]
+
+def test_poller_records_changes(tmp_path):
+    """
+    Test that the poller records the initial table and the changes found by each poll.
+    """
+    history_store = AvailabilityHistoryStore(str(tmp_path / "history.sqlite"))
+    carparks_data_merged_df = snapshot('2024-02-14T10:00:00', '30', '5')
+    poller = CarparkAvailabilityPoller(carparks_data_merged_df.assign(address='BLK 640 ANG MO KIO AVE 6', x_coord=1.0, y_coord=1.0,
+                                                                      type_of_parking_system='ELECTRONIC PARKING', short_term_parking='WHOLE DAY',
+                                                                      night_parking='YES', free_parking='NO'),
+                                       API_URL, history_store=history_store)
+    payload = {"items": [{"carpark_data": [{"carpark_info": [{"total_lots": "100", "lot_type": "C", "lots_available": "12"},
+                                                             {"total_lots": "20", "lot_type": "Y", "lots_available": "5"}],
+                                            "carpark_number": "AM64", "update_datetime": "2024-02-14T10:05:00"}]}]}
+    with requests_mock.Mocker() as m:
+        m.get(API_URL, json=payload)
+        poller.poll_once()
+
+    assert history_store.row_count() == 3
+    assert list(history_store.occupancy('AM64', '2024-02-14T10:00:00', '2024-02-14T11:00:00', 'C')['lots_available']) == [30, 12]
+    history_store.close()
+
+def test_timezone_aware_window_is_converted_to_singapore_time(history_store):
+    """
+    Test that a timezone-aware window matches the same instants as naive Singapore times.
+    """
+    naive_df = history_store.occupancy('AM64', '2024-02-14T10:10:00', '2024-02-14T11:00:00', lot_type='C')
+    aware_df = history_store.occupancy('AM64', pd.Timestamp('2024-02-14T02:10:00', tz='UTC'),
+                                       pd.Timestamp('2024-02-14T11:00:00+08:00'), lot_type='C')
+    assert aware_df.equals(naive_df)
+    hourly_df = history_store.aggregate('AM64', pd.Timestamp('2024-02-14T02:00:00', tz='UTC'), '2024-02-14T12:00:00', 'h', lot_type='C')
+    assert list(hourly_df['bucket']) == [pd.Timestamp('2024-02-14T10:00:00'), pd.Timestamp('2024-02-14T11:00:00')]
+
+def test_occupancy_by_hour_skips_hours_without_total_lots(tmp_path):
+    """
+    Test that hours where total_lots was missing are left out instead of averaging to NaN.
+    """
+    history_store = AvailabilityHistoryStore(str(tmp_path / "history.sqlite"))
+    missing_total = snapshot('2024-02-14T10:00:00', '30', '5').assign(total_lots=None)
+    history_store.record_snapshot(missing_total)
+    history_store.record_snapshot(snapshot('2024-02-14T11:00:00', '50', '5'))
+    by_hour = history_store.occupancy_by_hour_of_day('AM64', '2024-02-14T10:00:00', '2024-02-14T12:00:00')
+    history_store.close()
+
+    assert by_hour.to_dict() == pytest.approx({11: 0.5})
+    assert (by_hour * 100).round(0).astype(int).tolist() == [50]
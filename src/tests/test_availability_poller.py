@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import time
+import pytest
+import pandas as pd
+import requests_mock
+from carpark.availability_poller import CarparkAvailabilityPoller
+
+API_URL = "https://example.com/transport/carpark-availability"
+
+def availability_payload(update_datetime, lots_available):
+    return {"items": [{"carpark_data": [
+        {"carpark_info": [{"total_lots": "100", "lot_type": "C", "lots_available": lots_available}],
+         "carpark_number": "AM64", "update_datetime": update_datetime},
+    ]}]}
+
+@pytest.fixture
+def carparks_data_merged_df():
+    """Fixture with a single merged carpark row."""
+    return pd.DataFrame({
+        'carpark_number': ['AM64'], 'update_datetime': ['2024-02-14T10:00:00'], 'total_lots': ['100'],
+        'lot_type': ['C'], 'lots_available': ['30'], 'address': ['BLK 640 ANG MO KIO AVE 6'],
+        'x_coord': [29257.7], 'y_coord': [39000.2], 'type_of_parking_system': ['ELECTRONIC PARKING'],
+        'short_term_parking': ['WHOLE DAY'], 'night_parking': ['YES'], 'free_parking': ['NO'],
+    })
+
+def test_poll_publishes_new_snapshot_without_touching_old_one(carparks_data_merged_df):
+    """
+    Test that a poll swaps in a new snapshot and leaves the previous one unchanged (copy-on-write).
+    """
+    poller = CarparkAvailabilityPoller(carparks_data_merged_df, API_URL, poll_interval=60)
+    old_snapshot = poller.snapshot
+
+    with requests_mock.Mocker() as m:
+        m.get(API_URL, json=availability_payload("2024-02-14T10:01:00", "12"))
+        assert poller.poll_once() == {"AM64"}
+        assert poller.poll_once() == set()
+
+    new_snapshot = poller.snapshot
+    assert new_snapshot.version == old_snapshot.version + 1
+    assert new_snapshot.carpark_index["carpark_number"]["AM64"]["lots_available"] == {"C": "12"}
+    assert old_snapshot.carpark_index["carpark_number"]["AM64"]["lots_available"] == {"C": "30"}
+    assert old_snapshot.carparks_data_merged_df['lots_available'].iloc[0] == '30'
+
+def test_backoff_after_failures(carparks_data_merged_df):
+    """
+    Test that failed background polls back off exponentially up to max_backoff and show in the status.
+    """
+    poller = CarparkAvailabilityPoller(carparks_data_merged_df, API_URL, poll_interval=0.01, max_backoff=0.04)
+    with requests_mock.Mocker() as m:
+        m.get(API_URL, status_code=500)
+        poller.start()
+        while poller.consecutive_failures < 3:
+            time.sleep(0.005)
+        poller.stop()
+
+    assert poller.backoff_seconds() == 0.04
+    assert 0.8 * 0.04 <= poller.next_delay() <= 0.04
+    assert "failed poll" in poller.status()
+    assert poller.snapshot.version == 1
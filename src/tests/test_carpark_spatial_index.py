@@ -0,0 +1,70 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import math
+import random
+import pytest
+from carpark.carpark_index import build_carpark_index
+from carpark.carpark_spatial_index import CarparkSpatialIndex, matches_filters, address_location
+from benchmarks.synthetic_data import make_carparks_merged_df
+
+@pytest.fixture
+def carpark_index():
+    """Fixture with an index over a few hundred synthetic carparks spread over SVY21 coordinates."""
+    return build_carpark_index(make_carparks_merged_df(400, seed=5))
+
+def brute_force(carpark_index, x, y, **filters):
+    """Reference answer: distance to every carpark, filtered and sorted."""
+    results = []
+    for carpark_number, record in carpark_index["carpark_number"].items():
+        if matches_filters(record, **filters):
+            results.append((carpark_number, math.hypot(record["x_coord"] - x, record["y_coord"] - y)))
+    return sorted(results, key=lambda result: result[1])
+
+@pytest.mark.parametrize("filters", [{}, {"lot_type": "C"}, {"free_parking": True, "night_parking": True}])
+def test_nearest_matches_brute_force(carpark_index, filters):
+    """
+    Test that k-nearest queries with filters return the same carparks and distances as a full scan.
+    """
+    spatial_index = CarparkSpatialIndex(carpark_index, cell_size=1_000)
+    rng = random.Random(0)
+    for _ in range(20):
+        x, y = rng.uniform(0, 52_000), rng.uniform(23_000, 52_000)
+        results = spatial_index.nearest(x, y, carpark_index, k=5, **filters)
+        expected = brute_force(carpark_index, x, y, **filters)[:5]
+        assert [distance for _, _, distance in results] == pytest.approx([distance for _, distance in expected])
+        assert all(matches_filters(record, **filters) for _, record, _ in results)
+
+def test_within_radius_matches_brute_force(carpark_index):
+    """
+    Test that radius queries return exactly the carparks within the radius, nearest first.
+    """
+    spatial_index = CarparkSpatialIndex(carpark_index, cell_size=1_000)
+    x, y = 25_000.0, 37_000.0
+    results = spatial_index.within_radius(x, y, 4_000, carpark_index, lot_type="C")
+    expected = [result for result in brute_force(carpark_index, x, y, lot_type="C") if result[1] <= 4_000]
+    assert [carpark_number for carpark_number, _, _ in results] == [carpark_number for carpark_number, _ in expected]
+
+def test_point_outside_grid_and_large_k(carpark_index):
+    """
+    Test that a point far from every carpark still finds them, and k larger than the dataset returns all of them.
+    """
+    spatial_index = CarparkSpatialIndex(carpark_index)
+    assert len(spatial_index.nearest(-100_000, -100_000, carpark_index, k=1_000)) == len(spatial_index)
+
+def test_filters_read_current_availability(carpark_index):
+    """
+    Test that availability is read from the index records at query time, not when the spatial index was built.
+    """
+    spatial_index = CarparkSpatialIndex(carpark_index)
+    carpark_number, record, _ = spatial_index.nearest(25_000, 37_000, carpark_index, k=1, lot_type="C")[0]
+    carpark_index["carpark_number"][carpark_number] = {**record, "lots_available": {**record["lots_available"], "C": "0"}}
+    assert spatial_index.nearest(25_000, 37_000, carpark_index, k=1, lot_type="C")[0][0] != carpark_number
+
+def test_address_location(carpark_index):
+    """
+    Test that an address resolves to its carpark's coordinates, and unknown addresses to None.
+    """
+    record = next(iter(carpark_index["carpark_number"].values()))
+    assert address_location(carpark_index, record["address"].lower()) == (record["x_coord"], record["y_coord"])
+    assert address_location(carpark_index, "nowhere") is None
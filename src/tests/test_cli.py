@@ -0,0 +1,94 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import shutil
+import pytest
+import requests_mock
+from benchmarks.synthetic_data import make_zomato_feed, make_carpark_static_df, make_carpark_availability_payload
+from config import RESTAURANT_JSON_URL, COUNTRY_CODE_FILENAME, DATA_GOV_TRANSPORT_API_URL, CARPARK_STATIC_CSV_URL
+from cli import EXIT_FAILED, EXIT_OK, EXIT_USAGE, main, parse_commands
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Fixture with a data folder holding the country code file."""
+    shutil.copy(os.path.join(os.path.dirname(__file__), '../../data', COUNTRY_CODE_FILENAME), tmp_path)
+    return str(tmp_path)
+
+def test_parse_chained_commands():
+    """
+    Test that several commands with their own options are parsed from one argument list.
+    """
+    parsed = parse_commands(["--refresh", "export-details", "events", "--month", "04_2019", "--month", "05_2019",
+                             "analyze-ratings", "carpark", "lookup", "--number", "AM64"])
+    assert [args.command for args in parsed] == ["export-details", "events", "analyze-ratings", "carpark"]
+    assert parsed[0].refresh
+    assert parsed[1].month == ["04_2019", "05_2019"]
+    assert parsed[3].number == ["AM64"]
+
+def test_usage_errors_exit_2():
+    """
+    Test that invalid arguments exit with status 2.
+    """
+    assert main(["events", "--month", "13_2019"]) == EXIT_USAGE
+    assert main(["unknown-command"]) == EXIT_USAGE
+    assert main(["restaurants", "--limit", "-3"]) == EXIT_USAGE
+
+def test_commands_share_one_loaded_dataset(data_dir):
+    """
+    Test that chained restaurant commands run headless on a dataset downloaded once.
+    """
+    with requests_mock.Mocker() as m:
+        m.head(RESTAURANT_JSON_URL, headers={"ETag": '"v1"'})
+        feed = m.get(RESTAURANT_JSON_URL, json=make_zomato_feed(200, max_events=3))
+        status = main(["--data-dir", data_dir, "--refresh", "export-details", "events",
+                       "--month", "04_2018", "--from", "05_2018", "--to", "06_2018", "analyze-ratings"])
+
+    assert status == EXIT_OK
+    assert feed.call_count == 1
+    for file_name in ["restaurant_details.csv", "restaurant_events_04_2018.csv", "restaurant_events_05_2018.csv",
+                      "restaurant_events_06_2018.csv"]:
+        assert os.path.exists(os.path.join(data_dir, file_name))
+
+def test_restaurants_query(data_dir, capsys):
+    """
+    Test that the restaurants command prints the matching restaurants as JSON and fails when nothing matches.
+    """
+    with requests_mock.Mocker() as m:
+        m.head(RESTAURANT_JSON_URL, headers={"ETag": '"v1"'})
+        m.get(RESTAURANT_JSON_URL, json=make_zomato_feed(200, max_events=1))
+        assert main(["--data-dir", data_dir, "restaurants", "--country", "india", "--min-votes", "100", "--limit", "3"]) == EXIT_OK
+        out = capsys.readouterr().out
+        results = json.loads(out[out.index("[\n"):])
+        assert main(["--data-dir", data_dir, "restaurants", "--cuisine", "no such cuisine"]) == EXIT_FAILED
+
+    assert 0 < len(results) <= 3
+    assert all(result["country"] == "India" and result["user_rating_voted"] >= 100 for result in results)
+
+def test_failed_command_exits_1(data_dir):
+    """
+    Test that a failing command makes the invocation exit with status 1.
+    """
+    with requests_mock.Mocker() as m:
+        m.head(RESTAURANT_JSON_URL, status_code=404)
+        m.get(RESTAURANT_JSON_URL, status_code=404)
+        assert main(["--data-dir", data_dir, "export-details"]) == EXIT_FAILED
+
+def test_carpark_nearby(capsys):
+    """
+    Test that carpark nearby searches around a carpark's address and prints the nearest carparks as JSON.
+    """
+    static_df = make_carpark_static_df(50)
+    with requests_mock.Mocker() as m:
+        m.get(DATA_GOV_TRANSPORT_API_URL, json=make_carpark_availability_payload(static_df))
+        m.get(CARPARK_STATIC_CSV_URL, text=static_df.to_csv(index=False))
+        assert main(["carpark", "nearby", "--address", static_df["address"][0], "--k", "3"]) == EXIT_OK
+        out = capsys.readouterr().out
+        results = json.loads(out[out.index("[\n"):])
+        assert main(["carpark", "nearby", "--x", "-99999", "--y", "-99999", "--radius", "100"]) == EXIT_FAILED
+        assert main(["carpark", "nearby", "--x", "20000"]) == EXIT_FAILED
+
+    assert len(results) == 3
+    assert results[0]["carpark_number"] == static_df["car_park_no"][0]
+    assert results[0]["distance_m"] == 0
+    assert results[1]["distance_m"] <= results[2]["distance_m"]
@@ -0,0 +1,84 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import numpy as np
+import pandas as pd
+import requests_mock
+from utils.dataset_cache import fingerprint_source, load_cached_df, save_cached_df, load_file_to_df_cached
+
+@pytest.fixture
+def expanded_dataframe():
+    """Fixture resembling an exploded restaurant frame: nested events, mixed types and a duplicated index."""
+    return pd.DataFrame({
+        'id': ['1', '1', '2'],
+        'location.zipcode': ['560001', 560002, np.nan],
+        'user_rating.aggregate_rating': ['4.5', '4.5', '3.1'],
+        'zomato_events': [{"event": {"event_id": 1, "photos": [{"photo": {"url": "a"}}]}},
+                          {"event": {"event_id": 2, "photos": []}},
+                          np.nan],
+        'Country Code': [1, 1, 14],
+    }, index=[0, 0, 1])
+
+def test_cache_round_trip(expanded_dataframe, tmp_path):
+    """
+    Test that a cached frame is read back with nested values, types and index intact.
+    """
+    save_cached_df(expanded_dataframe, str(tmp_path), "restaurants", "fp-1")
+    cached_df, reason = load_cached_df(str(tmp_path), "restaurants", "fp-1")
+
+    assert reason == "hit"
+    assert list(cached_df.index) == [0, 0, 1]
+    assert cached_df['zomato_events'].iloc[0] == expanded_dataframe['zomato_events'].iloc[0]
+    assert pd.isna(cached_df['zomato_events'].iloc[2])
+    assert list(cached_df['location.zipcode'].iloc[:2]) == ['560001', 560002]
+    assert list(cached_df['Country Code']) == [1, 1, 14]
+
+def test_cache_miss_on_fingerprint_change(expanded_dataframe, tmp_path):
+    """
+    Test that the cache is invalidated when the source fingerprint changes.
+    """
+    assert load_cached_df(str(tmp_path), "restaurants", "fp-1") == (None, "no cache")
+    save_cached_df(expanded_dataframe, str(tmp_path), "restaurants", "fp-1")
+    cached_df, reason = load_cached_df(str(tmp_path), "restaurants", "fp-2")
+    assert cached_df is None
+    assert reason == "source changed"
+
+def test_fingerprint_source_url_and_file(tmp_path):
+    """
+    Test that URLs are fingerprinted by ETag, never by downloading them, and files by mtime/size.
+    """
+    url = "https://example.com/data.json"
+    with requests_mock.Mocker() as m:
+        m.head(url, headers={"ETag": '"abc"'})
+        assert fingerprint_source(url) == 'etag:"abc"'
+        m.head(url, headers={})
+        m.get(url, text="[]")
+        assert fingerprint_source(url) is None
+        assert [request.method for request in m.request_history] == ["HEAD", "HEAD"]
+
+    file_path = tmp_path / "data.json"
+    file_path.write_text("[]")
+    assert fingerprint_source(str(file_path)).startswith("mtime:")
+    assert fingerprint_source(str(tmp_path / "missing.json")) is None
+
+def test_load_file_to_df_cached_rebuilds_on_change(tmp_path, monkeypatch):
+    """
+    Test that a local file is parsed once, served from the Parquet copy after that, and re-parsed when it changes.
+    """
+    import utils.dataset_cache as dataset_cache
+    source = tmp_path / "Country-Code.csv"
+    source.write_text("Country Code,Country\n1,India\n14,Australia\n")
+    calls = []
+    monkeypatch.setattr(dataset_cache, "load_file_to_df", lambda path: calls.append(path) or pd.read_csv(path))
+
+    first_df = load_file_to_df_cached(str(source), str(tmp_path / "cache"), "country_codes")
+    second_df = load_file_to_df_cached(str(source), str(tmp_path / "cache"), "country_codes")
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first_df, second_df)
+
+    source.write_text("Country Code,Country\n1,India\n14,Australia\n30,Brazil\n")
+    os.utime(source, ns=(os.stat(source).st_mtime_ns + 10**9,) * 2)
+    third_df = load_file_to_df_cached(str(source), str(tmp_path / "cache"), "country_codes")
+    assert len(calls) == 2
+    assert list(third_df['Country']) == ['India', 'Australia', 'Brazil']
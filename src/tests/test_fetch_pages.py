@@ -0,0 +1,106 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import pytest
+import pandas as pd
+import requests
+from benchmarks.synthetic_data import make_zomato_feed
+from utils.http_client import fetch_json_pages
+from restaurant.restaurant_details import load_zomato_restaurant_pages, restaurant_page_urls, zomato_api_response_to_df
+
+N_PAGES = 12
+FEED = make_zomato_feed(N_PAGES * 20, restaurants_per_page=20)
+
+class LatencyStubHandler(BaseHTTPRequestHandler):
+    """Stub serving /page?page=N after `delay` seconds, recording the peak number of requests in flight per Host header."""
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    in_flight = Counter()
+    peak = Counter()
+    peak_total = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        host = self.headers["Host"].split(":")[0]
+        cls = LatencyStubHandler
+        with cls.lock:
+            cls.in_flight[host] += 1
+            cls.peak[host] = max(cls.peak[host], cls.in_flight[host])
+            cls.peak_total = max(cls.peak_total, sum(cls.in_flight.values()))
+        time.sleep(float(query.get("delay", 0)))
+        with cls.lock:
+            cls.in_flight[host] -= 1
+
+        page = int(query.get("page", -1))
+        body = json.dumps(FEED[page]).encode() if 0 <= page < len(FEED) else b""
+        self.send_response(200 if body else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture
+def stub_port():
+    """Fixture serving the latency stub on a free port, with the concurrency counters reset."""
+    LatencyStubHandler.in_flight.clear()
+    LatencyStubHandler.peak.clear()
+    LatencyStubHandler.peak_total = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LatencyStubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_port
+    server.shutdown()
+    server.server_close()
+
+def test_pages_are_fetched_concurrently(stub_port):
+    """
+    Test that 12 pages of 0.2s each take far less than the 2.4s a serial fetch would.
+    """
+    urls = restaurant_page_urls(f"http://127.0.0.1:{stub_port}/page?page={{page}}&delay=0.2", N_PAGES)
+    start = time.perf_counter()
+    positions = [position for position, _ in fetch_json_pages(urls, max_workers=6, per_host_limit=6)]
+    elapsed = time.perf_counter() - start
+
+    assert sorted(positions) == list(range(N_PAGES))
+    assert elapsed < 1.0
+    assert LatencyStubHandler.peak_total <= 6
+
+def test_per_host_limit(stub_port):
+    """
+    Test that each host gets at most per_host_limit requests in flight, while both hosts are fetched at once.
+    """
+    urls = [f"http://{host}:{stub_port}/page?page={page}&delay=0.1" for page in range(N_PAGES // 2) for host in ("127.0.0.1", "localhost")]
+    list(fetch_json_pages(urls, max_workers=8, per_host_limit=2))
+
+    assert LatencyStubHandler.peak["127.0.0.1"] == 2
+    assert LatencyStubHandler.peak["localhost"] == 2
+    assert LatencyStubHandler.peak_total > 2
+
+def test_pages_keep_feed_order_when_arriving_out_of_order(stub_port):
+    """
+    Test that pages arriving in reverse order still give the same DataFrame as normalizing the feed serially.
+    """
+    urls = [f"http://127.0.0.1:{stub_port}/page?page={page}&delay={(N_PAGES - page) * 0.02}" for page in range(N_PAGES)]
+    arrival = [position for position, _ in fetch_json_pages(urls, max_workers=N_PAGES, per_host_limit=N_PAGES)]
+    assert arrival != sorted(arrival)
+
+    restaurants_df = load_zomato_restaurant_pages(urls, max_workers=N_PAGES, per_host_limit=N_PAGES)
+    pd.testing.assert_frame_equal(restaurants_df, zomato_api_response_to_df(FEED))
+
+def test_failed_page_raises(stub_port):
+    """
+    Test that a missing page raises an HTTP error instead of silently dropping restaurants.
+    """
+    urls = [f"http://127.0.0.1:{stub_port}/page?page={page}" for page in (0, 1, 999)]
+    with pytest.raises(requests.exceptions.HTTPError):
+        load_zomato_restaurant_pages(urls)
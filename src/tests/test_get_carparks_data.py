@@ -0,0 +1,114 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import pytest
+import pandas as pd
+import requests_mock
+from carpark.get_carparks_data import get_carparks_data, refresh_carparks_availability, flatten_carpark_data, extract_carpark_info
+from utils.load_data_to_df import load_json_to_df
+from benchmarks.synthetic_data import make_carpark_static_df, make_carpark_availability_payload
+from carpark.carpark_index import build_carpark_index, update_carpark_index
+
+API_URL = "https://example.com/transport/carpark-availability"
+
+def availability_payload(am64_update, am64_lots):
+    return {"items": [{"carpark_data": [
+        {"carpark_info": [{"total_lots": "100", "lot_type": "C", "lots_available": am64_lots},
+                          {"total_lots": "20", "lot_type": "Y", "lots_available": "5"}],
+         "carpark_number": "AM64", "update_datetime": am64_update},
+        {"carpark_info": [{"total_lots": "50", "lot_type": "C", "lots_available": "10"}],
+         "carpark_number": "SB40", "update_datetime": "2024-02-14T10:00:00"},
+        {"carpark_info": [{"total_lots": "70", "lot_type": "C", "lots_available": "7"}],
+         "carpark_number": "NOSTATIC", "update_datetime": "2024-02-14T10:00:00"},
+    ]}]}
+
+@pytest.fixture
+def static_csv(tmp_path):
+    """Fixture writing a static carpark csv with padded values, like HDBCarparkInformation.csv."""
+    path = tmp_path / "HDBCarparkInformation.csv"
+    pd.DataFrame({
+        'car_park_no': ['AM64', 'SB40'],
+        'address': ['BLK 640 ANG MO KIO AVE 6 ', 'BLK 40 BISHAN ST 21'],
+        'x_coord': [29257.7, 30000.1],
+        'y_coord': [39000.2, 37000.5],
+        'type_of_parking_system': ['ELECTRONIC PARKING', 'COUPON PARKING'],
+        'short_term_parking': ['WHOLE DAY', 'NO'],
+        'night_parking': ['YES', 'NO'],
+        'free_parking': ['NO', 'NO'],
+    }).to_csv(path, index=False)
+    return str(path)
+
+def test_refresh_only_updates_changed_carparks(static_csv):
+    """
+    Test that a refresh updates availability in place for carparks whose update_datetime moved.
+    """
+    with requests_mock.Mocker() as m:
+        m.get(API_URL, json=availability_payload("2024-02-14T10:00:00", "30"))
+        carparks_data_merged_df = get_carparks_data(API_URL, static_csv)
+        carpark_index = build_carpark_index(carparks_data_merged_df)
+        static_before = carparks_data_merged_df[['address', 'x_coord']].copy()
+
+        m.get(API_URL, json=availability_payload("2024-02-14T10:01:00", "12"))
+        updated = refresh_carparks_availability(carparks_data_merged_df, API_URL)
+        update_carpark_index(carpark_index, carparks_data_merged_df, updated)
+
+        assert updated == {"AM64"}
+        am64 = carparks_data_merged_df[carparks_data_merged_df['carpark_number'] == 'AM64']
+        assert list(am64['lots_available']) == [12, 5]
+        assert set(am64['update_datetime']) == {pd.Timestamp("2024-02-14T10:01:00")}
+        pd.testing.assert_frame_equal(carparks_data_merged_df[['address', 'x_coord']], static_before)
+        assert carpark_index["carpark_number"]["AM64"]["lots_available"]["C"] == 12
+        assert carpark_index["address"]["BLK 640 ANG MO KIO AVE 6"] is carpark_index["carpark_number"]["AM64"]
+
+        assert refresh_carparks_availability(carparks_data_merged_df, API_URL) == set()
+
+def test_merged_table_is_typed(static_csv):
+    """
+    Test that the merged table gets compact dtypes, and that records built from it serialize to JSON.
+    """
+    with requests_mock.Mocker() as m:
+        m.get(API_URL, json=availability_payload("2024-02-14T10:00:00", "30"))
+        typed_df = get_carparks_data(API_URL, static_csv)
+        untyped_df = get_carparks_data(API_URL, static_csv, CARPARK_SCHEMA=None)
+
+    assert str(typed_df['lots_available'].dtype) == 'Int16'
+    assert isinstance(typed_df['lot_type'].dtype, pd.CategoricalDtype)
+    assert isinstance(typed_df['night_parking'].dtype, pd.CategoricalDtype)
+    assert typed_df['x_coord'].dtype == 'float32'
+    assert pd.api.types.is_datetime64_any_dtype(typed_df['update_datetime'])
+    assert 'carpark_info' not in typed_df.columns
+    assert typed_df.memory_usage(deep=True).sum() < untyped_df.memory_usage(deep=True).sum()
+
+    record = json.loads(json.dumps(build_carpark_index(typed_df)["carpark_number"]["AM64"]))
+    untyped_record = build_carpark_index(untyped_df)["carpark_number"]["AM64"]
+    assert record["update_time"] == untyped_record["update_time"] == "2024-02-14T10:00:00"
+    assert record["lots_available"] == {"C": 30, "Y": 5}
+    assert record["x_coord"] == untyped_record["x_coord"] == 29257.7
+    assert record["address"] == untyped_record["address"] == "BLK 640 ANG MO KIO AVE 6"
+
+def legacy_flatten_carpark_data(carpark_data):
+    #per-row pd.Series path previously used in load_carpark_availability_df
+    carpark_data_df = load_json_to_df(carpark_data).explode('carpark_info')
+    carpark_data_df[['total_lots', 'lot_type', 'lots_available']] = carpark_data_df['carpark_info'].apply(lambda carpark_info: pd.Series(extract_carpark_info(carpark_info)))
+    return carpark_data_df.drop(columns=['carpark_info'])
+
+def test_flatten_matches_per_row_expansion():
+    """
+    Test that the columnar flattening gives the same frame as exploding and expanding carpark_info per row.
+    """
+    carpark_data = make_carpark_availability_payload(make_carpark_static_df(300))["items"][0]["carpark_data"]
+    pd.testing.assert_frame_equal(flatten_carpark_data(carpark_data), legacy_flatten_carpark_data(carpark_data), check_dtype=False)
+
+def test_flatten_edge_cases():
+    """
+    Test that empty, missing and malformed carpark_info entries flatten like the per-row expansion.
+    """
+    carpark_data = [
+        {"carpark_info": [], "carpark_number": "EMPTY", "update_datetime": "2024-02-14T10:00:00"},
+        {"carpark_info": [{"total_lots": "10", "lot_type": "C"}, "bad"], "carpark_number": "PARTIAL", "update_datetime": "2024-02-14T10:00:00"},
+        {"carpark_info": [{"total_lots": "7", "lot_type": "H", "lots_available": "2"}], "carpark_number": "OK", "update_datetime": "2024-02-14T10:00:00"},
+    ]
+    flattened = flatten_carpark_data(carpark_data)
+    pd.testing.assert_frame_equal(flattened, legacy_flatten_carpark_data(carpark_data), check_dtype=False)
+    assert list(flattened.index) == [0, 1, 1, 2]
@@ -0,0 +1,101 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from utils.http_client import NOT_MODIFIED, fetch_json, fetch_url
+from utils.load_url_response import load_json_url_response
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Stub server: /data.json supports ETags, /flaky fails twice then succeeds, /slow never answers in time."""
+    protocol_version = "HTTP/1.1"
+    flaky_calls = 0
+    client_ports = set()
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        StubHandler.client_ports.add(self.client_address[1])
+        if self.path == "/data.json":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_body(304, headers={"ETag": '"v1"'})
+            else:
+                self.send_body(200, json.dumps({"key": "value"}).encode(), {"ETag": '"v1"', "Content-Type": "application/json"})
+        elif self.path == "/flaky":
+            StubHandler.flaky_calls += 1
+            if StubHandler.flaky_calls <= 2:
+                self.send_body(503)
+            else:
+                self.send_body(200, b"[1, 2]", {"Content-Type": "application/json"})
+        elif self.path == "/slow":
+            time.sleep(1)
+            self.send_body(200, b"[]")
+        else:
+            self.send_body(404)
+
+@pytest.fixture
+def stub_server():
+    """Fixture running the stub server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    StubHandler.flaky_calls = 0
+    StubHandler.client_ports = set()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def test_conditional_get_returns_not_modified(stub_server):
+    """
+    Test that a second conditional GET sends the stored ETag and gets the NOT_MODIFIED signal.
+    """
+    url = f"{stub_server}/data.json"
+    assert load_json_url_response(url) == {"key": "value"}
+    assert load_json_url_response(url, conditional=True) is NOT_MODIFIED
+    assert fetch_json(url) == {"key": "value"}
+
+def test_connections_are_reused(stub_server):
+    """
+    Test that repeated requests to the same host reuse one keep-alive connection.
+    """
+    for _ in range(5):
+        fetch_json(f"{stub_server}/data.json")
+    assert len(StubHandler.client_ports) == 1
+
+def test_retries_retryable_status(stub_server):
+    """
+    Test that 503 responses are retried until the server recovers.
+    """
+    assert fetch_json(f"{stub_server}/flaky", retries=2, backoff=0.01) == [1, 2]
+    assert StubHandler.flaky_calls == 3
+
+def test_gives_up_after_bounded_retries(stub_server):
+    """
+    Test that the last error response is returned once the retries are used up.
+    """
+    response = fetch_url(f"{stub_server}/flaky", retries=1, backoff=0.01)
+    assert response.status_code == 503
+    assert StubHandler.flaky_calls == 2
+
+def test_read_timeout(stub_server):
+    """
+    Test that a hung endpoint raises a timeout instead of blocking forever.
+    """
+    start = time.perf_counter()
+    with pytest.raises(requests.exceptions.Timeout):
+        fetch_url(f"{stub_server}/slow", timeout=(1, 0.2), retries=0)
+    assert time.perf_counter() - start < 1
+    assert load_json_url_response("http://127.0.0.1:9/unreachable.json") is None
@@ -0,0 +1,49 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import pandas as pd
+from utils.merge_data import merge_data, lookup_join
+
+@pytest.fixture
+def restaurants_df():
+    """Fixture with restaurants on a duplicated index, one of them in an unknown country."""
+    return pd.DataFrame({
+        'id': ['1', '2', '3', '4'],
+        'location.country_id': [14, 1, 999, 14],
+        'Country': ['x', 'y', 'z', 'w'],
+    }, index=[5, 5, 6, 7])
+
+@pytest.fixture
+def countries_df():
+    """Fixture shaped like Country-Code.xlsx."""
+    return pd.DataFrame({'Country Code': [1, 14, 30], 'Country': ['India', 'Australia', 'Brazil']})
+
+def test_lookup_join_matches_inner_merge(restaurants_df, countries_df):
+    """
+    Test that the lookup join gives the same frame and logs as an inner merge, including overlapping column names.
+    """
+    expected_df, expected_logs = merge_data(restaurants_df, countries_df, "location.country_id", "Country Code", "inner")
+    joined_df, logs = lookup_join(restaurants_df, countries_df, "location.country_id", "Country Code")
+
+    pd.testing.assert_frame_equal(joined_df, expected_df)
+    assert logs == expected_logs
+    assert logs["unmatched_keys_in_df_left"] == {999}
+    assert logs["unmatched_keys_in_df_right"] == {30}
+    assert list(joined_df['Country_y']) == ['Australia', 'India', 'Australia']
+
+def test_lookup_join_duplicate_keys_fall_back_to_merge(restaurants_df, countries_df):
+    """
+    Test that a lookup table with repeated keys is joined like a merge, one row per match.
+    """
+    countries_df = pd.concat([countries_df, pd.DataFrame({'Country Code': [14], 'Country': ['Australia (2)']})], ignore_index=True)
+    joined_df, logs = lookup_join(restaurants_df, countries_df, "location.country_id", "Country Code")
+    assert logs["total_rows_after"] == 5
+    pd.testing.assert_frame_equal(joined_df, merge_data(restaurants_df, countries_df, "location.country_id", "Country Code", "inner")[0])
+
+def test_lookup_join_missing_key():
+    """
+    Test that a missing key column raises RuntimeError like merge_data.
+    """
+    with pytest.raises(RuntimeError):
+        lookup_join(pd.DataFrame({'a': [1]}), pd.DataFrame({'b': [1]}), 'missing', 'b')
@@ -1,11 +1,12 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../restaurant')))
+import subprocess
 import pytest
 import pandas as pd
 from typing import List
 import matplotlib as plt
-from restaurant_analysis import rating_text_thresholds_analyser 
+from restaurant_analysis import rating_text_thresholds_analyser, compute_rating_text_thresholds, render_rating_report
 
 @pytest.fixture
 def sample_data():
@@ -39,6 +40,43 @@ def test_rating_text_thresholds_analyser(sample_data):
         assert isinstance(value, tuple)
         assert len(value) == 2
 
+def test_compute_rating_text_thresholds(sample_data):
+    """
+    Test the threshold values and stats of the pure computation, with unusable rows filtered out.
+    """
+    extra_rows = pd.DataFrame({
+        'user_rating.aggregate_rating': ['4.9', 'n/a', 3.0, 2.0],
+        'user_rating.rating_text': ['Not rated', 'Good', 'Good', 'Poor'],
+        'user_rating.votes': [10, 10, 0, None],
+    })
+    df = pd.concat([sample_data, extra_rows], ignore_index=True)
+    rating_bins, rating_text_stats = compute_rating_text_thresholds(df, ['Poor', 'Average', 'Good', 'Very Good', 'Excellent'], (0, 5))
+
+    assert rating_bins == {'Poor': (0, 2.5), 'Average': (2.5, 3.0), 'Good': (3.0, 4.0), 'Very Good': (4.0, 5.0), 'Excellent': (5.0, 5.0)}
+    assert list(rating_text_stats.index) == ['Poor', 'Average', 'Good', 'Very Good', 'Excellent']
+    assert rating_text_stats['count'].tolist() == [3, 2, 2, 2, 1]
+    assert rating_bins == rating_text_thresholds_analyser(df, ['Poor', 'Average', 'Good', 'Very Good', 'Excellent'], (0, 5))
+
+def test_compute_does_not_import_plotting():
+    """
+    Test that computing thresholds imports neither matplotlib nor seaborn.
+    """
+    src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    code = ("import sys, pandas as pd\n"
+            "from restaurant.restaurant_analysis import compute_rating_text_thresholds\n"
+            "df = pd.DataFrame({'user_rating.aggregate_rating': [1.0, 4.5], 'user_rating.rating_text': ['Poor', 'Excellent'], 'user_rating.votes': [3, 4]})\n"
+            "compute_rating_text_thresholds(df, ['Poor', 'Excellent'], (0, 5))\n"
+            "assert 'matplotlib' not in sys.modules and 'seaborn' not in sys.modules, 'plotting imported'\n")
+    subprocess.run([sys.executable, "-c", code], cwd=src_dir, check=True)
+
+def test_render_rating_report(sample_data, tmp_path):
+    """
+    Test that the report mode writes the plots to files without a display.
+    """
+    paths = render_rating_report(sample_data, ['Poor', 'Average', 'Good', 'Very Good', 'Excellent'], str(tmp_path / "report"))
+    assert len(paths) == 3
+    for path in paths:
+        assert os.path.getsize(path) > 0
 
 # Run the test
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import numpy as np
+import pandas as pd
+from restaurant.restaurant_events import (extract_dates_title_eventId, extract_events_columns, extract_restaurant_events_by_mm_yyyy,
+                                         extract_restaurant_events_by_months, month_bounds, month_range)
+from benchmarks.synthetic_data import make_synthetic_events
+
+@pytest.fixture
+def sample_events():
+    """Fixture with valid events, a missing end date, an invalid date and rows without events."""
+    return pd.Series([
+        {"event": {"event_id": 1, "title": "Happy Hour", "start_date": "2019-04-01", "end_date": "2019-04-30"}},
+        {"event": {"event_id": 2, "title": "Brunch", "start_date": "2019-03-20", "end_date": ""}},
+        np.nan,
+        {"event": {"event_id": 3, "start_date": "not a date", "end_date": "2019-05-02"}},
+        {"other": {}},
+    ], index=[0, 0, 1, 2, 3], dtype=object)
+
+def test_extract_events_columns_matches_per_row_extraction(sample_events):
+    """
+    Test that the columnar extraction gives the same values as the per-row extraction for valid events.
+    """
+    result = extract_events_columns(sample_events)
+    legacy = sample_events.apply(lambda event: pd.Series(extract_dates_title_eventId(event)))
+    legacy.columns = ['start_date', 'end_date', 'title', 'event_id']
+
+    assert list(result.index) == list(sample_events.index)
+    for col in ['start_date', 'end_date']:
+        expected = pd.to_datetime(legacy[col].iloc[:3], errors='coerce')
+        assert list(result[col].iloc[:3]) == list(expected)
+    assert list(result['title'].iloc[:2]) == ["Happy Hour", "Brunch"]
+    assert list(result['event_id'].iloc[:2]) == ["1", "2"]
+
+def test_extract_events_columns_invalid_and_missing(sample_events):
+    """
+    Test that invalid dates become NaT without dropping the rest of the event, and missing events are NaN.
+    """
+    result = extract_events_columns(sample_events)
+    assert pd.isna(result['start_date'].iloc[3])
+    assert result['end_date'].iloc[3] == pd.Timestamp(2019, 5, 2)
+    assert result['event_id'].iloc[3] == "3"
+    assert pd.isna(result['title'].iloc[3])
+    assert result.iloc[4].isna().all()
+
+def test_extract_restaurant_events_by_mm_yyyy(sample_events, tmp_path):
+    """
+    Test that only events starting or ending in the month are kept and saved to csv.
+    """
+    df = pd.DataFrame({
+        'id': ['10', '10', '11', '12', '13'],
+        'name': ['A', 'A', 'B', 'C', 'D'],
+        'zomato_events': sample_events.to_list(),
+    }, index=sample_events.index)
+    event_map = {"event_id": "event_id", "id": "restaurant_id", "title": "event_title"}
+
+    result = extract_restaurant_events_by_mm_yyyy("04_2019", df, str(tmp_path), event_map, "events.csv")
+
+    assert list(result['event_id']) == ["1"]
+    saved = pd.read_csv(tmp_path / "events.csv")
+    assert list(saved.columns) == ["event_id", "restaurant_id", "event_title"]
+
+def test_month_range():
+    """
+    Test that month ranges are inclusive and cross year boundaries.
+    """
+    assert month_range("11_2018", "02_2019") == ["11_2018", "12_2018", "01_2019", "02_2019"]
+
+def test_extract_restaurant_events_by_months_needs_month_placeholder(tmp_path):
+    """
+    Test that several months require a {mm_yyyy} filename instead of overwriting one file, while one month does not.
+    """
+    df = pd.DataFrame({'id': [str(i) for i in range(50)], 'name': 'R', 'zomato_events': make_synthetic_events(50, seed=1)})
+    event_map = {"event_id": "event_id", "id": "restaurant_id"}
+    with pytest.raises(ValueError):
+        extract_restaurant_events_by_months(["01_2018", "02_2018"], df, str(tmp_path), event_map, "restaurant_events.csv")
+    assert list(tmp_path.iterdir()) == []
+
+    extract_restaurant_events_by_months(["01_2018"], df, str(tmp_path), event_map, "restaurant_events.csv")
+    assert [path.name for path in tmp_path.iterdir()] == ["restaurant_events.csv"]
+
+def test_extract_restaurant_events_by_months_matches_per_month_filter(tmp_path):
+    """
+    Test that the single-pass multi-month extraction keeps the same rows as a per-month date filter.
+    """
+    zomato_events = make_synthetic_events(500, seed=3)
+    df = pd.DataFrame({'id': [str(i) for i in range(500)], 'name': 'R', 'zomato_events': zomato_events})
+    months = month_range("01_2018", "12_2018")
+    event_map = {"event_id": "event_id", "id": "restaurant_id", "start_date": "event_start_date"}
+
+    result = extract_restaurant_events_by_months(months, df, str(tmp_path), event_map, "events_{mm_yyyy}.csv")
+
+    events_df = extract_events_columns(zomato_events)
+    for mm_yyyy in months:
+        start_of_month, start_of_next_month = month_bounds(mm_yyyy)
+        in_month = ((events_df['start_date'] >= start_of_month) & (events_df['start_date'] < start_of_next_month)) | \
+                   ((events_df['end_date'] >= start_of_month) & (events_df['end_date'] < start_of_next_month))
+        assert list(result[mm_yyyy]['id']) == list(df.loc[in_month, 'id'])
+        assert (tmp_path / f"events_{mm_yyyy}.csv").exists()
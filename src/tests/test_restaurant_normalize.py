@@ -0,0 +1,59 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pandas as pd
+from benchmarks.synthetic_data import make_zomato_feed
+from restaurant.restaurant_details import normalize_restaurants, normalize_restaurants_parallel, project_restaurants, zomato_api_response_to_df
+from config import RESTAURANT_FIELDS
+
+def test_parallel_normalize_matches_serial():
+    """
+    Test that normalizing a feed on 2 worker processes gives the same frame as normalizing it in process, projected or not.
+    """
+    feed = make_zomato_feed(500)
+    pd.testing.assert_frame_equal(zomato_api_response_to_df(feed, workers=2), zomato_api_response_to_df(feed))
+    pd.testing.assert_frame_equal(zomato_api_response_to_df(feed, workers=2, fields=RESTAURANT_FIELDS),
+                                  zomato_api_response_to_df(feed, fields=RESTAURANT_FIELDS))
+
+def test_parallel_normalize_shards_with_different_keys():
+    """
+    Test that shards missing a nested key still give the serial column order, with NaN where the key is absent.
+    """
+    restaurants = [{"id": "1", "name": "a", "location": {"city": "x"}},
+                   {"id": "2", "name": "b", "location": {"city": "y", "zipcode": "123"}, "cuisines": "Thai"},
+                   {"id": "3", "name": "c", "location": {"city": "z"}}]
+    parallel_df = normalize_restaurants_parallel(restaurants, workers=2, shard_size=1)
+    pd.testing.assert_frame_equal(parallel_df, normalize_restaurants(restaurants))
+    assert parallel_df["location.zipcode"].isna().tolist() == [True, False, True]
+
+def test_projection_matches_full_normalize():
+    """
+    Test that projecting RESTAURANT_FIELDS gives the flattened values of those paths, typed, and no other columns.
+    """
+    feed = make_zomato_feed(200)
+    full_df = zomato_api_response_to_df(feed)
+    projected_df = zomato_api_response_to_df(feed, fields=RESTAURANT_FIELDS)
+
+    assert list(projected_df.columns) == list(RESTAURANT_FIELDS)
+    assert projected_df["user_rating.aggregate_rating"].dtype == "float64"
+    assert projected_df["user_rating.votes"].dtype == "Int64"
+    pd.testing.assert_series_equal(projected_df["user_rating.aggregate_rating"], full_df["user_rating.aggregate_rating"].astype(float))
+    pd.testing.assert_series_equal(projected_df["user_rating.votes"], full_df["user_rating.votes"].astype("Int64"))
+    pd.testing.assert_frame_equal(projected_df[["id", "name", "location.city", "cuisines", "user_rating.rating_text"]],
+                                  full_df[["id", "name", "location.city", "cuisines", "user_rating.rating_text"]])
+    assert projected_df["zomato_events"].isna().tolist() == full_df["zomato_events"].isna().tolist()
+    assert projected_df["zomato_events"].dropna().tolist() == full_df["zomato_events"].dropna().tolist()
+
+def test_projection_missing_paths():
+    """
+    Test that missing keys, non-dict parents and unparseable numbers give missing values instead of errors.
+    """
+    restaurants = [{"id": 1, "user_rating": {"votes": "12", "aggregate_rating": "4.2"}},
+                   {"id": "2", "user_rating": "not rated"},
+                   {"user_rating": {"votes": "n/a"}}]
+    projected_df = project_restaurants(restaurants, {"id": "str", "user_rating.votes": "Int64",
+                                                     "user_rating.aggregate_rating": "float64", "zomato_events": "object"})
+    assert projected_df["id"].tolist()[:2] == ["1", "2"] and pd.isna(projected_df["id"][2])
+    assert projected_df["user_rating.votes"].tolist() == [12, pd.NA, pd.NA]
+    assert projected_df["user_rating.aggregate_rating"].isna().tolist() == [False, True, True]
+    assert projected_df["zomato_events"].isna().all()
@@ -0,0 +1,94 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+import numpy as np
+import pytest
+import pandas as pd
+from benchmarks.synthetic_data import make_zomato_feed, CUISINES
+from config import RESTAURANT_FIELDS, RESTAURANT_DETAILS_MAP
+from restaurant.restaurant_details import zomato_api_response_to_df
+from restaurant.restaurant_query import RestaurantQueryIndex
+
+COUNTRIES = {1: "India", 14: "Australia", 30: "Brazil", 37: "Canada", 94: "Indonesia"}
+
+@pytest.fixture(scope="module")
+def restaurants_df():
+    """Fixture with 2000 synthetic restaurants, some of them in a country outside COUNTRIES and one without a rating."""
+    restaurants_df = zomato_api_response_to_df(make_zomato_feed(2000, max_events=0), fields=RESTAURANT_FIELDS)
+    restaurants_df['Country'] = restaurants_df['location.country_id'].map(COUNTRIES)
+    restaurants_df.loc[0, 'user_rating.aggregate_rating'] = np.nan
+    return restaurants_df
+
+@pytest.fixture(scope="module")
+def query_index(restaurants_df):
+    """Fixture with the query index over restaurants_df."""
+    return RestaurantQueryIndex(restaurants_df, RESTAURANT_DETAILS_MAP)
+
+def scan(restaurants_df, city=(), country=(), cuisine=(), min_rating=None, max_rating=None, min_votes=None):
+    #reference answer from boolean masks over the whole frame
+    mask = pd.Series(True, index=restaurants_df.index)
+    if city:
+        mask &= restaurants_df['location.city'].str.lower().isin([c.lower() for c in city])
+    if country:
+        mask &= restaurants_df['Country'].str.lower().isin([c.lower() for c in country])
+    for needle in cuisine:
+        mask &= restaurants_df['cuisines'].str.split(', ').map(lambda cuisines: any(needle.lower() in c.lower() for c in cuisines))
+    ratings = restaurants_df['user_rating.aggregate_rating']
+    if min_rating is not None:
+        mask &= ratings >= min_rating
+    if max_rating is not None:
+        mask &= ratings <= max_rating
+    if min_votes is not None:
+        mask &= restaurants_df['user_rating.votes'] >= min_votes
+    return set(np.flatnonzero(mask.fillna(False).to_numpy()))
+
+def test_queries_match_scan(restaurants_df, query_index):
+    """
+    Test that random combinations of filters return the same restaurants as a full scan, best rated first.
+    """
+    rng = random.Random(7)
+    for _ in range(200):
+        filters = {
+            "city": rng.sample(sorted(restaurants_df['location.city'].unique()), rng.randint(0, 2)),
+            "country": rng.sample(list(COUNTRIES.values()), rng.randint(0, 2)),
+            "cuisine": [cuisine.upper()[1:5] for cuisine in rng.sample(CUISINES, rng.randint(0, 2))],
+            "min_rating": rng.choice([None, 2.5, 4.0]),
+            "max_rating": rng.choice([None, 4.5]),
+            "min_votes": rng.choice([None, 100, 4000]),
+        }
+        positions = query_index.query(**filters)
+        assert set(positions.tolist()) == scan(restaurants_df, **filters), filters
+        ratings = restaurants_df['user_rating.aggregate_rating'].to_numpy()[positions]
+        assert (np.diff(ratings[~np.isnan(ratings)]) <= 0).all()
+
+def test_repeated_query_is_memoized(query_index):
+    """
+    Test that a repeated query, even spelled differently, is answered from the memo with the same read-only result.
+    """
+    first = query_index.query(country="India", cuisine=["pizza"], min_rating=4, min_votes=100)
+    hits = query_index.stats()["hits"]
+    second = query_index.query(country=[" INDIA "], cuisine="Pizza", min_rating=4.0, min_votes=100.0)
+    assert second is first
+    assert query_index.stats()["hits"] == hits + 1
+    assert not second.flags.writeable
+
+def test_records_and_unrated_last(restaurants_df, query_index):
+    """
+    Test that records carry the mapped column names, missing ratings as None, and unrated restaurants come last.
+    """
+    records = query_index.records(city=restaurants_df['location.city'][0])
+    assert records[-1]["restaurant_id"] == restaurants_df['id'][0]
+    assert records[-1]["user_aggregate_rating"] is None
+    assert set(records[0]) == {name for col, name in RESTAURANT_DETAILS_MAP.items() if col != 'zomato_events'}
+    assert len(query_index.records(limit=3)) == 3
+    assert len(query_index.query(city="Atlantis")) == 0
+
+def test_exploded_frame_counts_each_restaurant_once(restaurants_df):
+    """
+    Test that a frame with one row per event is indexed with one row per restaurant.
+    """
+    exploded_df = pd.concat([restaurants_df, restaurants_df.iloc[:10]]).sort_index(kind='stable')
+    query_index = RestaurantQueryIndex(exploded_df, RESTAURANT_DETAILS_MAP)
+    assert len(query_index) == len(restaurants_df)
+    assert len(query_index.query(country="india")) == len(scan(restaurants_df, country=["india"]))
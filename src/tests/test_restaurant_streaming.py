@@ -0,0 +1,38 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import io
+import json
+import tracemalloc
+import pytest
+import pandas as pd
+from benchmarks.synthetic_data import make_zomato_feed
+from restaurant.restaurant_details import zomato_api_response_to_df, zomato_api_stream_to_df
+
+@pytest.fixture(scope="module")
+def feed_bytes():
+    """Fixture with a synthetic feed of 1000 restaurants serialized as JSON."""
+    return json.dumps(make_zomato_feed(1000)).encode()
+
+def test_stream_matches_eager(feed_bytes):
+    """
+    Test that chunked streaming ingestion produces the same frame as the eager path.
+    """
+    eager_df = zomato_api_response_to_df(json.loads(feed_bytes))
+    stream_df = zomato_api_stream_to_df(io.BytesIO(feed_bytes), chunk_size=128)
+    pd.testing.assert_frame_equal(stream_df[eager_df.columns], eager_df)
+
+def test_stream_lowers_peak_memory(feed_bytes):
+    """
+    Test that the peak traced memory of streaming ingestion is well below the eager path.
+    """
+    def peak_memory(func):
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    eager_peak = peak_memory(lambda: zomato_api_response_to_df(json.loads(io.BytesIO(feed_bytes).read())))
+    stream_peak = peak_memory(lambda: zomato_api_stream_to_df(io.BytesIO(feed_bytes), chunk_size=128))
+    assert stream_peak < 0.85 * eager_peak
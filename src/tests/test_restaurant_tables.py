@@ -0,0 +1,75 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import shutil
+import pytest
+import pandas as pd
+import requests_mock
+from benchmarks.synthetic_data import make_zomato_feed
+from config import RESTAURANT_JSON_URL, COUNTRY_CODE_FILENAME, RESTAURANT_DETAILS_MAP, RESTAURANTS_EVENT_MAP, RESTAURANT_FIELDS
+from restaurant.restaurant_details import (zomato_api_response_to_df, zomato_restaurant_countries_events_to_tables,
+                                           zomato_restaurant_details_to_csv)
+from restaurant.restaurant_events import build_events_table, build_restaurant_events_table, extract_restaurant_events_by_months
+
+@pytest.fixture(scope="module")
+def restaurant_tables():
+    """Fixture with 300 synthetic restaurants as the legacy exploded frame, and as a restaurants and an events table."""
+    restaurants_df = zomato_api_response_to_df(make_zomato_feed(300, max_events=4), fields=RESTAURANT_FIELDS)
+    restaurants_df['Country'] = 'Somewhere'
+    events_df = build_events_table(restaurants_df['zomato_events'], restaurants_df['id'])
+    return restaurants_df.explode('zomato_events'), restaurants_df.drop(columns='zomato_events'), events_df
+
+def test_build_events_table(restaurant_tables):
+    """
+    Test that events are indexed by their restaurant's row, typed, and that restaurants without events have no rows.
+    """
+    expanded_df, restaurants_df, events_df = restaurant_tables
+    has_events = expanded_df['zomato_events'].notna()
+    assert len(events_df) == has_events.sum()
+    assert list(events_df.index) == list(expanded_df.index[has_events])
+    assert list(events_df['restaurant_id']) == list(restaurants_df.loc[events_df.index, 'id'])
+    assert events_df['start_date'].dtype.kind == 'M'
+    assert all(isinstance(photos, list) for photos in events_df['photos'])
+
+def test_details_export_from_tables_matches_exploded_frame(restaurant_tables, tmp_path):
+    """
+    Test that the details export joined from the two tables is the same file as from the exploded frame.
+    """
+    expanded_df, restaurants_df, events_df = restaurant_tables
+    zomato_restaurant_details_to_csv(expanded_df, RESTAURANT_DETAILS_MAP, "expanded.csv", str(tmp_path), raise_errors=True)
+    zomato_restaurant_details_to_csv(restaurants_df, RESTAURANT_DETAILS_MAP, "tables.csv", str(tmp_path), raise_errors=True, events_df=events_df)
+    assert (tmp_path / "tables.csv").read_bytes() == (tmp_path / "expanded.csv").read_bytes()
+
+def test_month_events_from_tables_match_exploded_frame(restaurant_tables, tmp_path):
+    """
+    Test that monthly event files and the server's events table are the same from the two tables as from the exploded frame.
+    """
+    expanded_df, restaurants_df, events_df = restaurant_tables
+    months = ["03_2019", "04_2019"]
+    expanded_dfs = extract_restaurant_events_by_months(months, expanded_df, str(tmp_path), RESTAURANTS_EVENT_MAP, "expanded_{mm_yyyy}.csv", raise_errors=True)
+    table_dfs = extract_restaurant_events_by_months(months, restaurants_df, str(tmp_path), RESTAURANTS_EVENT_MAP, "tables_{mm_yyyy}.csv",
+                                                    raise_errors=True, events_df=events_df)
+    for mm_yyyy in months:
+        assert len(table_dfs[mm_yyyy]) == len(expanded_dfs[mm_yyyy]) > 0
+        assert (tmp_path / f"tables_{mm_yyyy}.csv").read_bytes() == (tmp_path / f"expanded_{mm_yyyy}.csv").read_bytes()
+
+    expanded_table_df, _ = build_restaurant_events_table(expanded_df.reset_index(drop=True))
+    table_df, _ = build_restaurant_events_table(restaurants_df, events_df)
+    pd.testing.assert_frame_equal(table_df, expanded_table_df.dropna(subset=['event_id']).reset_index(drop=True), check_dtype=False)
+
+def test_tables_cache_round_trip(tmp_path):
+    """
+    Test that a warm start gives back both tables, with the events still indexed by restaurant row.
+    """
+    shutil.copy(os.path.join(os.path.dirname(__file__), '../../data', COUNTRY_CODE_FILENAME), tmp_path)
+    with requests_mock.Mocker() as m:
+        m.head(RESTAURANT_JSON_URL, headers={"ETag": '"v1"'})
+        feed = m.get(RESTAURANT_JSON_URL, json=make_zomato_feed(100, max_events=3))
+        restaurants_df, events_df = zomato_restaurant_countries_events_to_tables(RESTAURANT_JSON_URL, str(tmp_path), COUNTRY_CODE_FILENAME,
+                                                                                 fields=RESTAURANT_FIELDS)
+        cached_restaurants_df, cached_events_df = zomato_restaurant_countries_events_to_tables(RESTAURANT_JSON_URL, str(tmp_path), COUNTRY_CODE_FILENAME,
+                                                                                               fields=RESTAURANT_FIELDS)
+    assert feed.call_count == 1
+    assert 'zomato_events' not in restaurants_df.columns
+    pd.testing.assert_frame_equal(cached_restaurants_df, restaurants_df)
+    pd.testing.assert_frame_equal(cached_events_df, events_df)
@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import pytest
+from benchmarks.synthetic_data import make_carparks_merged_df
+from carpark.carpark_index import build_carpark_index
+from carpark.result_cache import CarparkResultCache
+from carpark.search_carparks_data import search_carparks_data_from_cp_num, search_carparks_data_from_address
+
+@pytest.fixture
+def carparks_data_merged_df():
+    """Fixture with 50 synthetic carparks."""
+    return make_carparks_merged_df(50)
+
+def test_cached_search_matches_uncached(carparks_data_merged_df):
+    """
+    Test that cached lookups return the same pretty JSON as uncached ones, including for unknown queries.
+    """
+    carpark_index = build_carpark_index(carparks_data_merged_df)
+    result_cache = CarparkResultCache()
+    carpark_number = carparks_data_merged_df['carpark_number'].iloc[0]
+    address = carparks_data_merged_df['address'].iloc[0]
+    for _ in range(2):
+        for number in [carpark_number, "XX1"]:
+            assert search_carparks_data_from_cp_num(carparks_data_merged_df, number, carpark_index, result_cache, 1) == \
+                search_carparks_data_from_cp_num(carparks_data_merged_df, number, carpark_index)
+        for query in [address.lower(), "nowhere"]:
+            assert search_carparks_data_from_address(carparks_data_merged_df, query, carpark_index, result_cache, 1) == \
+                search_carparks_data_from_address(carparks_data_merged_df, query, carpark_index)
+
+    # found results are served from the cache the second time, unknown queries are never cached
+    assert result_cache.hits == 2
+    assert result_cache.misses == 6
+    assert len(result_cache) == 2
+
+def test_compact_bytes_match_record(carparks_data_merged_df):
+    """
+    Test that the compact form decodes to the same record as the pretty form.
+    """
+    carpark_index = build_carpark_index(carparks_data_merged_df)
+    carpark_number = carparks_data_merged_df['carpark_number'].iloc[0]
+    cached = CarparkResultCache().carpark_by_number(carpark_index, 1, carpark_number)
+    assert json.loads(cached.compact) == json.loads(cached.pretty) == carpark_index["carpark_number"][carpark_number]
+    assert len(cached.compact) < len(cached.pretty.encode())
+    assert b"\n" not in cached.compact and b'": ' not in cached.compact
+
+def test_new_snapshot_version_invalidates(carparks_data_merged_df):
+    """
+    Test that a newer snapshot version drops cached results, and a reader on an older snapshot does not repopulate them.
+    """
+    carpark_index = build_carpark_index(carparks_data_merged_df)
+    result_cache = CarparkResultCache()
+    builds = []
+    def build():
+        builds.append(1)
+        return {"lots_available": {"C": str(len(builds))}}
+
+    assert result_cache.get("AM64", 1, build).record == {"lots_available": {"C": "1"}}
+    assert result_cache.get("AM64", 1, build).record == {"lots_available": {"C": "1"}}
+    assert result_cache.get("AM64", 2, build).record == {"lots_available": {"C": "2"}}
+    assert result_cache.invalidations == 1
+
+    # a stale snapshot is answered but not cached over the newer version
+    assert result_cache.get("AM64", 1, build).record == {"lots_available": {"C": "3"}}
+    assert result_cache.get("AM64", 2, build).record == {"lots_available": {"C": "2"}}
+    assert result_cache.stats() == {"hits": 2, "misses": 3, "hit_rate": 0.4, "invalidations": 1, "size": 1, "version": 2}
+
+def test_lru_eviction():
+    """
+    Test that the least recently used result is evicted once maxsize is reached.
+    """
+    result_cache = CarparkResultCache(maxsize=2)
+    result_cache.get("a", 1, lambda: {"v": "a"})
+    result_cache.get("b", 1, lambda: {"v": "b"})
+    result_cache.get("a", 1, lambda: {"v": "a"})
+    result_cache.get("c", 1, lambda: {"v": "c"})
+    assert len(result_cache) == 2
+    assert result_cache.get("b", 1, lambda: {"v": "rebuilt"}).record == {"v": "rebuilt"}
+    assert result_cache.get("c", 1, lambda: {"v": "rebuilt"}).record == {"v": "c"}
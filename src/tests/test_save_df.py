@@ -0,0 +1,49 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import pandas as pd
+from utils.save_df import save_df
+
+@pytest.fixture
+def sample_dataframe():
+    """Fixture with text, float and date columns, including missing values."""
+    return pd.DataFrame({
+        'restaurant_id': ['1', '2', '3', '4', '5'],
+        'cuisines': ['Thai, Cafe', 'Pizza', None, 'Sushi', 'Bakery'],
+        'user_aggregate_rating': [4.5, 3.0, None, 2.2, 4.9],
+        'event_date': pd.to_datetime(['2019-04-01', None, '2019-05-02', '2018-01-01', None]),
+    })
+
+@pytest.mark.parametrize("file_name", ["out.csv", "out.csv.gz", "out.csv.bz2", "out.csv.xz"])
+def test_chunked_csv_matches_single_write(sample_dataframe, tmp_path, file_name):
+    """
+    Test that writing CSV in small chunks gives the same content as one to_csv call.
+    """
+    save_df(sample_dataframe, str(tmp_path / file_name), chunk_size=2)
+    sample_dataframe.to_csv(tmp_path / "expected.csv", index=False)
+    assert pd.read_csv(tmp_path / file_name).equals(pd.read_csv(tmp_path / "expected.csv"))
+    if file_name == "out.csv":
+        assert (tmp_path / file_name).read_text() == (tmp_path / "expected.csv").read_text()
+
+def test_parquet_round_trip(sample_dataframe, tmp_path):
+    """
+    Test that .parquet output keeps the column types.
+    """
+    save_df(sample_dataframe, str(tmp_path / "out.parquet"))
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "out.parquet"), sample_dataframe, check_dtype=False)
+    assert pd.api.types.is_datetime64_any_dtype(pd.read_parquet(tmp_path / "out.parquet")['event_date'])
+
+def test_unsupported_extension(sample_dataframe, tmp_path):
+    """
+    Test that a ValueError is raised for an unknown output format.
+    """
+    with pytest.raises(ValueError, match="Unsupported output file type"):
+        save_df(sample_dataframe, str(tmp_path / "out.json"))
+
+def test_empty_dataframe_writes_header(tmp_path):
+    """
+    Test that an empty DataFrame still writes its header.
+    """
+    save_df(pd.DataFrame(columns=['a', 'b']), str(tmp_path / "out.csv"))
+    assert (tmp_path / "out.csv").read_text().strip() == "a,b"
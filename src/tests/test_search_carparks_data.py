@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import json
+import pytest
+import pandas as pd
+from carpark.carpark_index import build_carpark_index, build_carpark_record
+from carpark.get_carparks_data import CARPARK_SCHEMA
+from utils.apply_schema import apply_schema
+from carpark.search_carparks_data import search_carparks_data_from_cp_num, search_carparks_data_from_address
+
+@pytest.fixture
+def carparks_data_merged_df():
+    """Fixture with one carpark holding two lot types and one carpark holding one."""
+    return pd.DataFrame({
+        'carpark_number': ['AM64', 'AM64', 'SB40'],
+        'update_datetime': ['2024-02-14T10:30:45', '2024-02-14T10:30:45', '2024-02-14T10:31:00'],
+        'total_lots': ['100', '20', '50'],
+        'lot_type': ['C', 'Y', 'C'],
+        'lots_available': ['30', '5', '0'],
+        'address': ['BLK 640 ANG MO KIO AVE 6', 'BLK 640 ANG MO KIO AVE 6', 'BLK 40 BISHAN ST 21'],
+        'x_coord': [29257.7, 29257.7, 30000.1],
+        'y_coord': [39000.2, 39000.2, 37000.5],
+        'type_of_parking_system': ['ELECTRONIC PARKING'] * 3,
+        'short_term_parking': ['WHOLE DAY'] * 3,
+        'night_parking': ['YES', 'YES', 'NO'],
+        'free_parking': ['NO'] * 3,
+    })
+
+def test_index_lookup_matches_scan(carparks_data_merged_df):
+    """
+    Test that index lookups return the same JSON as scanning the DataFrame.
+    """
+    carpark_index = build_carpark_index(carparks_data_merged_df)
+    for carpark_number in ['AM64', 'SB40', 'XX1']:
+        assert search_carparks_data_from_cp_num(carparks_data_merged_df, carpark_number, carpark_index) == \
+            search_carparks_data_from_cp_num(carparks_data_merged_df, carpark_number)
+
+    result = json.loads(search_carparks_data_from_cp_num(carparks_data_merged_df, 'AM64', carpark_index))
+    assert result['lot_types'] == ['C', 'Y']
+    assert result['total_lots'] == {'C': '100', 'Y': '20'}
+    assert result['lots_available'] == {'C': '30', 'Y': '5'}
+
+def test_index_address_lookup_is_normalized(carparks_data_merged_df):
+    """
+    Test that address lookups through the index ignore case and extra whitespace.
+    """
+    carpark_index = build_carpark_index(carparks_data_merged_df)
+    expected = search_carparks_data_from_address(carparks_data_merged_df, 'BLK 40 BISHAN ST 21')
+    assert search_carparks_data_from_address(carparks_data_merged_df, ' blk 40  bishan st 21', carpark_index) == expected
+    assert search_carparks_data_from_address(carparks_data_merged_df, 'nowhere', carpark_index) == "Address does not exist"
+
+def test_record_with_missing_lots_and_coordinates_is_json(carparks_data_merged_df):
+    """
+    Test that missing lot counts and coordinates of the typed table are encoded as null, not NA or NaN.
+    """
+    carparks_data_merged_df.loc[2, ['total_lots', 'lots_available', 'x_coord', 'y_coord']] = None
+    typed_df = apply_schema(carparks_data_merged_df, CARPARK_SCHEMA)
+    record = build_carpark_record(typed_df[typed_df['carpark_number'] == 'SB40'].to_dict('records'))
+
+    result = json.loads(json.dumps(record, allow_nan=False))
+    assert result['total_lots'] == {'C': None} and result['lots_available'] == {'C': None}
+    assert result['x_coord'] is None and result['y_coord'] is None
+    assert json.loads(search_carparks_data_from_cp_num(typed_df, 'SB40', build_carpark_index(typed_df))) == result
@@ -0,0 +1,147 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import http.client
+import json
+import threading
+import pytest
+from benchmarks.synthetic_data import make_carparks_merged_df, make_zomato_feed
+from carpark.availability_poller import CarparkAvailabilityPoller
+from restaurant.restaurant_details import zomato_api_response_to_df
+from restaurant.restaurant_events import build_events_table
+from config import RESTAURANT_FIELDS
+from server import QueryService, make_server
+
+API_URL = "https://example.com/transport/carpark-availability"
+
+@pytest.fixture(scope="module")
+def server():
+    """Fixture serving a synthetic QueryService on a free port. The poller is never started."""
+    carparks_data_merged_df = make_carparks_merged_df(200)
+    restaurants_df = zomato_api_response_to_df(make_zomato_feed(100), fields=RESTAURANT_FIELDS)
+    restaurants_df['Country'] = restaurants_df['location.country_id'].map({1: "India", 14: "Australia"})
+    events_df = build_events_table(restaurants_df['zomato_events'], restaurants_df['id'])
+    service = QueryService(CarparkAvailabilityPoller(carparks_data_merged_df, API_URL), restaurants_df.drop(columns='zomato_events'), events_df)
+    server = make_server(service, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, carparks_data_merged_df
+    server.shutdown()
+    server.server_close()
+
+def get(server, path):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    connection.request("GET", path)
+    response = connection.getresponse()
+    body = json.loads(response.read())
+    connection.close()
+    return response.status, body
+
+def test_carpark_by_number(server):
+    """
+    Test that a carpark is returned by number and an unknown number is a 404.
+    """
+    server, carparks_data_merged_df = server
+    carpark_number = carparks_data_merged_df['carpark_number'].iloc[0]
+    status, body = get(server, f"/carparks/{carpark_number}")
+    assert status == 200
+    assert body["carpark_number"] == carpark_number
+    assert body["address"] == carparks_data_merged_df['address'].iloc[0]
+
+    status, body = get(server, "/carparks/NOPE")
+    assert status == 404
+
+def test_carpark_search(server):
+    """
+    Test that an exact address matches, and a partial one returns suggestions instead.
+    """
+    server, carparks_data_merged_df = server
+    address = carparks_data_merged_df['address'].iloc[0]
+    status, body = get(server, "/carparks/search?address=" + address.lower().replace(" ", "+"))
+    assert status == 200
+    assert body["match"]["address"] == address
+
+    status, body = get(server, "/carparks/search?address=" + address[:-3].replace(" ", "%20"))
+    assert status == 404
+    assert body["match"] is None
+    assert address in [suggestion["address"] for suggestion in body["suggestions"]]
+
+    status, _ = get(server, "/carparks/search")
+    assert status == 400
+
+def test_restaurant_events(server):
+    """
+    Test that month queries return events overlapping the month and reject malformed months.
+    """
+    server, _ = server
+    status, body = get(server, "/restaurants/events?month=04_2019")
+    assert status == 200
+    assert body["count"] == len(body["events"]) > 0
+    for event in body["events"]:
+        assert event["event_start_date"] <= "2019-04-30"
+        assert event["event_end_date"] is None or event["event_end_date"] >= "2019-04-01"
+
+    status, _ = get(server, "/restaurants/events?month=2019-04")
+    assert status == 400
+
+def test_restaurant_events_without_title_are_valid_json():
+    """
+    Test that an event missing its title is answered with a null title, not a bare NaN.
+    """
+    feed = make_zomato_feed(1)
+    feed[0]["restaurants"][0]["restaurant"]["zomato_events"] = [
+        {"event": {"event_id": 7, "start_date": "2019-04-10", "end_date": "2019-04-12", "photos": []}}]
+    restaurants_df = zomato_api_response_to_df(feed, fields=RESTAURANT_FIELDS)
+    restaurants_df['Country'] = "India"
+    events_df = build_events_table(restaurants_df['zomato_events'], restaurants_df['id'])
+    service = QueryService(CarparkAvailabilityPoller(make_carparks_merged_df(5), API_URL), restaurants_df.drop(columns='zomato_events'), events_df)
+    server = make_server(service, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+        connection.request("GET", "/restaurants/events?month=04_2019")
+        response = connection.getresponse()
+        body = json.loads(response.read(), parse_constant=lambda constant: pytest.fail(f"invalid JSON constant {constant}"))
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert response.status == 200
+    assert body["events"] == [{"event_id": "7", "restaurant_id": "1000", "restaurant_name": "Restaurant 1000", "event_title": None,
+                               "event_start_date": "2019-04-10", "event_end_date": "2019-04-12", "photo_urls": []}]
+
+def test_restaurant_search(server):
+    """
+    Test that restaurant searches combine filters, return the match count with the best rated first, and reject bad numbers.
+    """
+    server, _ = server
+    status, body = get(server, "/restaurants/search?country=india&min_rating=3&limit=2")
+    assert status == 200
+    assert body["count"] >= len(body["restaurants"]) == 2
+    assert all(restaurant["country"] == "India" for restaurant in body["restaurants"])
+    assert body["restaurants"][0]["user_aggregate_rating"] >= body["restaurants"][1]["user_aggregate_rating"] >= 3
+
+    status, body = get(server, "/restaurants/search?cuisine=no+such+cuisine")
+    assert status == 200 and body == {"count": 0, "restaurants": []}
+
+    status, _ = get(server, "/restaurants/search?min_votes=many")
+    assert status == 400
+    status, _ = get(server, "/restaurants/search?limit=-3")
+    assert status == 400
+
+def test_keep_alive_and_health(server):
+    """
+    Test that several requests reuse one connection and that /health reports the snapshot.
+    """
+    server, _ = server
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    for _ in range(3):
+        connection.request("GET", "/health")
+        response = connection.getresponse()
+        body = json.loads(response.read())
+        assert response.status == 200
+        assert body["snapshot_version"] == 1
+    connection.close()
+
+    status, _ = get(server, "/unknown")
+    assert status == 404
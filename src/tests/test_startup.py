@@ -0,0 +1,30 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from benchmarks.bench_startup import (HEAVY_MODULES, FIRST_PROMPT_BUDGET_SECONDS, FIRST_CARPARK_ANSWER_BUDGET_SECONDS,
+                                      import_profile, time_to_first_prompt, time_to_first_carpark_answer)
+
+def test_main_import_skips_heavy_modules():
+    """
+    Test that importing the interactive entry point loads none of the data or plotting libraries.
+    """
+    _, imported = import_profile("main")
+    assert [module for module in HEAVY_MODULES if module in imported] == []
+
+def test_cli_import_skips_heavy_modules():
+    """
+    Test that importing the batch cli loads none of the data or plotting libraries before a command runs.
+    """
+    _, imported = import_profile("cli")
+    assert [module for module in HEAVY_MODULES if module in imported] == []
+
+@pytest.mark.skipif(os.getenv("STARTUP_BUDGET_TESTS") != "1", reason="wall-clock budgets, set STARTUP_BUDGET_TESTS=1 to run")
+def test_startup_budget():
+    """
+    Test that the home menu and the first carpark answer (against a local stub of the APIs) are within budget.
+    """
+    first_prompt = min(time_to_first_prompt() for _ in range(2))
+    assert first_prompt < FIRST_PROMPT_BUDGET_SECONDS, f"first prompt after {first_prompt:.2f}s"
+    first_answer = time_to_first_carpark_answer(n_carparks=500)
+    assert first_answer < FIRST_CARPARK_ANSWER_BUDGET_SECONDS, f"first carpark answer after {first_answer:.2f}s"
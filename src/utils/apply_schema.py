@@ -0,0 +1,46 @@
+import pandas as pd
+from typing import Dict
+
+def cast_column(column: pd.Series, dtype: str) -> pd.Series:
+    """
+    Casts a column to a schema dtype, parsing text values where needed.
+
+    Values that cannot be parsed as numbers or datetimes become missing (NA / NaT) instead of raising.
+
+    Args:
+        column (pd.Series): The column to cast.
+        dtype (str): Target dtype, eg. "Int16", "float32", "category" or "datetime64[ns]".
+
+    Returns:
+        pd.Series: The cast column.
+    """
+    if dtype.startswith("datetime64"):
+        return pd.to_datetime(column, errors='coerce', format='ISO8601').astype(dtype)
+    if dtype.lower().startswith(("int", "uint", "float")):
+        return pd.to_numeric(column, errors='coerce').astype(dtype)
+    return column.astype(dtype)
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    Casts the columns of a DataFrame to the dtypes given by a schema. Columns missing from the DataFrame are skipped.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to cast.
+        schema (Dict[str, str]): Column name to target dtype, see cast_column.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the schema columns cast.
+    """
+    return df.assign(**{col: cast_column(df[col], dtype) for col, dtype in schema.items() if col in df.columns})
+
+def memory_usage_mb(df: pd.DataFrame) -> float:
+    """
+    Returns the memory used by a DataFrame in MB, including the contents of object columns.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to measure.
+
+    Returns:
+        float: memory_usage(deep=True) summed over the index and columns, in MB.
+    """
+    return df.memory_usage(deep=True).sum() / 1e6
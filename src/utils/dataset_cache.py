@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+import pandas as pd
+import requests
+from utils.http_client import FETCH_WORKERS, fetch_url
+from utils.load_data_to_df import load_file_to_df
+
+CACHE_SUBDIR = "cache"
+
+def file_sha256(file_path: str) -> str:
+    """
+    Computes the sha256 hex digest of a file's content.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def fingerprint_source(source: str) -> Optional[str]:
+    """
+    Builds a fingerprint that changes whenever the content behind a URL or file path changes.
+
+    For URLs a HEAD request is made and the ETag (or Last-Modified and Content-Length) is used.
+    If the server sends neither, there is no fingerprint: hashing the content would download the
+    whole feed once more on every miss. For local files the mtime and size are used.
+
+    Args:
+        source (str): URL or local file path.
+
+    Returns:
+        str or None: The fingerprint, or None if the source could not be reached or sends no validator.
+    """
+    try:
+        if source.startswith(("http://", "https://")):
+            response = fetch_url(source, method="HEAD")
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            if etag:
+                return f"etag:{etag}"
+            last_modified = response.headers.get("Last-Modified")
+            if last_modified:
+                return f"last-modified:{last_modified}:{response.headers.get('Content-Length')}"
+            print(f"Could not fingerprint {source}: no ETag or Last-Modified header")
+            return None
+        stat = os.stat(source)
+        return f"mtime:{stat.st_mtime_ns}:{stat.st_size}"
+    except (requests.exceptions.RequestException, OSError) as e:
+        print(f"Could not fingerprint {source}: {e}")
+        return None
+
+def fingerprint_sources(sources: List[str], max_workers: int = FETCH_WORKERS) -> Optional[str]:
+    """
+    Builds one fingerprint for several sources, eg. the pages of a paginated feed, checking them concurrently.
+
+    Args:
+        sources (List[str]): URLs or local file paths.
+        max_workers (int): Number of sources checked at a time.
+
+    Returns:
+        str or None: A hash of every source's fingerprint, or None if any source could not be reached.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fingerprints = list(executor.map(fingerprint_source, sources))
+    if any(fingerprint is None for fingerprint in fingerprints):
+        return None
+    return f"pages:{len(sources)}:{hashlib.sha256(json.dumps(list(zip(sources, fingerprints))).encode()).hexdigest()}"
+
+def _cache_paths(cache_dir: str, name: str) -> Tuple[str, str]:
+    return f"{cache_dir}/{name}.parquet", f"{cache_dir}/{name}.json"
+
+def _is_str_column(col: pd.Series) -> bool:
+    return col.dropna().map(type).eq(str).all()
+
+def save_cached_df(df: pd.DataFrame, cache_dir: str, name: str, fingerprint: str) -> None:
+    """
+    Saves a DataFrame to the Parquet cache together with a manifest holding its fingerprint.
+
+    Object columns holding anything other than strings (nested dicts/lists, mixed types) are
+    stored as JSON text so that Parquet can hold them, and are decoded again on load.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to cache.
+        cache_dir (str): Directory of the cache.
+        name (str): Name of the cached dataset.
+        fingerprint (str): Fingerprint of the sources the DataFrame was built from.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    parquet_path, manifest_path = _cache_paths(cache_dir, name)
+
+    to_save_df = df.copy(deep=False)
+    json_columns = []
+    for col in to_save_df.columns[to_save_df.dtypes == object]:
+        if not _is_str_column(to_save_df[col]):
+            json_columns.append(col)
+            to_save_df[col] = [None if not isinstance(val, (dict, list)) and pd.isna(val) else json.dumps(val)
+                               for val in to_save_df[col]]
+
+    to_save_df.to_parquet(parquet_path)
+    with open(manifest_path, "w") as f:
+        json.dump({"fingerprint": fingerprint, "json_columns": json_columns}, f)
+
+def load_cached_df(cache_dir: str, name: str, fingerprint: str) -> Tuple[Optional[pd.DataFrame], str]:
+    """
+    Loads a DataFrame from the Parquet cache if its fingerprint matches.
+
+    Args:
+        cache_dir (str): Directory of the cache.
+        name (str): Name of the cached dataset.
+        fingerprint (str): Fingerprint of the current sources.
+
+    Returns:
+        tuple: (The cached DataFrame or None on a miss, reason of the hit/miss)
+    """
+    parquet_path, manifest_path = _cache_paths(cache_dir, name)
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None, "no cache"
+    if manifest.get("fingerprint") != fingerprint:
+        return None, "source changed"
+    try:
+        df = pd.read_parquet(parquet_path)
+    except Exception as e:
+        return None, f"unreadable cache ({e})"
+    for col in manifest.get("json_columns", []):
+        df[col] = pd.Series([json.loads(val) if isinstance(val, str) else float("nan") for val in df[col]],
+                            index=df.index, dtype=object)
+    return df, "hit"
+
+def load_file_to_df_cached(file_path: str, cache_dir: str, name: str) -> pd.DataFrame:
+    """
+    Loads a local file through load_file_to_df, keeping a Parquet copy in the cache for later loads.
+
+    The copy is keyed by the file's mtime and size, so it is rebuilt as soon as the file is edited.
+    Meant for small reference tables stored in slow formats, eg. the Country-Code xlsx.
+
+    Args:
+        file_path (str): Path to the source file.
+        cache_dir (str): Directory of the cache.
+        name (str): Name of the cached dataset.
+
+    Returns:
+        pd.DataFrame: The file's content.
+    """
+    fingerprint = fingerprint_source(file_path)
+    if fingerprint:
+        cached_df, _ = load_cached_df(cache_dir, name, fingerprint)
+        if cached_df is not None:
+            return cached_df
+    df = load_file_to_df(file_path)
+    if fingerprint:
+        save_cached_df(df, cache_dir, name, fingerprint)
+    return df
@@ -1,5 +1,6 @@
 import pandas as pd
 from utils.extract_columns import extract_columns
+from utils.save_df import save_df
 from typing import Dict,Optional
 
 def extract_rename_save_csv(df:pd.DataFrame,dir:str,file_name:str,column_map:Optional[Dict]):
@@ -10,7 +11,8 @@ def extract_rename_save_csv(df:pd.DataFrame,dir:str,file_name:str,column_map:Opt
     Args:
         df (pd.DataFrame): The DataFrame to process.
         dir (str): The directory where the CSV file will be saved.
-        file_name (str): The name of the CSV file to save the DataFrame to.
+        file_name (str): The name of the file to save the DataFrame to. The extension picks the format
+                         (.csv, .csv.gz, .csv.bz2, .csv.xz or .parquet, see utils.save_df).
         column_map (Optional[Dict]): A dictionary mapping the current column names to the new names.
                                         If no mapping is provided, columns are not renamed.
 
@@ -24,9 +26,9 @@ def extract_rename_save_csv(df:pd.DataFrame,dir:str,file_name:str,column_map:Opt
     filtered_df = extract_columns(df,column_map.keys())
    # check if column renaming is needed
     if not column_map.values():
-        filtered_df.to_csv(f"{dir}/{file_name}", index=False) 
+        save_df(filtered_df, f"{dir}/{file_name}")
         print(f"Restaurant details saved to {file_name}")
     # rename and save 
     filtered_df = filtered_df.rename(columns=column_map)
-    filtered_df.to_csv(f"{dir}/{file_name}", index=False) 
+    save_df(filtered_df, f"{dir}/{file_name}")
     print(f"Restaurant details saved to {file_name}")
\ No newline at end of file
@@ -0,0 +1,194 @@
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.2
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+POOL_MAXSIZE = 16
+FETCH_WORKERS = 8
+PER_HOST_LIMIT = 4
+
+#returned instead of a body when a conditional GET is answered with 304
+NOT_MODIFIED = object()
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_validators: Dict[str, Dict[str, str]] = {}
+_validators_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """
+    Returns the process-wide requests Session, creating it on first use.
+
+    The session keeps connections alive in a pool per host and negotiates gzip/deflate compression.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip, deflate"})
+            _session = session
+        return _session
+
+def _retry_delay(attempt: int, backoff: float) -> float:
+    #exponential backoff with full jitter
+    return random.uniform(0, backoff * 2 ** attempt)
+
+def fetch_url(url: str, method: str = "GET", conditional: bool = False, stream: bool = False,
+              timeout: Tuple[float, float] = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES,
+              backoff: float = DEFAULT_BACKOFF) -> requests.Response:
+    """
+    Sends a request through the shared session with timeouts and bounded retries.
+
+    Connection errors, timeouts and retryable status codes (429/5xx) are retried up to `retries`
+    times with jittered exponential backoff. With `conditional`, the ETag/Last-Modified seen on the
+    last successful response for the URL are sent as If-None-Match/If-Modified-Since.
+
+    Args:
+        url (str): The URL to request.
+        method (str): HTTP method, e.g. "GET" or "HEAD".
+        conditional (bool): Whether to send the stored validators for the URL.
+        stream (bool): Whether to defer downloading the body (see requests' stream).
+        timeout (tuple): (connect, read) timeouts in seconds.
+        retries (int): Number of retries after the first attempt.
+        backoff (float): Base delay in seconds of the exponential backoff.
+
+    Returns:
+        requests.Response: The final response. Error statuses are not raised.
+
+    Raises:
+        requests.exceptions.RequestException: If the request still fails after all retries.
+    """
+    headers = {}
+    if conditional:
+        with _validators_lock:
+            validators = _validators.get(url, {})
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    session = get_session()
+    for attempt in range(retries + 1):
+        try:
+            response = session.request(method, url, headers=headers, timeout=timeout, stream=stream, allow_redirects=True)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == retries:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                break
+            response.close()
+        time.sleep(_retry_delay(attempt, backoff))
+
+    if method == "GET" and response.ok and response.status_code != 304:
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["last_modified"] = response.headers["Last-Modified"]
+        with _validators_lock:
+            _validators[url] = validators
+    return response
+
+def fetch_json(url: str, conditional: bool = False, **kwargs) -> Union[dict, list, object]:
+    """
+    Fetches and parses JSON from a URL through the shared client.
+
+    Args:
+        url (str): The URL of the JSON document.
+        conditional (bool): Whether to send a conditional GET (see fetch_url).
+        **kwargs: Passed on to fetch_url.
+
+    Returns:
+        dict or list, or NOT_MODIFIED if the server answered 304 to a conditional GET.
+
+    Raises:
+        requests.exceptions.RequestException: On connection errors or HTTP error statuses.
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    response = fetch_url(url, conditional=conditional, **kwargs)
+    if response.status_code == 304:
+        return NOT_MODIFIED
+    response.raise_for_status()
+    return response.json()
+
+def fetch_bytes(url: str, **kwargs) -> bytes:
+    """
+    Fetches the body of a URL through the shared client.
+
+    Args:
+        url (str): The URL to download.
+        **kwargs: Passed on to fetch_url.
+
+    Returns:
+        bytes: The (decompressed) response body.
+
+    Raises:
+        requests.exceptions.RequestException: On connection errors or HTTP error statuses.
+    """
+    response = fetch_url(url, **kwargs)
+    response.raise_for_status()
+    return response.content
+
+def fetch_json_pages(urls: List[str], max_workers: int = FETCH_WORKERS, per_host_limit: int = PER_HOST_LIMIT,
+                     **kwargs) -> Iterator[Tuple[int, Union[dict, list]]]:
+    """
+    Fetches many JSON documents concurrently, yielding each one as soon as it has arrived.
+
+    Downloads run on a pool of max_workers threads through the shared session. A URL is only submitted
+    while its host has fewer than per_host_limit requests in flight, so no worker sits blocked behind a busy
+    host. Hosts are served round-robin, and the URLs of a host in the given order.
+
+    Args:
+        urls (List[str]): URLs of the documents, eg. the pages of a paginated feed.
+        max_workers (int): Maximum number of requests in flight overall.
+        per_host_limit (int): Maximum number of requests in flight per host.
+        **kwargs: Passed on to fetch_json.
+
+    Yields:
+        Tuple[int, dict or list]: The position of the URL in `urls` and its parsed JSON, in completion order.
+
+    Raises:
+        requests.exceptions.RequestException: On the first page that fails after retries. Requests already in
+                                              flight are waited for, no new ones are started.
+    """
+    pending_by_host: Dict[str, deque] = {}
+    for position, url in enumerate(urls):
+        pending_by_host.setdefault(urlsplit(url).netloc, deque()).append((position, url))
+    in_flight = {}
+    active_by_host = Counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch-pages") as executor:
+        def submit_ready():
+            while len(in_flight) < max_workers:
+                ready = [host for host, pending in pending_by_host.items() if pending and active_by_host[host] < per_host_limit]
+                if not ready:
+                    return
+                for host in ready[:max_workers - len(in_flight)]:
+                    position, url = pending_by_host[host].popleft()
+                    in_flight[executor.submit(fetch_json, url, **kwargs)] = (position, host)
+                    active_by_host[host] += 1
+
+        submit_ready()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                position, host = in_flight.pop(future)
+                active_by_host[host] -= 1
+                yield position, future.result()
+            submit_ready()
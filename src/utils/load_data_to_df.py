@@ -1,8 +1,10 @@
 import pandas as pd
 from pandas import json_normalize
 from typing import Optional, Union
+import io
 import os
 import json
+from utils.http_client import fetch_bytes
 
 def load_file_to_df(file_path: str, separator: Optional[str] = None) -> pd.DataFrame:
     """
@@ -11,7 +13,7 @@ def load_file_to_df(file_path: str, separator: Optional[str] = None) -> pd.DataF
     pandas function to load the data into a DataFrame.
 
     Args:
-        file_path (str): Path to the file.
+        file_path (str): Path to the file, or an http(s) URL fetched through the shared http client.
         separator (str, optional): The separator for CSV or TSV files. If not provided, default (',' or '\t') is used.
 
     Returns:
@@ -23,18 +25,22 @@ def load_file_to_df(file_path: str, separator: Optional[str] = None) -> pd.DataF
     """
 
     #get file extension
-    file_extension = file_path.split('.')[-1].lower()
+    file_extension = file_path.split('?')[0].split('.')[-1].lower()
 
     # map file extension to respective pd loading func
     loaders = {
-        'csv': lambda: pd.read_csv(file_path, sep=separator or ','),
-        'xls': lambda: pd.read_excel(file_path),
-        'xlsx': lambda: pd.read_excel(file_path),
-        'parquet': lambda: pd.read_parquet(file_path),
-        'tsv': lambda: pd.read_csv(file_path, sep=separator or '\t'),
+        'csv': lambda source: pd.read_csv(source, sep=separator or ','),
+        'xls': lambda source: pd.read_excel(source),
+        'xlsx': lambda source: pd.read_excel(source),
+        'parquet': lambda source: pd.read_parquet(source),
+        'tsv': lambda source: pd.read_csv(source, sep=separator or '\t'),
     }
     try:
-        return loaders[file_extension]() 
+        loader = loaders[file_extension]
+        # download urls through the shared http client
+        if file_path.startswith(("http://", "https://")):
+            return loader(io.BytesIO(fetch_bytes(file_path)))
+        return loader(file_path)
     except FileNotFoundError as e:
         raise FileNotFoundError(f"File not found: {file_path}") from e
     except KeyError:
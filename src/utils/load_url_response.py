@@ -1,19 +1,28 @@
 import requests
 import json
+from utils.http_client import fetch_url, NOT_MODIFIED
 
-def load_json_url_response(url:str):
+def load_json_url_response(url:str, conditional:bool=False):
     """
     Loads JSON data from a given URL.
 
+    The request goes through the shared pooled client (utils.http_client), with connect/read
+    timeouts and bounded retries.
+
     Args:
         url (str): The URL of the JSON file.
+        conditional (bool): Send a conditional GET using the ETag/Last-Modified of the last response
+                            for this URL. If the server answers 304, NOT_MODIFIED is returned so the
+                            caller can skip re-parsing.
 
     Returns:
         dict or list or None: The parsed JSON data as a Python dictionary or list,
-                             or None if an error occurs.
+                             NOT_MODIFIED if unchanged since the last fetch, or None if an error occurs.
     """
     try:
-        response = requests.get(url)
+        response = fetch_url(url, conditional=conditional)
+        if response.status_code == 304:
+            return NOT_MODIFIED
         response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
         data = response.json()  # Parse the JSON response
         return data
@@ -26,4 +35,4 @@ def load_json_url_response(url:str):
         return None
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -49,3 +49,51 @@ def merge_data(df_left: pd.DataFrame, df_right: pd.DataFrame, left_key: str, rig
         return merged_df, logs_dict
     except Exception as e:
         raise RuntimeError(f"Merging failed: {str(e)}")
+
+def lookup_join(df_left: pd.DataFrame, df_right: pd.DataFrame, left_key: str, right_key: str) -> tuple[pd.DataFrame, dict]:
+    """
+    Inner-joins a small lookup table with unique keys onto a DataFrame, by position lookup instead of a merge.
+
+    Each left key is looked up once in an Index over the right keys and the matching right rows are taken
+    by position. The result and logs are the same as merge_data(..., "inner"): left row order, a fresh
+    RangeIndex, left columns then right columns. Unmatched keys are found with vectorized set operations.
+    Falls back to merge_data when the right keys are not unique.
+
+    Args:
+        df_left (pd.DataFrame): DataFrame to enrich, eg. restaurants.
+        df_right (pd.DataFrame): Lookup table, eg. country codes.
+        left_key (str): Column name in df_left to join on.
+        right_key (str): Column name in df_right holding the lookup keys.
+
+    Returns:
+        tuple: (Joined DataFrame, logs dictionary with the same keys as merge_data)
+
+    Raises:
+        RuntimeError: If the join fails, eg. a key column is missing.
+    """
+    try:
+        right_keys = pd.Index(df_right[right_key])
+        if not right_keys.is_unique:
+            return merge_data(df_left, df_right, left_key, right_key, "inner")
+
+        left_keys = df_left[left_key]
+        positions = right_keys.get_indexer(left_keys)
+        matched = positions >= 0
+        overlapping = df_left.columns.intersection(df_right.columns)
+        joined_df = pd.concat([
+            df_left[matched].reset_index(drop=True),
+            df_right.iloc[positions[matched]].reset_index(drop=True).rename(columns={col: f"{col}_y" for col in overlapping}),
+        ], axis=1)
+        if len(overlapping):
+            joined_df = joined_df.rename(columns={col: f"{col}_x" for col in overlapping})
+
+        unique_left_keys = pd.unique(left_keys)
+        logs_dict = {
+            "total_rows_before": len(df_left),
+            "total_rows_after": len(joined_df),
+            "unmatched_keys_in_df_left": set(unique_left_keys[right_keys.get_indexer(unique_left_keys) < 0].tolist()),
+            "unmatched_keys_in_df_right": set(right_keys[~right_keys.isin(unique_left_keys)].tolist()),
+        }
+        return joined_df, logs_dict
+    except Exception as e:
+        raise RuntimeError(f"Merging failed: {str(e)}")
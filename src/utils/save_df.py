@@ -0,0 +1,41 @@
+import bz2
+import gzip
+import lzma
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+#map compressed csv extension to the func opening a text handle for it
+CSV_OPENERS = {
+    '.csv': lambda path: open(path, 'w', newline=''),
+    '.csv.gz': lambda path: gzip.open(path, 'wt', newline=''),
+    '.csv.bz2': lambda path: bz2.open(path, 'wt', newline=''),
+    '.csv.xz': lambda path: lzma.open(path, 'wt', newline=''),
+}
+
+def save_df(df: pd.DataFrame, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+    Saves a DataFrame in the format given by the file extension.
+
+    CSV (plain, .gz, .bz2 or .xz) is written chunk_size rows at a time through one open handle, so the
+    formatted text of the whole frame is never held in memory. Parquet is written in one call.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to save. The index is not written.
+        file_path (str): Destination path, ending in .csv, .csv.gz, .csv.bz2, .csv.xz or .parquet.
+        chunk_size (int): Number of rows formatted per CSV write.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+    """
+    lower_path = file_path.lower()
+    if lower_path.endswith('.parquet'):
+        df.to_parquet(file_path, index=False)
+        return
+
+    opener = next((opener for extension, opener in CSV_OPENERS.items() if lower_path.endswith(extension)), None)
+    if opener is None:
+        raise ValueError(f"Unsupported output file type: {file_path}")
+    with opener(file_path) as f:
+        for start in range(0, max(len(df), 1), chunk_size):
+            df.iloc[start:start + chunk_size].to_csv(f, header=(start == 0), index=False)